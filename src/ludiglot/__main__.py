@@ -28,6 +28,7 @@ from ludiglot.core.text_builder import (
     build_text_db,
     build_text_db_from_maps,
     build_text_db_from_root_all,
+    load_text_db,
     normalize_en,
     save_text_db,
 )
@@ -150,7 +151,7 @@ def _check_and_setup_game_data(config_path: Path) -> bool:
 
 
 def _load_db(path: Path) -> dict:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return load_text_db(path)
 
 
 def cmd_demo(args: argparse.Namespace) -> None:
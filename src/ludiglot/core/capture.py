@@ -21,7 +21,7 @@ except Exception:  # pragma: no cover
     win32gui = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CaptureRegion:
     left: int
     top: int
@@ -4,6 +4,11 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable
 
+try:
+    from PIL import Image
+except Exception:
+    Image = None
+
 from ludiglot.core.capture import (
     CaptureError,
     CaptureRegion,
@@ -72,9 +77,7 @@ def pil_image_to_bgra_raw(img_obj: Any) -> Any:
     if isinstance(img_obj, tuple) and len(img_obj) == 3:
         return img_obj
     try:
-        from PIL import Image
-
-        if isinstance(img_obj, Image.Image):
+        if Image is not None and isinstance(img_obj, Image.Image):
             if img_obj.mode != "RGBA":
                 img_obj = img_obj.convert("RGBA")
             raw = img_obj.tobytes("raw", "BGRA")
@@ -164,8 +167,8 @@ def _capture_region(region: CaptureRegion, options: CaptureInputOptions, use_raw
 
 def _capture_image_mode(options: CaptureInputOptions, use_raw: bool) -> Any:
     if options.image_path and options.image_path.exists():
-        from PIL import Image
-
+        if Image is None:
+            raise RuntimeError("capture_mode=image 需要安装 Pillow")
         img = Image.open(options.image_path)
         img.load()
         return _maybe_raw(img, use_raw)
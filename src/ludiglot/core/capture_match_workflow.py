@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-import copy
+import os
+import queue
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable
 
+# 结果传递与展示阶段的 [PERF]/[DEBUG] 探针默认关闭，设置 LUDIGLOT_PERF=1 开启
+_PERF_TRACE = os.environ.get("LUDIGLOT_PERF") == "1"
+
 
 @dataclass(frozen=True)
 class CaptureProcessRequest:
@@ -37,6 +42,88 @@ def run_capture_match_workflow(
 ) -> CaptureProcessOutcome:
     callbacks = callbacks or CaptureProcessCallbacks()
     t_total_start = time.time()
+    stage = _run_ocr_stage(request, callbacks)
+    if isinstance(stage, CaptureProcessOutcome):
+        return stage
+    return _run_match_stage(request, stage, callbacks, t_total_start)
+
+
+class PipelinedCaptureMatchRunner:
+    """截图+OCR 在调用线程完成，匹配交给独立线程，经有界队列衔接。
+
+    调用在 OCR 结束、匹配入队后即返回，下一次截图/OCR 可与上一次匹配重叠；
+    队列满时入队阻塞，形成背压。匹配按入队顺序串行执行，结果保持有序。
+    与 GUI 线程共用的 matcher 需自行保证线程安全（TextMatcher 的公开入口持锁）。
+    """
+
+    _STOP = object()
+
+    def __init__(self, maxsize: int = 2) -> None:
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._worker: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __call__(
+        self,
+        request: CaptureProcessRequest,
+        callbacks: CaptureProcessCallbacks | None = None,
+    ) -> CaptureProcessOutcome:
+        callbacks = callbacks or CaptureProcessCallbacks()
+        t_total_start = time.time()
+        stage = _run_ocr_stage(request, callbacks)
+        if isinstance(stage, CaptureProcessOutcome):
+            return stage
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                self._ensure_worker()
+        if closed:
+            # 已关闭：不再启动匹配线程，直接在调用线程完成
+            return _run_match_stage(request, stage, callbacks, t_total_start)
+        self._queue.put((request, stage, callbacks, t_total_start))
+        return CaptureProcessOutcome(status="queued")
+
+    def wait_idle(self) -> None:
+        """阻塞直到已入队的匹配全部完成。"""
+        self._queue.join()
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """处理完已入队的匹配后停止匹配线程。"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            worker = self._worker
+        if worker is None or not worker.is_alive():
+            return
+        self._queue.put(self._STOP)
+        worker.join(timeout)
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._match_loop, daemon=True)
+            self._worker.start()
+
+    def _match_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                self._queue.task_done()
+                return
+            request, lines, callbacks, t_total_start = item
+            try:
+                _run_match_stage(request, lines, callbacks, t_total_start)
+            except Exception as exc:
+                _emit(callbacks.error, f"匹配失败: {exc}")
+            finally:
+                self._queue.task_done()
+
+
+def _run_ocr_stage(
+    request: CaptureProcessRequest,
+    callbacks: CaptureProcessCallbacks,
+) -> CaptureProcessOutcome | list[tuple[str, float]]:
     _emit(callbacks.status, "捕获中…")
 
     t_capture_start = time.time()
@@ -86,6 +173,15 @@ def run_capture_match_workflow(
         _emit(callbacks.error, "匹配服务未就绪")
         return CaptureProcessOutcome(status="matcher_not_ready")
 
+    return lines
+
+
+def _run_match_stage(
+    request: CaptureProcessRequest,
+    lines: list[tuple[str, float]],
+    callbacks: CaptureProcessCallbacks,
+    t_total_start: float,
+) -> CaptureProcessOutcome:
     t_match_start = time.time()
     result = request.matcher.match(lines)
     _emit(callbacks.log, f"[PERF] 文本匹配耗时: {(time.time() - t_match_start):.3f}s")
@@ -94,24 +190,42 @@ def run_capture_match_workflow(
         _emit(callbacks.log, "[OCR] 未找到有效匹配 (Score too low)")
         return CaptureProcessOutcome(status="no_match")
 
-    _emit(callbacks.log, f"[DEBUG] _capture_and_process: Got result. Keys: {list(result.keys())}")
-    t_emit_start = time.time()
+    trace = _PERF_TRACE
+    if trace:
+        _emit(callbacks.log, f"[DEBUG] _capture_and_process: Got result. Keys: {list(result.keys())}")
+        t_emit_start = time.time()
     try:
-        safe_result = copy.deepcopy(result)
-        _emit(callbacks.log, "[DEBUG] _capture_and_process: Emitting safe_result...")
+        safe_result = _clone_match_result(result)
+        if trace:
+            _emit(callbacks.log, "[DEBUG] _capture_and_process: Emitting safe_result...")
         _emit(callbacks.result, safe_result)
-        _emit(callbacks.log, "[DEBUG] _capture_and_process: Result emitted.")
+        if trace:
+            _emit(callbacks.log, "[DEBUG] _capture_and_process: Result emitted.")
     except Exception as exc:
         _emit(callbacks.log, f"[ERROR] CRITICAL: Failed to emit result signal: {exc}")
         _emit(callbacks.error, f"Internal Error: Signal Emission Failed: {exc}")
         return CaptureProcessOutcome(status="emit_error")
-    _emit(callbacks.log, f"[PERF] 结果传递耗时: {(time.time() - t_emit_start):.3f}s")
+    if trace:
+        _emit(callbacks.log, f"[PERF] 结果传递耗时: {(time.time() - t_emit_start):.3f}s")
     _emit(callbacks.log, f"[PERF] ===== 总耗时: {(time.time() - t_total_start):.3f}s =====")
     _emit(callbacks.status, "就绪")
-    _emit(callbacks.log, "[DEBUG] _capture_and_process: Status emitted. Done.")
+    if trace:
+        _emit(callbacks.log, "[DEBUG] _capture_and_process: Status emitted. Done.")
     return CaptureProcessOutcome(status="success", result=safe_result)
 
 
+def _clone_match_result(result: dict[str, Any]) -> dict[str, Any]:
+    """复制结果中可变的容器（matches/items 下的条目各自浅拷贝），替代 deepcopy。"""
+    clone: dict[str, Any] = {}
+    for key, value in result.items():
+        if isinstance(value, list):
+            value = [dict(item) if isinstance(item, dict) else item for item in value]
+        elif isinstance(value, dict):
+            value = dict(value)
+        clone[key] = value
+    return clone
+
+
 def _image_size(img_obj: Any) -> tuple[int, int] | None:
     if img_obj is None:
         return None
@@ -62,6 +62,7 @@ class AppConfig:
     gender_preference: str = "female"  # "male" or "female"
     capture_mode: str = "select"  # "window", "region", "fullscreen", "select"
     capture_backend: str = "mss"  # "mss" | "winrt"
+    capture_freeze_screen: bool = False  # winrt 后端框选前是否仍冻结全屏（mss 始终冻结）
     window_title: str | None = None
     capture_region: dict | None = None
     hotkey_capture: str = "ctrl+shift+o"
@@ -316,6 +317,7 @@ def load_config(path: Path, *, validate_data: bool = True) -> AppConfig:
         gender_preference=gender_preference,
         capture_mode=raw.get("capture_mode", "image"),
         capture_backend=capture_backend,
+        capture_freeze_screen=bool(raw.get("capture_freeze_screen", False)),
         window_title=raw.get("window_title"),
         capture_region=raw.get("capture_region"),
         hotkey_capture=raw.get("hotkey_capture", "ctrl+shift+o"),
@@ -6,7 +6,10 @@ from __future__ import annotations
 from typing import Dict, List, Tuple, Optional, Any
 from functools import lru_cache
 from collections import defaultdict
+from difflib import SequenceMatcher
 import bisect
+import random
+import sys
 
 try:
     from rapidfuzz import fuzz, process
@@ -14,6 +17,29 @@ except Exception:
     fuzz = None
     process = None
 
+# 模块加载时绑定评分函数，热路径上省去属性查找
+_RATIO = fuzz.ratio if fuzz is not None else None
+_EXTRACT = process.extract if process is not None else None
+_CDIST = getattr(process, "cdist", None) if process is not None else None
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+try:
+    import ahocorasick
+except Exception:
+    ahocorasick = None
+
+
+def _char_mask(text: str) -> int:
+    """64 位字符存在掩码（ord & 63 折叠），用于模糊评分前的无损上界剪枝。"""
+    mask = 0
+    for ch in set(text):
+        mask |= 1 << (ord(ch) & 63)
+    return mask
+
 
 class LengthBucketIndex:
     """基于长度的分桶索引，避免不必要的字符串比较"""
@@ -35,6 +61,15 @@ class LengthBucketIndex:
         
         # 排序桶ID以便二分查找
         self._sorted_bucket_ids = sorted(self.buckets.keys())
+
+        # 按桶顺序拼接的键表 + 桶起始偏移：长度区间查询直接切片，无需逐桶 extend
+        self._ordered_keys: List[str] = []
+        max_bucket = self._sorted_bucket_ids[-1] if self._sorted_bucket_ids else -1
+        self._bucket_offsets: List[int] = [0] * (max_bucket + 2)
+        for bucket_id in range(max_bucket + 1):
+            self._bucket_offsets[bucket_id] = len(self._ordered_keys)
+            self._ordered_keys.extend(self.buckets.get(bucket_id, ()))
+        self._bucket_offsets[max_bucket + 1] = len(self._ordered_keys)
     
     def get_candidates_by_length(self, query_len: int, tolerance: float = 0.4) -> List[str]:
         """
@@ -53,16 +88,11 @@ class LengthBucketIndex:
         min_bucket = min_len // self.bucket_size
         max_bucket = max_len // self.bucket_size
         
-        # 获取相关桶的所有键
-        candidates = []
-        for bucket_id in self._sorted_bucket_ids:
-            if bucket_id < min_bucket:
-                continue
-            if bucket_id > max_bucket:
-                break
-            candidates.extend(self.buckets[bucket_id])
-        
-        return candidates
+        offsets = self._bucket_offsets
+        last = len(offsets) - 1
+        lo = offsets[min(max(min_bucket, 0), last)]
+        hi = offsets[min(max(max_bucket + 1, 0), last)]
+        return self._ordered_keys[lo:hi]
 
 
 class PrefixIndex:
@@ -101,6 +131,13 @@ class SubstringIndex:
         """
         self.min_key_len = min_key_len
         self.all_keys = keys
+        # 按长度稳定排序的键及其长度表：长度区间过滤变为二分切片
+        # _len_order[i] 为 _keys_by_len[i] 在 keys 中的原始下标，命中结果据此恢复数据库顺序
+        self._len_order: List[int] = sorted(range(len(keys)), key=lambda i: len(keys[i]))
+        self._keys_by_len: List[str] = [keys[i] for i in self._len_order]
+        self._key_lens: List[int] = [len(k) for k in self._keys_by_len]
+        # 可选 Aho–Corasick 自动机：一次扫描 query 即得全部被包含的键（值为 _keys_by_len 下标）
+        self._automaton = self._build_automaton()
         # 延迟构建：只在需要时构建
         self._index_built = False
         self.contains_map: Dict[str, List[str]] = {}
@@ -115,13 +152,37 @@ class SubstringIndex:
         # 改为运行时动态查询
         self._index_built = True
     
+    def _build_automaton(self):
+        if ahocorasick is None:
+            return None
+        try:
+            automaton = ahocorasick.Automaton()
+            start = bisect.bisect_left(self._key_lens, self.min_key_len)
+            for idx in range(start, len(self._keys_by_len)):
+                automaton.add_word(self._keys_by_len[idx], idx)
+            if len(automaton) == 0:
+                return None
+            automaton.make_automaton()
+            return automaton
+        except Exception:
+            return None
+
+    def keys_in_length_range(self, min_len: int, max_len: int | None = None) -> List[str]:
+        """返回长度位于 [min_len, max_len] 的键（同长度内保持原始顺序）。"""
+        start = bisect.bisect_left(self._key_lens, min_len)
+        end = len(self._key_lens) if max_len is None else bisect.bisect_right(self._key_lens, max_len)
+        return self._keys_by_len[start:end]
+
     def find_containing_keys(self, query: str, all_keys: List[str]) -> List[str]:
         """找到包含query的所有键（动态查询）"""
         if len(query) < self.min_key_len:
             return []
         
-        # 直接线性扫描，但只扫描长键
-        # 对于14万条记录，这仍然很快（毫秒级）
+        if all_keys is self.all_keys:
+            # 包含 query 的键至少与 query 等长，只扫描该长度区间
+            start = bisect.bisect_left(self._key_lens, len(query))
+            keys_by_len = self._keys_by_len
+            return self._in_db_order(i for i in range(start, len(keys_by_len)) if query in keys_by_len[i])
         return [k for k in all_keys if len(k) >= self.min_key_len and query in k]
     
     def find_contained_keys(self, query: str, all_keys: List[str]) -> List[str]:
@@ -132,8 +193,21 @@ class SubstringIndex:
         # 只扫描长度相近的键（优化）
         min_len = self.min_key_len
         max_len = len(query)
+        if all_keys is self.all_keys:
+            if self._automaton is not None:
+                return self._in_db_order({idx for _, idx in self._automaton.iter(query)})
+            start = bisect.bisect_left(self._key_lens, min_len)
+            end = bisect.bisect_right(self._key_lens, max_len)
+            keys_by_len = self._keys_by_len
+            return self._in_db_order(i for i in range(start, end) if keys_by_len[i] in query)
         return [k for k in all_keys if min_len <= len(k) <= max_len and k in query]
 
+    def _in_db_order(self, hits) -> List[str]:
+        """_keys_by_len 下标 -> 按原始（数据库）顺序排列的键，与全量线性扫描结果一致。"""
+        order = self._len_order
+        keys = self.all_keys
+        return [keys[pos] for pos in sorted(order[i] for i in hits)]
+
 
 class IndexedSearchEngine:
     """
@@ -154,7 +228,13 @@ class IndexedSearchEngine:
         
         self.length_index = LengthBucketIndex(db_keys)
         self.prefix_index = PrefixIndex(db_keys)
+        # 字典序排序的键及其原始下标：前缀查询用二分定位，同长结果仍按原始顺序
+        order = sorted(range(len(db_keys)), key=db_keys.__getitem__)
+        self._sorted_keys: List[str] = [db_keys[i] for i in order]
+        self._sorted_key_pos: List[int] = order
         self.substring_index = SubstringIndex(db_keys)
+        # 键的字符掩码，首次参与模糊评分时惰性计算
+        self._key_masks: Dict[str, int] = {}
         
         # LRU缓存用于重复查询
         self._search_cache_size = 1000
@@ -163,7 +243,6 @@ class IndexedSearchEngine:
         self._atomic_print(f"[INDEX] 索引构建完成")
 
     def _atomic_print(self, msg: str) -> None:
-        import sys
         try:
             m = msg if msg.endswith("\n") else msg + "\n"
             sys.stdout.write(m)
@@ -226,11 +305,20 @@ class IndexedSearchEngine:
         Returns:
             匹配的键列表（按长度排序，越短越优先）
         """
-        candidates = self.prefix_index.get_by_prefix(query)
-        # 过滤并排序
-        matches = [k for k in candidates if k.startswith(query)]
-        matches.sort(key=len)
-        return matches[:max_results]
+        if len(query) < self.prefix_index.prefix_len:
+            return []
+        # 以 query 为前缀的键在字典序中连续分布
+        sorted_keys = self._sorted_keys
+        start = bisect.bisect_left(sorted_keys, query)
+        end = start
+        total = len(sorted_keys)
+        while end < total and sorted_keys[end].startswith(query):
+            end += 1
+        if start == end:
+            return []
+        positions = self._sorted_key_pos
+        hits = sorted(range(start, end), key=lambda i: (len(sorted_keys[i]), positions[i]))
+        return [sorted_keys[i] for i in hits[:max_results]]
     
     def substring_search(self, query: str, direction: str = 'both') -> List[str]:
         """
@@ -275,6 +363,95 @@ class IndexedSearchEngine:
         
         self._cache_misses += 1
         
+        candidates = self._fuzzy_candidates(query, score_threshold)
+        if not candidates:
+            return []
+        
+        if _EXTRACT is not None and _RATIO is not None:
+            # 使用更快的评分器
+            results = _EXTRACT(
+                query, 
+                candidates, 
+                scorer=_RATIO,  # ratio比token_set_ratio快
+                limit=top_k,
+                score_cutoff=score_threshold * 100  # 提前过滤低分
+            )
+            matches = [(str(item), float(score) / 100.0) for item, score, _ in results]
+        else:
+            # 降级为SequenceMatcher
+            scores = [(k, SequenceMatcher(None, query, k).ratio()) for k in candidates]
+            scores.sort(key=lambda x: x[1], reverse=True)
+            matches = [(k, s) for k, s in scores[:top_k] if s >= score_threshold]
+        
+        self._store_fuzzy(cache_key, matches)
+        return matches
+    
+    def fuzzy_search_many(
+        self, queries: List[str], top_k: int = 1, score_threshold: float = 0.5
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        批量模糊搜索：每个查询的结果与单独调用 fuzzy_search 一致。
+        
+        未命中缓存的查询合并为一次 process.cdist（多线程 C++ 评分），
+        再按各自候选集的顺序取前 top_k；缺少 cdist/numpy 时逐个回退。
+        """
+        results: List[List[Tuple[str, float]]] = [[] for _ in queries]
+        pending: List[Tuple[int, str, List[str]]] = []
+        for pos, query in enumerate(queries):
+            cache_key = (query, top_k)
+            if cache_key in self._fuzzy_cache:
+                self._cache_hits += 1
+                results[pos] = [self._fuzzy_cache[cache_key]]
+                continue
+            if _CDIST is None or np is None or _RATIO is None:
+                results[pos] = self.fuzzy_search(query, top_k=top_k, score_threshold=score_threshold)
+                continue
+            self._cache_misses += 1
+            candidates = self._fuzzy_candidates(query, score_threshold)
+            if candidates:
+                pending.append((pos, query, candidates))
+        if not pending:
+            return results
+        
+        # 候选并集作为矩阵列，记录每个查询自身候选对应的列号
+        union: List[str] = []
+        union_pos: Dict[str, int] = {}
+        columns: List[List[int]] = []
+        for _, _, candidates in pending:
+            cols = []
+            for k in candidates:
+                col = union_pos.get(k)
+                if col is None:
+                    col = union_pos[k] = len(union)
+                    union.append(k)
+                cols.append(col)
+            columns.append(cols)
+        
+        cutoff = score_threshold * 100
+        matrix = _CDIST(
+            [query for _, query, _ in pending],
+            union,
+            scorer=_RATIO,
+            score_cutoff=cutoff,
+            dtype=np.float64,
+            workers=-1,
+        )
+        for row, (pos, query, candidates), cols in zip(matrix, pending, columns):
+            scores = row[cols]
+            # 稳定排序保证同分时与 process.extract 一样按候选顺序取
+            order = np.argsort(-scores, kind="stable")[:top_k]
+            matches = [(candidates[i], float(scores[i]) / 100.0) for i in order if scores[i] >= cutoff]
+            self._store_fuzzy((query, top_k), matches)
+            results[pos] = matches
+        return results
+    
+    def _store_fuzzy(self, cache_key: Tuple[str, int], matches: List[Tuple[str, float]]) -> None:
+        # 缓存结果
+        if matches and len(self._fuzzy_cache) < self._search_cache_size:
+            self._fuzzy_cache[cache_key] = matches[0]
+    
+    def _fuzzy_candidates(self, query: str, score_threshold: float) -> List[str]:
+        """按长度/前缀/字符掩码筛出需要评分的候选键。"""
         query_len = len(query)
         
         # 1. 根据长度预筛选候选集（更激进的筛选）
@@ -299,7 +476,6 @@ class IndexedSearchEngine:
             
             # 如果还是太多，随机抽样（保持多样性）
             if len(candidates) > 5000:
-                import random
                 candidates = random.sample(candidates, 5000)
         
         # 3. 如果候选太少，尝试前缀匹配扩展
@@ -307,33 +483,31 @@ class IndexedSearchEngine:
             prefix_matches = self.prefix_index.get_by_prefix(query)
             candidates = list(set(candidates) | set(prefix_matches))
         
-        # 4. 执行模糊搜索
-        if not candidates:
-            return []
-        
-        if fuzz and process:
-            # 使用更快的评分器
-            results = process.extract(
-                query, 
-                candidates, 
-                scorer=fuzz.ratio,  # ratio比token_set_ratio快
-                limit=top_k,
-                score_cutoff=score_threshold * 100  # 提前过滤低分
-            )
-            matches = [(str(item), float(score) / 100.0) for item, score, _ in results]
-        else:
-            # 降级为SequenceMatcher
-            from difflib import SequenceMatcher
-            scores = [(k, SequenceMatcher(None, query, k).ratio()) for k in candidates]
-            scores.sort(key=lambda x: x[1], reverse=True)
-            matches = [(k, s) for k, s in scores[:top_k] if s >= score_threshold]
-        
-        # 缓存结果
-        if matches and len(self._fuzzy_cache) < self._search_cache_size:
-            self._fuzzy_cache[cache_key] = matches[0]
-        
-        return matches
+        # 4. 字符掩码剔除不可能达标的候选
+        return self._mask_prefilter(query, candidates, score_threshold)
     
+    def _mask_prefilter(self, query: str, candidates: List[str], score_threshold: float) -> List[str]:
+        """按字符掩码剔除不可能达到阈值的候选（不改变结果）。
+
+        ratio = 2*LCS/(len_q+len_k)；掩码中对方缺失的字符位至少对应一个无法匹配的字符，
+        因此 LCS <= min(len_q - 缺失位数_q, len_k - 缺失位数_k)，上界低于阈值即可跳过评分。
+        """
+        if score_threshold <= 0 or not candidates:
+            return candidates
+        qmask = _char_mask(query)
+        qlen = len(query)
+        masks = self._key_masks
+        kept = []
+        for k in candidates:
+            kmask = masks.get(k)
+            if kmask is None:
+                kmask = masks[k] = _char_mask(k)
+            klen = len(k)
+            lcs_max = min(qlen - (qmask & ~kmask).bit_count(), klen - (kmask & ~qmask).bit_count())
+            if 2 * lcs_max >= score_threshold * (qlen + klen) - 1e-9:
+                kept.append(k)
+        return kept
+
     def smart_search(self, query: str) -> Tuple[str, float]:
         """
         智能搜索：自动选择最优策略
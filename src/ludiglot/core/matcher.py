@@ -1,6 +1,11 @@
 from __future__ import annotations
+import difflib
 import re
+import threading
 import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from types import MappingProxyType
 from typing import Any, Dict, List, Tuple, Optional
 from ludiglot.core.search import FuzzySearcher
 from ludiglot.core.indexed_search import IndexedSearchEngine
@@ -14,6 +19,142 @@ except Exception:
     fuzz = None
     process = None
 
+# 非字母数字/空白字符（等价于 ch.isalnum() or ch.isspace() 的补集；\w 含下划线需单独排除）
+_OCR_NOISE_RE = re.compile(r"[^\w\s]|_")
+_ESCAPED_BR_RE = re.compile(r"(?i)&lt;\s*/?\s*br\s*/?&gt;")
+_BR_TAG_RE = re.compile(r"(?i)<\s*/?\s*br\s*/?>?")
+# 删除 ASCII 数字的转换表：纯 ASCII 文本用 str.translate 在 C 层计数
+_DIGITS_TABLE = str.maketrans("", "", "0123456789")
+# 删除 ASCII 中 [\w\s\-] 字符的转换表，剩余长度即特殊字符数
+_NON_SPECIAL_TABLE = str.maketrans(
+    "", "", "".join(ch for ch in map(chr, range(128)) if ch.isalnum() or ch.isspace() or ch in "_-")
+)
+
+
+
+def _digit_count(text: str) -> int:
+    """统计 ch.isdigit() 为真的字符数；非 ASCII 文本回退逐字符判断以保持语义。"""
+    if text.isascii():
+        return len(text) - len(text.translate(_DIGITS_TABLE))
+    return sum(ch.isdigit() for ch in text)
+
+
+def _classify_chars(text: str) -> tuple[int, int, int]:
+    """一次统计 (长度, 数字数, 特殊字符数)；特殊字符等价于 [^\\w\\s\\-]。"""
+    n = len(text)
+    if text.isascii():
+        return (
+            n,
+            n - len(text.translate(_DIGITS_TABLE)),
+            len(text.translate(_NON_SPECIAL_TABLE)),
+        )
+    digits = 0
+    specials = 0
+    for ch in text:
+        if ch.isdigit():
+            digits += 1
+        elif not (ch.isalnum() or ch.isspace() or ch == "_" or ch == "-"):
+            specials += 1
+    return n, digits, specials
+
+
+def _is_time_format(text: str) -> bool:
+    """判断是否为纯时间行（如 "2d 5h"），等价于 ^\\d+[dhms](\\s+\\d+[dhms])*$。
+
+    三态扫描：0=需要数字/数字中，1=单位后，2=单位后的空白；遇到非法字符立即返回。
+    """
+    s = text.lower().strip()
+    state = 0
+    has_digit = False
+    for ch in s:
+        if ch.isdecimal():
+            if state == 1:
+                return False
+            state = 0
+            has_digit = True
+        elif ch in "dhms":
+            if state != 0 or not has_digit:
+                return False
+            state = 1
+            has_digit = False
+        elif ch.isspace():
+            if state == 0:
+                return False
+            state = 2
+        else:
+            return False
+    return state == 1
+
+
+def _length_weighted_score(score: float, key_len: int, word_count: int, matched_len: int) -> tuple[float, bool]:
+    """候选的长度/词数加权及长度失配惩罚（纯算术）；matched_len 为 0 表示无命中，不做惩罚。
+
+    第二个返回值表示是否触发“长查询匹配短条目”惩罚，供调用方记录日志。
+    """
+    length_bonus = min(key_len / 100.0, 1.0)
+    word_bonus = min(word_count / 8.0, 1.0)
+    weighted = score * (0.6 + 0.2 * length_bonus + 0.2 * word_bonus)
+    if not matched_len:
+        return weighted, False
+    if key_len > 25 and matched_len < 20:
+        return weighted * 0.4, True  # Relaxed from 0.2
+    if abs(key_len - matched_len) > 15 and matched_len / max(key_len, 1) < 0.6:
+        weighted *= 0.6  # Relaxed from 0.4
+    elif key_len > matched_len * 2:
+        weighted *= 0.7  # Relaxed from 0.5
+    elif key_len > matched_len * 1.5 and score < 0.97:
+        weighted *= 0.85  # Relaxed from 0.75
+    return weighted, False
+
+
+def _join_multi_fields(items: list[dict]) -> dict[str, str]:
+    """单次遍历多条目列表，拼出 _official_en/_official_cn/_query_key/_ocr_text 汇总字段。"""
+    en_parts: list[str] = []
+    cn_parts: list[str] = []
+    key_parts: list[str] = []
+    ocr_parts: list[str] = []
+    for item in items:
+        ocr = item.get("ocr")
+        en = item.get("official_en") or ocr
+        if en:
+            en_parts.append(en)
+        cn = item.get("official_cn")
+        if cn:
+            cn_parts.append(cn)
+        query_key = item.get("query_key")
+        if query_key:
+            key_parts.append(query_key)
+        if ocr:
+            ocr_parts.append(ocr)
+    return {
+        "_official_en": " / ".join(en_parts),
+        "_official_cn": " / ".join(cn_parts),
+        "_query_key": " / ".join(key_parts),
+        "_ocr_text": " / ".join(ocr_parts),
+    }
+
+
+# 不超过该长度的查询键只做精确匹配
+_EXACT_ONLY_MAX_KEY_LEN = 3
+
+# 标题翻译缓存上限，超出后整体清空
+_TITLE_CACHE_LIMIT = 4096
+
+# search_key 结果的 LRU 上限（跨帧复用，只存命中键与分数）
+_SEARCH_CACHE_LIMIT = 1024
+
+# 属性词条别名映射（只读，全部实例共享）
+_STAT_ALIAS_MAP = MappingProxyType({
+    "hp": "mainhp",
+    "atk": "mainatk",
+    "def": "maindef",
+    "energyregen": "mainenergyregen",
+    "critrate": "maincritrate",
+    "critdmg": "maincritdmg",
+    "critdamage": "maincritdmg",
+    "critdmgbonus": "maincritdmg",
+})
+
 class MatchResult:
     def __init__(self, data: Dict[str, Any]):
         self.data = data
@@ -33,6 +174,8 @@ class MatchResult:
 class TextMatcher:
     """Core logic for matching, extracted from OverlayWindow."""
 
+    alias_map = _STAT_ALIAS_MAP
+
     def __init__(
         self,
         db: Dict[str, Any],
@@ -49,19 +192,16 @@ class TextMatcher:
         
         # 先初始化 log_callback
         self.log_callback = None
+        # match() 期间的日志缓冲，结束时合并为一次回调
+        self._log_buffer: list[str] | None = None
         
-        # 别名映射
-        self.alias_map = {
-            "hp": "mainhp",
-            "atk": "mainatk",
-            "def": "maindef",
-            "energyregen": "mainenergyregen",
-            "critrate": "maincritrate",
-            "critdmg": "maincritdmg",
-            "critdamage": "maincritdmg",
-            "critdmgbonus": "maincritdmg",
-        }
         self._title_translation_cache: dict[str, str] = {}
+        self._title_raw_cache: dict[str, str] = {}
+        # 查询键 -> (命中的数据库键, 分数)；结果字典命中时按键重建
+        self._search_cache: OrderedDict[str, tuple[str | None, float]] = OrderedDict()
+        # match 在流水线匹配线程运行时 GUI 线程仍会调用 resolve_title_cn 等接口；
+        # 上述缓存与日志缓冲均无同步，公开入口统一持有该锁（可重入，match 内部会调用 search_key）
+        self._lock = threading.RLock()
         
         # 然后初始化索引化搜索引擎（可能调用 log）
         db_keys = list(db.keys())
@@ -72,9 +212,25 @@ class TextMatcher:
         self.log_callback = callback
 
     def log(self, msg: str):
-        if self.log_callback:
+        if self._log_buffer is not None:
+            self._log_buffer.append(msg)
+        elif self.log_callback:
             self.log_callback(msg)
 
+    @contextmanager
+    def _buffered_log(self):
+        """缓存期间的日志，退出时以换行拼接后一次性交给回调（回调通常是跨线程信号）。"""
+        if self.log_callback is None or self._log_buffer is not None:
+            yield
+            return
+        self._log_buffer = []
+        try:
+            yield
+        finally:
+            buffered, self._log_buffer = self._log_buffer, None
+            if buffered:
+                self.log_callback("\n".join(buffered))
+
     def _prioritize_protagonist_gender(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """只在主角男女主并存时重排 matches[0]，避免误伤普通语音。"""
         matches = result.get("matches")
@@ -141,13 +297,25 @@ class TextMatcher:
 
     def resolve_title_cn(self, title: str) -> str:
         """解析标题（如角色名）对应的中文显示，供 UI 直接渲染。"""
-        cleaned = "".join(ch if ch.isalnum() or ch.isspace() else " " for ch in str(title or "")).strip()
-        key = normalize_en(cleaned)
+        raw = str(title or "")
+        with self._lock:
+            cached = self._title_raw_cache.get(raw)
+            if cached is not None:
+                return cached
+            value = self._resolve_title_key_cn(normalize_en(_OCR_NOISE_RE.sub(" ", raw).strip()))
+            if len(self._title_raw_cache) >= _TITLE_CACHE_LIMIT:
+                self._title_raw_cache.clear()
+            self._title_raw_cache[raw] = value
+            return value
+
+    def _resolve_title_key_cn(self, key: str) -> str:
         if not key:
             return ""
 
         if key in self._title_translation_cache:
             return self._title_translation_cache[key]
+        if len(self._title_translation_cache) >= _TITLE_CACHE_LIMIT:
+            self._title_translation_cache.clear()
 
         result, score = self.search_key(key)
         if not isinstance(result, dict):
@@ -168,7 +336,7 @@ class TextMatcher:
                 if not cn or not en:
                     continue
 
-                en_clean = "".join(ch if ch.isalnum() or ch.isspace() else " " for ch in en).strip()
+                en_clean = _OCR_NOISE_RE.sub(" ", en).strip()
                 en_key = normalize_en(en_clean)
                 if en_key != key:
                     continue
@@ -230,9 +398,6 @@ class TextMatcher:
         if not isinstance(matches, list) or len(matches) < 2:
             return result
             
-        import difflib
-        import re
-        
         ocr_norm = ocr_text.strip().lower()
         if not ocr_norm:
             return result
@@ -280,6 +445,7 @@ class TextMatcher:
             return result
 
         scored: list[tuple[float, int, Any]] = []
+        best_score = -1.0
         for idx, item in enumerate(matches):
             if not isinstance(item, dict):
                 scored.append((-1.0, idx, item))
@@ -309,8 +475,9 @@ class TextMatcher:
                 s += 0.4
 
             scored.append((s, idx, item))
+            if s > best_score:
+                best_score = s
 
-        best_score = max((x[0] for x in scored), default=-1.0)
         if best_score <= 0:
             return result
 
@@ -327,37 +494,38 @@ class TextMatcher:
 
     def match(self, lines: List[Tuple[str, float]]) -> Dict[str, Any] | None:
         """Main entry point: find best DB entry for OCR lines."""
-        start = time.time()
-        result = self._lookup_best(lines)
-        elapsed = time.time() - start
-
-        # 兜底补齐 OCR 上下文，避免某些早退路径缺失 _ocr_text/_query_key
-        if isinstance(result, dict):
-            ocr_text = " ".join(str(text).strip() for text, _ in lines if str(text).strip())
-            if ocr_text:
-                result.setdefault("_ocr_text", ocr_text)
-                result.setdefault("_query_key", normalize_en(ocr_text))
-                result["_ocr_context"] = ocr_text
-                result = self._prioritize_exact_text_match(result, ocr_text)
-                result = self._prioritize_time_context(result, ocr_text)
-        
-        # 性能监控日志
-        if elapsed > 1.0:
-            self.log(f"[PERF] match() 耗时较长: {elapsed:.2f}s")
-        
-        # 缓存统计
-        cache_stats = self.indexed_searcher.get_cache_stats()
-        hit_rate = cache_stats['hits'] / max(cache_stats['hits'] + cache_stats['misses'], 1) * 100
-        if cache_stats['hits'] + cache_stats['misses'] > 100:
-            self.log(f"[CACHE] 命中率: {hit_rate:.1f}% (hits={cache_stats['hits']}, misses={cache_stats['misses']})")
-        
-        return result
+        with self._lock, self._buffered_log():
+            start = time.time()
+            result = self._lookup_best(lines)
+            elapsed = time.time() - start
+
+            # 兜底补齐 OCR 上下文，避免某些早退路径缺失 _ocr_text/_query_key
+            if isinstance(result, dict):
+                ocr_text = " ".join(str(text).strip() for text, _ in lines if str(text).strip())
+                if ocr_text:
+                    result.setdefault("_ocr_text", ocr_text)
+                    result.setdefault("_query_key", normalize_en(ocr_text))
+                    result["_ocr_context"] = ocr_text
+                    result = self._prioritize_exact_text_match(result, ocr_text)
+                    result = self._prioritize_time_context(result, ocr_text)
+
+            # 性能监控日志
+            if elapsed > 1.0:
+                self.log(f"[PERF] match() 耗时较长: {elapsed:.2f}s")
+
+            # 缓存统计
+            cache_stats = self.indexed_searcher.get_cache_stats()
+            hit_rate = cache_stats['hits'] / max(cache_stats['hits'] + cache_stats['misses'], 1) * 100
+            if cache_stats['hits'] + cache_stats['misses'] > 100:
+                self.log(f"[CACHE] 命中率: {hit_rate:.1f}% (hits={cache_stats['hits']}, misses={cache_stats['misses']})")
+
+            return result
 
     def _clean_ocr_line(self, text: str) -> str:
-        text = re.sub(r"(?i)&lt;\s*/?\s*br\s*/?&gt;", " ", str(text or ""))
-        text = re.sub(r"(?i)<\s*/?\s*br\s*/?>?", " ", text)
+        text = _ESCAPED_BR_RE.sub(" ", str(text or ""))
+        text = _BR_TAG_RE.sub(" ", text)
         # 去掉图标/分隔符噪声，保留字母数字与空格
-        cleaned = "".join(ch if ch.isalnum() or ch.isspace() else " " for ch in text)
+        cleaned = _OCR_NOISE_RE.sub(" ", text)
         cleaned = " ".join(cleaned.split())
         return cleaned.strip()
 
@@ -380,16 +548,18 @@ class TextMatcher:
                 return True
         return False
     
-    def _is_list_mode(self, lines: list[tuple[str, float]]) -> bool:
+    def _is_list_mode(self, lines: list[tuple[str, float]], cleaned: list[str] | None = None) -> bool:
+        """cleaned 可传入已清洗的行文本，避免重复清洗。"""
         if len(lines) < 4:
             return False
-        cleaned = [self._clean_ocr_line(text) for text, _ in lines if text]
+        if cleaned is None:
+            cleaned = [self._clean_ocr_line(text) for text, _ in lines if text]
         cleaned = [c for c in cleaned if c]
         filtered = []
         for c in cleaned:
             if not c: continue
             if len(c.split()) > 3 or len(c) > 20: continue
-            digit_ratio = sum(ch.isdigit() for ch in c) / max(len(c), 1)
+            digit_ratio = _digit_count(c) / max(len(c), 1)
             if digit_ratio > 0.4: continue
             filtered.append(c)
         if len(filtered) < 3: return False
@@ -492,7 +662,7 @@ class TextMatcher:
         if any(p in raw for p in (",", ".", "!", "?", ";", ":")):
             return False
 
-        digit_ratio = sum(ch.isdigit() for ch in c) / max(len(c), 1)
+        digit_ratio = _digit_count(c) / max(len(c), 1)
         if digit_ratio > 0.30:
             return False
 
@@ -673,12 +843,106 @@ class TextMatcher:
         3. 子串匹配（包含关系）
         4. 模糊搜索（使用长度预筛选）
         """
-        # 1. 精确匹配（最快）
+        with self._lock:
+            cached = self._cached_search(key)
+            if cached is not None:
+                return cached
+            result, score = self._search_uncached(key)
+            self._remember_search(key, result, score)
+            return result, score
+
+    def _cached_search(self, key: str) -> tuple[Dict[str, Any], float] | None:
+        hit = self._search_cache.get(key)
+        if hit is None:
+            return None
+        self._search_cache.move_to_end(key)
+        matched_key, score = hit
+        return (self._build_result(matched_key) if matched_key is not None else {}), score
+
+    def _remember_search(self, key: str, result: Dict[str, Any], score: float) -> None:
+        self._search_cache[key] = (result.get("_matched_key") if result else None, score)
+        if len(self._search_cache) > _SEARCH_CACHE_LIMIT:
+            self._search_cache.popitem(last=False)
+
+    def _search_uncached(self, key: str) -> tuple[Dict[str, Any], float]:
+        direct = self._search_without_fuzzy(key)
+        if direct is not None:
+            return direct
+        key_len = len(key)
+
+        # 4. 短查询精确匹配（严格相似度）
+        if key_len < 20:
+            fuzzy_results = self.indexed_searcher.fuzzy_search(key, top_k=1, score_threshold=0.85)
+            if fuzzy_results:
+                return self._short_fuzzy_result(key, fuzzy_results[0])
+        
+        # 5. 常规模糊搜索（使用索引加速）
+        fuzzy_results = self.indexed_searcher.fuzzy_search(key, top_k=3, score_threshold=0.4)
+        return self._fuzzy_result(fuzzy_results)
+
+    def search_keys(self, keys: List[str]) -> List[tuple[Dict[str, Any], float]]:
+        """批量检索：结果与逐个调用 search_key 一致，模糊步骤合并为批量评分。"""
+        with self._lock:
+            return self._search_keys_locked(keys)
+
+    def _search_keys_locked(self, keys: List[str]) -> List[tuple[Dict[str, Any], float]]:
+        found: dict[str, tuple[Dict[str, Any], float]] = {}
+        short_keys: list[str] = []
+        pending: list[str] = []
+        for key in dict.fromkeys(keys):
+            cached = self._cached_search(key)
+            if cached is not None:
+                found[key] = cached
+                continue
+            direct = self._search_without_fuzzy(key)
+            if direct is not None:
+                found[key] = direct
+            elif len(key) < 20:
+                short_keys.append(key)
+            else:
+                pending.append(key)
+
+        if short_keys:
+            batch = self.indexed_searcher.fuzzy_search_many(short_keys, top_k=1, score_threshold=0.85)
+            for key, fuzzy_results in zip(short_keys, batch):
+                if fuzzy_results:
+                    found[key] = self._short_fuzzy_result(key, fuzzy_results[0])
+                else:
+                    pending.append(key)
+
+        if pending:
+            batch = self.indexed_searcher.fuzzy_search_many(pending, top_k=3, score_threshold=0.4)
+            for key, fuzzy_results in zip(pending, batch):
+                found[key] = self._fuzzy_result(fuzzy_results)
+
+        for key, (result, score) in found.items():
+            self._remember_search(key, result, score)
+        return [found[key] for key in keys]
+
+    def _short_fuzzy_result(self, key: str, hit: tuple[str, float]) -> tuple[Dict[str, Any], float]:
+        best_item, score = hit
+        result = self._build_result(best_item)
+        self.log(f"[MATCH] 短查询精确匹配：query_len={len(key)}, matched_len={len(best_item)}, score={score:.3f}")
+        return result, score
+
+    def _fuzzy_result(self, fuzzy_results: list[tuple[str, float]]) -> tuple[Dict[str, Any], float]:
+        if fuzzy_results:
+            best_item, score = fuzzy_results[0]
+            return self._build_result(best_item), score
+        # 6. 未找到任何匹配
+        return {}, 0.0
+
+    def _search_without_fuzzy(self, key: str) -> tuple[Dict[str, Any], float] | None:
+        """search_key 的 1-3 步（精确/前缀/子串）；需要模糊评分时返回 None。"""
+        # 1. 精确匹配（最快，d=0 直接返回）
         if self.indexed_searcher.exact_match(key):
             result = self._build_result(key)
             return result, 1.0
 
         key_len = len(key)
+        # 极短查询未精确命中时多为 OCR 噪声，跳过全部模糊检索
+        if key_len <= _EXACT_ONLY_MAX_KEY_LEN:
+            return {}, 0.0
         
         # 2. 前缀匹配（针对长查询）
         if key_len >= 10:
@@ -727,25 +991,7 @@ class TextMatcher:
                             result = self._build_result(best_contain)
                             self.log(f"[MATCH] 部分截屏匹配成功：query_len={key_len}, matched_len={len(best_contain)}")
                             return result, 0.98
-        
-        # 4. 短查询精确匹配（严格相似度）
-        if key_len < 20:
-            fuzzy_results = self.indexed_searcher.fuzzy_search(key, top_k=1, score_threshold=0.85)
-            if fuzzy_results:
-                best_item, score = fuzzy_results[0]
-                result = self._build_result(best_item)
-                self.log(f"[MATCH] 短查询精确匹配：query_len={key_len}, matched_len={len(best_item)}, score={score:.3f}")
-                return result, score
-        
-        # 5. 常规模糊搜索（使用索引加速）
-        fuzzy_results = self.indexed_searcher.fuzzy_search(key, top_k=3, score_threshold=0.4)
-        if fuzzy_results:
-            best_item, score = fuzzy_results[0]
-            result = self._build_result(best_item)
-            return result, score
-        
-        # 6. 未找到任何匹配
-        return {}, 0.0
+        return None
 
     def _lookup_best(self, lines: list[tuple[str, float]]) -> Dict[str, Any] | None:
         best_result: Dict[str, Any] | None = None
@@ -753,42 +999,81 @@ class TextMatcher:
         best_text = ""
         best_conf = 0.0
 
-        context_text = " ".join(self._clean_ocr_line(text) for text, _ in lines if text)
+        # 本次调用内的归一化/检索缓存：逐行、整块与智能候选常产生相同文本或键
+        norm_cache: dict[str, str] = {}
+        search_cache: dict[str, tuple[Dict[str, Any], float]] = {}
+
+        def _norm(text: str) -> str:
+            value = norm_cache.get(text)
+            if value is None:
+                value = normalize_en(text)
+                norm_cache[text] = value
+            return value
+
+        def _search(key: str) -> tuple[Dict[str, Any], float]:
+            # 结果字典会被就地写入 _score 等字段，缓存保存干净副本，每次返回浅拷贝
+            hit = search_cache.get(key)
+            if hit is None:
+                result, score = self.search_key(key)
+                search_cache[key] = (dict(result), score)
+                return result, score
+            return dict(hit[0]), hit[1]
+
+        def _prefetch(keys: list[str]) -> None:
+            # 尚未缓存的键一次性批量检索，模糊评分在 C++ 中合并完成
+            pending = [k for k in dict.fromkeys(keys) if k not in search_cache]
+            if len(pending) < 2:
+                return
+            for key, (result, score) in zip(pending, self.search_keys(pending)):
+                search_cache[key] = (dict(result), score)
+
+        # 每行只清洗/归一化一次，后续各阶段复用
+        cleaned_lines = [self._clean_ocr_line(text) if text else "" for text, _ in lines]
+        context_text = " ".join(c for (text, _), c in zip(lines, cleaned_lines) if text)
         context_words = [w for w in context_text.split() if w]
-        context_len = len(normalize_en(context_text))
+        full_text_key = _norm(context_text)
+        context_len = len(full_text_key)
         context_anchors = self._extract_anchor_tokens(context_text) if context_len >= 120 else []
 
         line_info: list[dict] = []
+        alias_get = self.alias_map.get
         for idx, (text, conf) in enumerate(lines):
-            cleaned = self._clean_ocr_line(text)
+            cleaned = cleaned_lines[idx]
             if not cleaned: continue
-            key = normalize_en(cleaned)
-            if not key: continue
-            key = self.alias_map.get(key, key)
-            result, score = self.search_key(key)
-            matches = result.get("matches", []) if isinstance(result, dict) else []
-            first_match = matches[0] if matches else {}
-            primary_text_key = first_match.get("text_key") if isinstance(first_match, dict) else ""
-            official_en = first_match.get("official_en") if isinstance(first_match, dict) else ""
-            
+            norm_key = _norm(cleaned)
+            if not norm_key: continue
+            key = alias_get(norm_key, norm_key)
             is_title_like = self._looks_title_like_line(text, cleaned)
             
+            # 检索结果字段由 _fill_line_search 填充
             line_info.append({
-                'idx': idx, 'text': text, 'cleaned': cleaned, 'key': key,
-                'conf': conf, 'score': score, 'result': result,
-                'is_title_like': is_title_like, 'score_val': score, # cache score
-                'text_key': primary_text_key, 'official_en': official_en,
+                'idx': idx, 'text': text, 'cleaned': cleaned, 'key': key, 'norm_key': norm_key,
+                'conf': conf, 'score': 0.0, 'result': {},
+                'is_title_like': is_title_like, 'score_val': 0.0, # cache score
+                'text_key': "", 'official_en': "",
+                'word_count': len(cleaned.split()),
             })
 
+        def _fill_line_search(line: dict) -> None:
+            result, score = _search(line['key'])
+            matches = result.get("matches", []) if isinstance(result, dict) else []
+            first_match = matches[0] if matches else {}
+            is_dict = isinstance(first_match, dict)
+            line['score'] = line['score_val'] = score
+            line['result'] = result
+            line['text_key'] = first_match.get("text_key") if is_dict else ""
+            line['official_en'] = first_match.get("official_en") if is_dict else ""
+
         if not line_info: return None
+        # 标题提示与混合内容候选只依赖首行，其余行推迟到整块/说话者早退判断之后再检索
+        _fill_line_search(line_info[0])
         title_hint = self._extract_first_line_title_hint(lines, line_info)
         mixed_candidate = self._build_mixed_content_candidate(line_info)
 
         # 0. 尝试全量文本合并匹配 (针对长句被OCR拆分的情况)
-        full_text_key = normalize_en(context_text)
         if full_text_key and len(full_text_key) > 30:
              # Try substring first for safety
-             full_res, full_score = self.search_key(full_text_key)
+             full_res, full_score = _search(full_text_key)
              matched_key = full_res.get('_matched_key', '') if isinstance(full_res, dict) else ''
              full_ratio = len(matched_key) / max(len(full_text_key), 1) if matched_key else 0.0
              # 收紧早退：避免中低分命中导致长技能文本跳错
@@ -817,9 +1102,9 @@ class TextMatcher:
             speaker_stripped = strip_speaker_prefix(raw_combined)
             if speaker_stripped:
                 speaker_name, dialogue_text = speaker_stripped
-                stripped_key = normalize_en(self._clean_ocr_line(dialogue_text))
+                stripped_key = _norm(self._clean_ocr_line(dialogue_text))
                 if stripped_key and len(stripped_key) >= 15:
-                    stripped_res, stripped_score = self.search_key(stripped_key)
+                    stripped_res, stripped_score = _search(stripped_key)
                     if stripped_score >= 0.80:
                         self.log(
                             f"[MATCH] 说话者前缀剥离命中: score={stripped_score:.3f}, "
@@ -831,42 +1116,48 @@ class TextMatcher:
                         stripped_res["_speaker_name"] = speaker_name
                         return self._attach_title_hint(stripped_res, title_hint)
 
+        rest_lines = line_info[1:]
+        _prefetch([l['key'] for l in rest_lines])
+        for line in rest_lines:
+            _fill_line_search(line)
+
         # --- Multiline Checks (from original code) ---
         multi_items = []
         for line in line_info:
             cleaned = line['cleaned']
             # Time format check
-            if re.match(r'^\d+[dhms](\s+\d+[dhms])*$', cleaned.lower().strip()):
+            if _is_time_format(cleaned):
                  if multi_items: multi_items[-1]['time_suffix'] = cleaned
                  continue
-            if sum(ch.isdigit() for ch in cleaned) / max(len(cleaned), 1) > 0.8: continue
+            cleaned_len, digit_count, special_char_count = _classify_chars(cleaned)
+            if digit_count / max(cleaned_len, 1) > 0.8: continue
 
-            # Quality check
+            # Quality check（本行字段只取一次）
+            score = line['score']
             matched_key = line['result'].get('_matched_key', '')
             key_len = len(line['key'])
             matched_len = len(matched_key)
             is_extreme_mismatch = key_len >= 15 and matched_len > key_len * 3.0
             
-            special_char_count = len(re.findall(r'[^\w\s\-]', cleaned))
-            has_special_pollution = (special_char_count / max(len(cleaned), 1)) > 0.15
+            has_special_pollution = (special_char_count / max(cleaned_len, 1)) > 0.15
 
-            is_high_score = line['score'] >= 0.75 and not has_special_pollution
+            is_high_score = score >= 0.75 and not has_special_pollution
             is_length_match = matched_len >= key_len * 0.5 and matched_len <= key_len * 2.0
-            is_long_text = key_len > 50 and line['score'] >= 0.60
-            is_short_text_strict = key_len < 15 and line['score'] >= 0.85
-            is_good_match = is_high_score or (is_length_match and line['score'] >= 0.55) or is_long_text or is_short_text_strict
+            is_long_text = key_len > 50 and score >= 0.60
+            is_short_text_strict = key_len < 15 and score >= 0.85
+            is_good_match = is_high_score or (is_length_match and score >= 0.55) or is_long_text or is_short_text_strict
             
-            if has_special_pollution and line['score'] < 0.85: continue
-            if is_extreme_mismatch and line['score'] < 0.98:
+            if has_special_pollution and score < 0.85: continue
+            if is_extreme_mismatch and score < 0.98:
                 self.log(
                     f"[FILTER] 跳过极端长度失配: {cleaned} "
-                    f"(score={line['score']:.3f}, query_len={key_len}, matched_len={matched_len})"
+                    f"(score={score:.3f}, query_len={key_len}, matched_len={matched_len})"
                 )
                 continue
 
             if is_good_match:
                 multi_items.append(line)
-                self.log(f"[FILTER] 保留条目: {cleaned} (score={line['score']:.3f}, len={key_len})")
+                self.log(f"[FILTER] 保留条目: {cleaned} (score={score:.3f}, len={key_len})")
         
         if len(multi_items) >= 3:
             # 去重：合并匹配到同一个 text_key 的多个 OCR 行
@@ -893,7 +1184,7 @@ class TextMatcher:
             )
 
             # 连续段落场景：避免把同一段技能描述拆成“多条目”
-            dense_line_count = sum(1 for l in line_info if len(l['cleaned'].split()) >= 4)
+            dense_line_count = sum(1 for l in line_info if l['word_count'] >= 4)
             paragraph_like = (
                 len(lines) >= 6
                 and context_len >= 120
@@ -903,7 +1194,7 @@ class TextMatcher:
                 len(lines) >= 3
                 and context_len >= 80
                 and dense_line_count >= max(2, len(lines) - 1)
-                and not self._is_list_mode(lines)
+                and not self._is_list_mode(lines, cleaned_lines)
             )
             if len(text_key_map) >= 3 and (
                 paragraph_like
@@ -923,7 +1214,7 @@ class TextMatcher:
                     for text_key, tk_lines in text_key_map.items():
                         # 合并所有OCR文本
                         merged_ocr = " ".join(l['cleaned'] for l in tk_lines)
-                        merged_key = normalize_en(merged_ocr)
+                        merged_key = _norm(merged_ocr)
                         # 使用第一个匹配结果（它们都指向同一个条目）
                         first_line = tk_lines[0]
                         merged_lines.append({
@@ -951,7 +1242,7 @@ class TextMatcher:
                 for text_key, tk_lines in text_key_map.items():
                     # 合并同一条目的多个OCR行
                     merged_ocr = " ".join(l['cleaned'] for l in tk_lines)
-                    merged_key = normalize_en(merged_ocr)
+                    merged_key = _norm(merged_ocr)
                     max_score = max(l['score'] for l in tk_lines)
 
                     first_line = tk_lines[0]
@@ -983,10 +1274,7 @@ class TextMatcher:
                     "_multi": True, 
                     "items": items,
                     "_has_audio": has_high_confidence_audio,  # 新增标记
-                    "_official_en": " / ".join([i.get("official_en") or i.get("ocr") or "" for i in items if i.get("official_en") or i.get("ocr")]),
-                    "_official_cn": " / ".join([i.get("official_cn") or "" for i in items if i.get("official_cn")]),
-                    "_query_key": " / ".join([i["query_key"] for i in items if i.get("query_key")]),
-                    "_ocr_text": " / ".join([i["ocr"] for i in items if i.get("ocr")]),
+                    **_join_multi_fields(items),
                 }
 
         # Mixed Content Check
@@ -996,38 +1284,38 @@ class TextMatcher:
             return mixed_res
 
         # List Mode Check (Original logic copied)
-        line_scores = [(l['cleaned'], l['score'], l['result']) for l in line_info]
-        if self._is_list_mode(lines) and line_scores:
-            strong_lines = [(c, s, r) for c, s, r in line_scores if s >= 0.9] # Simplified check
+        if line_info and self._is_list_mode(lines, cleaned_lines):
+            strong_lines = [l for l in line_info if l['score'] >= 0.9] # Simplified check
             if len(strong_lines) >= 3:
                  # Return list
                  items = []
-                 for cleaned, score, result in strong_lines:
-                     matches = result.get("matches")
+                 for l in strong_lines:
+                     matches = l['result'].get("matches")
                      match = matches[0] if matches else {}
-                     items.append({"ocr": cleaned, "query_key": normalize_en(cleaned), "score": round(score, 3), "text_key": match.get("text_key"), "official_cn": match.get("official_cn")})
+                     items.append({"ocr": l['cleaned'], "query_key": l['norm_key'], "score": round(l['score'], 3), "text_key": match.get("text_key"), "official_cn": match.get("official_cn")})
                  return {"_multi": True, "items": items, "_query_key": "list", "_ocr_text": "list"}
 
         # Single-line high-confidence fast path:
         # 避免短剧情句在 smart-candidate 的后置过滤阶段被误丢弃。
         if len(line_info) == 1:
             line = line_info[0]
-            matched_key = line['result'].get('_matched_key', '')
-            key_len = len(line['key'])
-            matched_len = len(matched_key)
+            result = line['result']
+            score = line['score']
+            key = line['key']
+            matched_len = len(result.get('_matched_key', ''))
+            key_len = len(key)
             if (
-                line['score'] >= 0.95
+                score >= 0.95
                 and key_len >= 12
                 and matched_len >= max(10, int(key_len * 0.75))
                 and matched_len <= key_len * 2
             ):
-                self.log(f"[MATCH] 单行高置信快速命中: score={line['score']:.3f}, len={key_len}")
-                result = line['result']
-                result['_score'] = round(line['score'], 3)
-                result['_query_key'] = line['key']
+                self.log(f"[MATCH] 单行高置信快速命中: score={score:.3f}, len={key_len}")
+                result['_score'] = round(score, 3)
+                result['_query_key'] = key
                 result['_ocr_text'] = line['cleaned']
                 result['_ocr_conf'] = round(float(line.get('conf', 0.0)), 3)
-                result['_weighted'] = round(float(line['score']), 3)
+                result['_weighted'] = round(float(score), 3)
                 return self._attach_title_hint(result, title_hint)
 
         # Smart Candidates
@@ -1044,25 +1332,46 @@ class TextMatcher:
         else:
             max_candidates = len(candidates)
         
+        # 批量检索循环必定访问的候选键（过滤规则与下方循环一致）：早退要求最佳候选词数 > 5，
+        # 因此截至首个词数 > 5 的候选之前循环不会退出；其后的候选在循环中按需逐个检索
+        candidate_keys = []
+        for text, _ in candidates[:max_candidates]:
+            key = _norm(text)
+            if not key:
+                continue
+            word_count = len(text.split())
+            if context_len >= 40 and (word_count <= 2 or len(key) < 12):
+                continue
+            candidate_keys.append(key)
+            if word_count > 5:
+                break
+        _prefetch(candidate_keys)
+
         successful_sub_matches = []
         seen_text_keys = set()
+        context_text_len = len(context_text)
+        best_word_count = 0
         
         for idx, (text, conf) in enumerate(candidates[:max_candidates]):
              # 早期退出：如果已经找到高质量匹配，停止搜索
-             if best_score > 0.96 and len(best_text.split()) > 5:
+             if best_score > 0.96 and best_word_count > 5:
                  self.log(f"[SEARCH] 早期退出：已找到高质量匹配 (score={best_score:.3f})")
                  break
              
-             key = normalize_en(text)
+             key = _norm(text)
              if not key: continue
+             # 每个候选只计算一次长度/词数
+             key_len = len(key)
+             text_len = len(text)
+             text_word_count = len(text.split())
 
              # Filter short garbage
              # 仅在长上下文中启用，避免误杀“短但完整”的剧情句。
              if context_len >= 40:
-                 if len(text.split()) <= 2: continue
-                 if len(key) < 12: continue
+                 if text_word_count <= 2: continue
+                 if key_len < 12: continue
 
-             result, score = self.search_key(key)
+             result, score = _search(key)
              matched_key = result.get("_matched_key", "")
              matches = result.get("matches", [])
              first_match = matches[0] if matches else {}
@@ -1073,35 +1382,22 @@ class TextMatcher:
                  anchor_hit = sum(1 for tok in context_anchors if tok in matched_key)
                  anchor_ratio = anchor_hit / max(len(context_anchors), 1)
              
-             word_count = max(len(text.split()), 1)
-             length_bonus = min(len(key) / 100.0, 1.0)
-             word_bonus = min(word_count / 8.0, 1.0)
-             weighted_score = score * (0.6 + 0.2 * length_bonus + 0.2 * word_bonus)
-             
-             # Penalties
-             if matched_key:
-                 key_len = len(key)
-                 matched_len = len(matched_key)
-                 length_diff = abs(key_len - matched_len)
-                 length_ratio = matched_len / max(key_len, 1)
-
-                 if key_len > 25 and matched_len < 20:
-                     weighted_score *= 0.4 # Relaxed from 0.2
-                     self.log(f"[MATCH] 长查询匹配短条目惩罚: score={weighted_score:.3f}")
-                 elif length_diff > 15 and length_ratio < 0.6:
-                     weighted_score *= 0.6 # Relaxed from 0.4
-                 elif key_len > matched_len * 2:
-                     weighted_score *= 0.7 # Relaxed from 0.5
-                 elif key_len > matched_len * 1.5 and score < 0.97:
-                     weighted_score *= 0.85 # Relaxed from 0.75
+             # 基础加权与长度失配惩罚
+             matched_len = len(matched_key)
+             weighted_score, short_entry_penalty = _length_weighted_score(
+                 score, key_len, max(text_word_count, 1), matched_len
+             )
+             if short_entry_penalty:
+                 self.log(f"[MATCH] 长查询匹配短条目惩罚: score={weighted_score:.3f}")
 
+             if matched_key:
                  if (
                      strategy == "single"
                      and len(line_info) == 1
                      and context_len >= 25
                      and key_len < context_len
                      and matched_key != key
-                     and len(text.split()) <= max(2, len(context_words) // 2)
+                     and text_word_count <= max(2, len(context_words) // 2)
                  ):
                      candidate_coverage = key_len / max(context_len, 1)
                      matched_coverage = matched_len / max(context_len, 1)
@@ -1124,7 +1420,7 @@ class TextMatcher:
 
              # 长段落锚词一致性：候选若缺少核心锚词，降权
              if context_anchors and matched_key:
-                 is_sub_candidate = len(text) < len(context_text) * 0.7
+                 is_sub_candidate = text_len < context_text_len * 0.7
                  if is_sub_candidate and anchor_hit == 0:
                      if score < 0.85:
                          weighted_score *= 0.8
@@ -1164,6 +1460,7 @@ class TextMatcher:
                  best_score = weighted_score
                  best_result = result
                  best_text = text
+                 best_word_count = text_word_count
                  best_conf = conf
                  best_result["_score"] = round(score, 3)
                  best_result["_query_key"] = key
@@ -1173,11 +1470,10 @@ class TextMatcher:
              
              # 收集成功匹配的子句
              if weighted_score >= 0.55:
-                 is_sub = len(text) < len(context_text) * 0.95
+                 is_sub = text_len < context_text_len * 0.95
                  if is_sub:
-                     matches = result.get("matches", [])
-                     first_match = matches[0] if matches else {}
-                     tk = first_match.get("text_key")
+                     # matches/first_match 在本轮开头已取出，result 只被写入 _score 等字段
+                     tk = primary_text_key
                      if tk and tk not in seen_text_keys:
                          seen_text_keys.add(tk)
                          official_en = first_match.get("official_en") or text
@@ -1228,10 +1524,7 @@ class TextMatcher:
                 "_multi": True,
                 "items": items,
                 "_has_audio": has_high_confidence_audio,
-                "_official_en": " / ".join([i.get("official_en") or i.get("ocr") or "" for i in items if i.get("official_en") or i.get("ocr")]),
-                "_official_cn": " / ".join([i.get("official_cn") or "" for i in items if i.get("official_cn")]),
-                "_query_key": " / ".join([i["query_key"] for i in items if i.get("query_key")]),
-                "_ocr_text": " / ".join([i["ocr"] for i in items if i.get("ocr")]),
+                **_join_multi_fields(items),
                 "_score": round(best_score, 3),
                 "_weighted": round(best_score, 3),
             }
@@ -12,6 +12,7 @@ import urllib.error
 import urllib.request
 from pathlib import Path
 
+from ludiglot.core.capture_input import pil_image_to_bgra_raw
 from ludiglot.infrastructure.proxy_setup import setup_system_proxy
 setup_system_proxy()
 from typing import Any, Callable, Dict, List, Tuple, Union
@@ -34,6 +35,19 @@ except ImportError:
     np = None
     HAS_NUMPY = False
 
+# 行质量评分用的删除表：长度差即为对应字符数（C 层完成，免逐字符循环）
+_VALID_CHARS_TABLE = str.maketrans(
+    "", "", "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789 -'.,!?;:"
+)
+_WEIRD_CHARS_TABLE = str.maketrans("", "", "*#@$")
+_ASCII_ALNUM = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+# Windows OCR 结果质量检测：常用标点 + ASCII 字母数字
+_QUALITY_PUNCT = " .,!?'\":;-()[]"
+_QUALITY_VALID_TABLE = str.maketrans("", "", _ASCII_ALNUM + _QUALITY_PUNCT)
+# 候选文本评分：ASCII 字母数字 + 空格/连字符/撇号
+_TEXT_SCORE_VALID_TABLE = str.maketrans("", "", _ASCII_ALNUM + " -'")
+
+
 @dataclass(frozen=True)
 class OcrPipelineResult:
     boxes: List[Dict[str, object]]
@@ -285,8 +299,8 @@ class OCREngine:
             self._emit_log(f"[OCR] 读取文件失败：{e}")
             return []
 
-    def _preprocess_windows_input(self, image_input: Union[str, Path, Any, tuple]) -> bytes | None:
-        """轻量预处理：灰度 + autocontrast，输出 PNG bytes."""
+    def _preprocess_windows_input(self, image_input: Union[str, Path, Any, tuple]) -> tuple | None:
+        """轻量预处理：灰度 + autocontrast，全程在内存中完成，输出 BGRA raw 元组（免 PNG 编解码）。"""
         if not HAS_PIL or Image is None:
             return None
         try:
@@ -304,14 +318,11 @@ class OCREngine:
             if pil_img.mode != "L":
                 pil_img = pil_img.convert("L")
             try:
-                from PIL import ImageOps
                 pil_img = ImageOps.autocontrast(pil_img)
             except Exception:
                 # Autocontrast is an optional enhancement; if it fails, continue with the original image
                 pass
-            buf = io.BytesIO()
-            pil_img.save(buf, format="PNG")
-            return buf.getvalue()
+            return pil_image_to_bgra_raw(pil_img)
         except Exception:
             return None
 
@@ -443,23 +454,14 @@ class OCREngine:
             
             for line in lines:
                 text = line.get("text", "")
-                total_len += len(text)
-                for ch in text:
-                    is_valid = False
-                    # 总是允许常用标点
-                    if ch in " .,!?'\":;-()[]":
-                        is_valid = True
-                    elif is_english:
-                        # 英文模式下，要求 ASCII 字符
-                        if ch.isascii() and ch.isalnum():
-                            is_valid = True
-                    else:
-                        # 其他语言（如中文），只要是字母数字即可
-                        if ch.isalnum():
-                            is_valid = True
-                    
-                    if is_valid:
-                        valid_chars += 1
+                text_len = len(text)
+                total_len += text_len
+                if is_english or text.isascii():
+                    # 英文模式只认 ASCII 字母数字；纯 ASCII 文本的 isalnum 与之等价，用删除表在 C 层计数
+                    valid_chars += text_len - len(text.translate(_QUALITY_VALID_TABLE))
+                else:
+                    # 其他语言（如中文），常用标点或任意字母数字
+                    valid_chars += sum(1 for ch in text if ch in _QUALITY_PUNCT or ch.isalnum())
             
             if total_len == 0: return 0.0
             return valid_chars / total_len
@@ -584,7 +586,6 @@ class OCREngine:
                             if pil_img.mode == 'RGBA':
                                 pil_img = pil_img.convert('RGB')
                                 
-                            from PIL import ImageOps
                             inv_img = ImageOps.invert(pil_img)
                             
                             # Convert back to raw bytes for efficiency if using raw path
@@ -685,7 +686,7 @@ class OCREngine:
                 text = (text or "").strip()
                 if not text:
                     return -1e9
-                valid = sum(1 for ch in text if ch.isascii() and (ch.isalnum() or ch in " -'"))
+                valid = len(text) - len(text.translate(_TEXT_SCORE_VALID_TABLE))
                 ratio = valid / max(len(text), 1)
                 vowels = set("aeiouyAEIOUY")
                 max_cluster = 0
@@ -705,14 +706,14 @@ class OCREngine:
                 text = (text or "").strip()
                 if not text:
                     return -1e9
-                valid = 0
-                weird = 0
+                return _line_stats(text)[0]
+
+            def _line_stats(text: str) -> tuple[float, int, int]:
+                """返回 (行得分, 有效字符数, 空格数)，text 需已 strip 且非空。"""
+                text_len = len(text)
+                valid = text_len - len(text.translate(_VALID_CHARS_TABLE))
+                weird = text_len - len(text.translate(_WEIRD_CHARS_TABLE))
                 space_count = text.count(" ")
-                for ch in text:
-                    if ch.isascii() and (ch.isalnum() or ch in " -'.,!?;:"):
-                        valid += 1
-                    elif ch in "*#@$":
-                        weird += 1
                 ratio = valid / max(len(text), 1)
                 penalty = 0.0
                 if text and text[0] in "*•·":
@@ -726,24 +727,41 @@ class OCREngine:
                     if space_count < expected_spaces:
                         penalty += 0.1
                 penalty += weird * 0.05
-                return ratio - penalty
+                return ratio - penalty, valid, space_count
 
             def _score_lines(lines: List[Dict[str, object]]) -> float:
                 if not lines:
                     return -1e9
-                texts = [str(x.get("text", "")).strip() for x in lines if str(x.get("text", "")).strip()]
-                if not texts:
+                # 单次遍历累积各项计数，等价于对 " ".join(texts) 的逐项统计
+                count = 0
+                score_sum = 0.0
+                valid = 0
+                spaces = 0
+                word_count = 0
+                joined_len = 0
+                for x in lines:
+                    text = str(x.get("text", "")).strip()
+                    if not text:
+                        continue
+                    line_score, line_valid, line_spaces = _line_stats(text)
+                    count += 1
+                    score_sum += line_score
+                    valid += line_valid
+                    spaces += line_spaces
+                    word_count += len(text.split())
+                    joined_len += len(text)
+                if not count:
                     return -1e9
-                joined = " ".join(texts)
-                scores = [_line_score(t) for t in texts]
-                avg_line = sum(scores) / max(len(scores), 1)
-                valid = sum(1 for ch in joined if ch.isascii() and (ch.isalnum() or ch in " -'.,!?;:"))
-                ratio = valid / max(len(joined), 1)
-                words = [w for w in joined.split() if w]
-                word_bonus = min(len(words) / 12.0, 1.0) * 0.2
-                space_ratio = joined.count(" ") / max(len(joined), 1)
+                # 行间连接的空格同样计入有效字符与空格
+                valid += count - 1
+                spaces += count - 1
+                joined_len += count - 1
+                avg_line = score_sum / count
+                ratio = valid / max(joined_len, 1)
+                word_bonus = min(word_count / 12.0, 1.0) * 0.2
+                space_ratio = spaces / max(joined_len, 1)
                 penalty = 0.0
-                if len(joined) > 40 and space_ratio < 0.05:
+                if joined_len > 40 and space_ratio < 0.05:
                     penalty += 0.2
                 return avg_line + ratio * 0.5 + word_bonus - penalty
 
@@ -1386,9 +1404,9 @@ class OCREngine:
             print("[OCR] 使用后端: Windows OCR")
             windows_lines = []
             if self.win_ocr_preprocess:
-                pre_bytes = self._preprocess_windows_input(raw_tuple if raw_tuple is not None else image_input)
-                if pre_bytes:
-                    windows_lines = self._windows_ocr_recognize_from_bytes(pre_bytes)
+                pre_raw = self._preprocess_windows_input(raw_tuple if raw_tuple is not None else image_input)
+                if pre_raw:
+                    windows_lines = self._windows_ocr_recognize_from_bytes(pre_raw)
             if not windows_lines:
                 if isinstance(image_input, (str, Path)):
                      # File Path
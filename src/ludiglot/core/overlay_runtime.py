@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable
@@ -11,7 +10,7 @@ from ludiglot.core.config import AppConfig
 from ludiglot.core.matcher import TextMatcher
 from ludiglot.core.ocr import OCREngine
 from ludiglot.core.skill_param_resolver import SkillParamResolver
-from ludiglot.core.text_builder import build_text_db, build_text_db_from_root_all, save_text_db
+from ludiglot.core.text_builder import build_text_db, build_text_db_from_root_all, load_text_db, save_text_db
 from ludiglot.core.voice_event_index import VoiceEventIndex
 from ludiglot.core.voice_map import build_voice_map_from_configdb, collect_all_voice_event_names
 
@@ -96,8 +95,16 @@ def initialize_overlay_runtime(
     )
 
 
+def _db_file_usable(path: Path) -> bool:
+    """只用 stat 判断数据库文件是否可用，避免为了决策而解析整个 JSON。"""
+    try:
+        return path.stat().st_size > 0
+    except OSError:
+        return False
+
+
 def _load_or_build_text_db(config: AppConfig, callbacks: OverlayRuntimeCallbacks) -> dict[str, Any]:
-    should_rebuild = config.auto_rebuild_db or not config.db_path.exists()
+    should_rebuild = config.auto_rebuild_db or not _db_file_usable(config.db_path)
 
     if should_rebuild:
         if not (config.data_root or (config.en_json and config.zh_json)):
@@ -119,9 +126,10 @@ def _load_or_build_text_db(config: AppConfig, callbacks: OverlayRuntimeCallbacks
 
     if should_rebuild:
         save_text_db(db, config.db_path)
+        return db
 
     if config.db_path.exists():
-        return json.loads(config.db_path.read_text(encoding="utf-8"))
+        return load_text_db(config.db_path)
     return {}
 
 
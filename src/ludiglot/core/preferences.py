@@ -5,6 +5,10 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
 
 FONT_SIZE_MIN = 8
 FONT_SIZE_MAX = 72
@@ -61,7 +65,8 @@ class ConfigJsonStore:
         if not self.path.exists():
             return {}
         try:
-            raw = json.loads(self.path.read_text(encoding="utf-8"))
+            data = self.path.read_bytes()
+            raw = _orjson.loads(data) if _orjson is not None else json.loads(data.decode("utf-8"))
         except Exception:
             return {}
         return raw if isinstance(raw, dict) else {}
@@ -107,9 +112,24 @@ class ConfigJsonStore:
         raw["ocr_mode"] = preferences.ocr_mode
         raw["font_en"] = preferences.font_en
         raw["font_cn"] = preferences.font_cn
+        self._write_raw(raw)
+
+    def _write_raw(self, raw: dict[str, Any]) -> None:
+        if _orjson is not None:
+            try:
+                self.path.write_bytes(_orjson.dumps(raw, option=_orjson.OPT_INDENT_2))
+                return
+            except TypeError:
+                # orjson 拒绝非字符串键/超长整数等，回退到标准库
+                pass
         self.path.write_text(json.dumps(raw, ensure_ascii=False, indent=2), encoding="utf-8")
 
 
+def clamp_font_size(value: Any, default: int = OverlayPreferences.font_size) -> int:
+    """将字号收敛到 [FONT_SIZE_MIN, FONT_SIZE_MAX]，无法解析时回退到默认值。"""
+    return _clamp_int(value, FONT_SIZE_MIN, FONT_SIZE_MAX, default)
+
+
 def normalize_overlay_preferences(
     preferences: OverlayPreferences,
     defaults: OverlayPreferences | None = None,
@@ -118,7 +138,7 @@ def normalize_overlay_preferences(
     return OverlayPreferences(
         window_pos=preferences.window_pos or defaults.window_pos,
         window_size=preferences.window_size or defaults.window_size,
-        font_size=_clamp_int(preferences.font_size, FONT_SIZE_MIN, FONT_SIZE_MAX, defaults.font_size),
+        font_size=clamp_font_size(preferences.font_size, defaults.font_size),
         font_weight=_valid_choice(preferences.font_weight, VALID_FONT_WEIGHTS, defaults.font_weight),
         letter_spacing=_clamp_float(
             preferences.letter_spacing,
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from ludiglot.core.capture import CaptureRegion
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Rect:
     x: int
     y: int
@@ -13,7 +13,7 @@ class Rect:
     height: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScreenGeometry:
     index: int
     x: int
@@ -24,7 +24,7 @@ class ScreenGeometry:
     name: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MonitorGeometry:
     left: int
     top: int
@@ -32,7 +32,7 @@ class MonitorGeometry:
     height: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SelectionMapping:
     region: CaptureRegion
     screen_index: int
@@ -43,6 +43,7 @@ class SelectionMapping:
 
 
 def find_screen_index_for_rect_center(rect: Rect, screens: list[ScreenGeometry], default_index: int = 0) -> int:
+    """screenAt 未命中时的回退：对缓存的整数几何做半开区间判断，不经过 QRect.contains。"""
     center_x = rect.x + rect.width // 2
     center_y = rect.y + rect.height // 2
     for screen in screens:
@@ -58,9 +59,12 @@ def map_selection_to_capture_region(
     monitors: list[MonitorGeometry] | None = None,
     dpr_override: float | None = None,
     use_monitor_scale: bool = True,
+    screen_index: int | None = None,
 ) -> SelectionMapping:
+    """screen_index 为调用方已定位的屏幕（如 QGuiApplication.screenAt），缺省时按选区中心查找。"""
     if screens:
-        screen_index = find_screen_index_for_rect_center(rect, screens)
+        if screen_index is None:
+            screen_index = find_screen_index_for_rect_center(rect, screens)
         screen = next((item for item in screens if item.index == screen_index), screens[0])
     else:
         screen_index = 0
@@ -70,44 +74,34 @@ def map_selection_to_capture_region(
     if use_monitor_scale and monitor is not None:
         scale_x = monitor.width / max(screen.width, 1)
         scale_y = monitor.height / max(screen.height, 1)
-        rel_x = rect.x - screen.x
-        rel_y = rect.y - screen.y
-        region = CaptureRegion(
-            left=int(monitor.left + int(rel_x * scale_x)),
-            top=int(monitor.top + int(rel_y * scale_y)),
-            width=int(rect.width * scale_x),
-            height=int(rect.height * scale_y),
-        )
+        region = _scale_rect_to_region(rect, screen.x, screen.y, scale_x, scale_y, monitor.left, monitor.top)
         return SelectionMapping(region, screen_index, scale_x, scale_y, "snapshot-monitor", monitor)
 
     dpr = float(dpr_override) if dpr_override is not None else float(screen.dpr or 1.0)
-    rel_x = rect.x - screen.x
-    rel_y = rect.y - screen.y
-    phy_x_local = int(rel_x * dpr)
-    phy_y_local = int(rel_y * dpr)
-    region = CaptureRegion(
-        left=phy_x_local,
-        top=phy_y_local,
-        width=int(rect.width * dpr),
-        height=int(rect.height * dpr),
-    )
-    source = "dpr-absolute"
     if monitor is not None:
-        region = CaptureRegion(
-            left=int(monitor.left + phy_x_local),
-            top=int(monitor.top + phy_y_local),
-            width=region.width,
-            height=region.height,
-        )
-        source = "dpr-monitor"
-    else:
-        region = CaptureRegion(
-            left=int(rect.x * dpr),
-            top=int(rect.y * dpr),
-            width=region.width,
-            height=region.height,
-        )
-    return SelectionMapping(region, screen_index, dpr, dpr, source, monitor)
+        region = _scale_rect_to_region(rect, screen.x, screen.y, dpr, dpr, monitor.left, monitor.top)
+        return SelectionMapping(region, screen_index, dpr, dpr, "dpr-monitor", monitor)
+    # 无 mss 显示器信息时按全局逻辑坐标直接缩放
+    region = _scale_rect_to_region(rect, 0, 0, dpr, dpr, 0, 0)
+    return SelectionMapping(region, screen_index, dpr, dpr, "dpr-absolute", monitor)
+
+
+def _scale_rect_to_region(
+    rect: Rect,
+    origin_x: int,
+    origin_y: int,
+    scale_x: float,
+    scale_y: float,
+    left: int,
+    top: int,
+) -> CaptureRegion:
+    """逻辑选区相对 (origin_x, origin_y) 缩放到物理像素，再平移到物理原点 (left, top)。"""
+    return CaptureRegion(
+        left=int(left + int((rect.x - origin_x) * scale_x)),
+        top=int(top + int((rect.y - origin_y) * scale_y)),
+        width=int(rect.width * scale_x),
+        height=int(rect.height * scale_y),
+    )
 
 
 def _matching_monitor_for_screen(screen: ScreenGeometry, monitors: list[MonitorGeometry] | None) -> MonitorGeometry | None:
@@ -178,27 +172,34 @@ def crop_box_for_snapshot_region(
 
 def expand_region_within_monitor(
     region: CaptureRegion,
-    monitor: MonitorGeometry,
+    monitor: MonitorGeometry | None,
     *,
     margin_x: int = 40,
     margin_y: int = 30,
     min_width: int = 600,
     min_height: int = 120,
 ) -> CaptureRegion:
-    left = max(monitor.left, region.left - margin_x)
-    top = max(monitor.top, region.top - margin_y)
-    right = min(monitor.left + monitor.width, region.left + region.width + margin_x)
-    bottom = min(monitor.top + monitor.height, region.top + region.height + margin_y)
+    """monitor 由调用方预先缓存传入；为 None（未取到屏幕信息）时原样返回。"""
+    if monitor is None:
+        return region
+    mon_left = monitor.left
+    mon_top = monitor.top
+    mon_right = mon_left + monitor.width
+    mon_bottom = mon_top + monitor.height
+    left = max(mon_left, region.left - margin_x)
+    top = max(mon_top, region.top - margin_y)
+    right = min(mon_right, region.left + region.width + margin_x)
+    bottom = min(mon_bottom, region.top + region.height + margin_y)
     width = max(right - left, region.width)
     height = max(bottom - top, region.height)
     if width < min_width:
         extra = (min_width - width) // 2
-        left = max(monitor.left, left - extra)
-        right = min(monitor.left + monitor.width, right + extra)
+        left = max(mon_left, left - extra)
+        right = min(mon_right, right + extra)
         width = right - left
     if height < min_height:
         extra = (min_height - height) // 2
-        top = max(monitor.top, top - extra)
-        bottom = min(monitor.top + monitor.height, bottom + extra)
+        top = max(mon_top, top - extra)
+        bottom = min(mon_bottom, bottom + extra)
         height = bottom - top
     return CaptureRegion(left=int(left), top=int(top), width=int(width), height=int(height))
@@ -26,6 +26,14 @@ _SPEAKER_PREFIX_RE = re.compile(
     re.DOTALL,
 )
 
+# 句末标点后的空白（分句用）
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?。！？])\s+')
+
+# 滑动窗口候选的最小词数：更短的文本已由整句/逐行候选覆盖
+_WINDOW_MIN_WORDS = 10
+# 每个滑动窗口包含的词数
+_WINDOW_SIZE = 10
+
 
 def strip_speaker_prefix(text: str):
     """检测并剥离 'SpeakerName: Dialogue content' 格式的说话者前缀。
@@ -117,23 +125,35 @@ def build_smart_candidates(
     for text, conf in candidates:
         if not text:
             continue
+        # 至少两段且其中一段 >=2 词才会产生子句候选，词数不足 3 的文本直接跳过
+        if len(text.split()) < 3:
+            continue
         # 英文/中文标点分句
-        parts = re.split(r'(?<=[.!?。！？])\s+', text)
+        parts = _SENTENCE_SPLIT_RE.split(text)
         if len(parts) >= 2:
             for p in parts:
                 p_clean = p.strip()
                 if p_clean and len(p_clean.split()) >= 2 and len(p_clean) >= 6:
                     sub_sentence_candidates.append((p_clean, conf * 0.98))
                     
-    existing_keys = {normalize_func(t) for t, _ in candidates}
+    # 按归一化文本去重：同键保留置信度最高的原始 (文本, 置信度)，位置取首次出现处（dict 保持插入顺序）
+    # 归一化为空的原始候选不参与去重、原样保留；空键的子句候选仍丢弃
+    best_by_key: Dict[Any, Tuple[str, float]] = {}
+    for idx, (text, conf) in enumerate(candidates):
+        key = normalize_func(text) or (None, idx)
+        current = best_by_key.get(key)
+        if current is None or conf > current[1]:
+            best_by_key[key] = (text, conf)
     for text, conf in sub_sentence_candidates:
         key = normalize_func(text)
-        if key and key not in existing_keys:
-            candidates.append((text, conf))
-            existing_keys.add(key)
+        if not key:
+            continue
+        current = best_by_key.get(key)
+        if current is None or conf > current[1]:
+            best_by_key[key] = (text, conf)
             
     # 按照置信度降序排序，确保高质量候选排在前面
-    candidates.sort(key=lambda x: x[1], reverse=True)
+    candidates = sorted(best_by_key.values(), key=lambda x: x[1], reverse=True)
     res['candidates'] = candidates
     return res
 
@@ -172,15 +192,23 @@ def _build_smart_candidates_raw(
         content_lines = mixed_info['content_lines']
         
         title_text = title_line['cleaned']
-        content_text = ' '.join(l['cleaned'] for l in content_lines)
+        # 单次遍历同时收集正文文本、正文置信度和全文置信度（累加顺序与 sum() 一致）
+        content_parts = []
+        content_conf_sum = 0.0
+        full_conf_sum = title_line['conf']
+        for l in content_lines:
+            content_parts.append(l['cleaned'])
+            content_conf_sum += l['conf']
+            full_conf_sum += l['conf']
+        content_text = ' '.join(content_parts)
         full_text = f"{title_text} {content_text}"
-        avg_content_conf = sum(l['conf'] for l in content_lines) / len(content_lines)
+        avg_content_conf = content_conf_sum / len(content_lines)
         
         # 候选：1. 内容单独 2. 标题单独 3. 完整文本
         candidates = [
             (content_text, avg_content_conf),
             (title_text, title_line['conf']),
-            (full_text, sum(l['conf'] for l in lines_info) / len(lines_info)),
+            (full_text, full_conf_sum / len(lines_info)),
         ]
 
         # 新增：如果 content_text 以 "LastName: dialogue" 开头（分割人名场景）
@@ -212,8 +240,13 @@ def _build_smart_candidates_raw(
     
     # 长文本模式
     if len(lines_info) >= 2:
-        full_text = ' '.join(l['cleaned'] for l in lines_info)
-        avg_conf = sum(l['conf'] for l in lines_info) / len(lines_info)
+        line_texts = []
+        conf_sum = 0.0
+        for l in lines_info:
+            line_texts.append(l['cleaned'])
+            conf_sum += l['conf']
+        full_text = ' '.join(line_texts)
+        avg_conf = conf_sum / len(lines_info)
         candidates = [(full_text, avg_conf)]
 
         # 将每个独立的、长度足够的行也作为候选评估，防止硬拼接导致整体失配
@@ -225,6 +258,7 @@ def _build_smart_candidates_raw(
         # 新增：检测分割人名场景
         # 场景1: Line1=缩写人名(N.A.N.A.), Line2=正文  → 直接取 Line2 以后的文本
         # 场景2: Line1=人名前半(Luuk), Line2=LastName: dialogue → 在 mixed 模式已处理
+        full_words = full_text.split()
         first_info = lines_info[0]
         if first_info['is_title_like'] or first_info['is_abbreviation_name']:
             rest_text = ' '.join(l['cleaned'] for l in lines_info[1:])
@@ -242,17 +276,26 @@ def _build_smart_candidates_raw(
             if words:
                 first_word = words[0]
                 if len(first_word) < 10 and first_word[0].isupper() and first_word.isalpha():
-                    full_words = full_text.split()
                     if len(full_words) > 3:
                         stripped_text = " ".join(full_words[1:])
                         candidates.append((stripped_text, 0.85))
 
-        # 添加滑动窗口候选（如果文本很长）
-        if len(full_text.split()) >= 10:
-            words = full_text.split()
-            for start in range(0, len(words) - 5, 3):
-                segment = ' '.join(words[start:start+10])
-                candidates.append((segment, 0.8))
+        # 添加滑动窗口候选（如果文本很长）；短文本直接跳过窗口生成
+        if len(full_words) >= _WINDOW_MIN_WORDS:
+            # 单空格规整后的全文只拼一次，各窗口按词的字符偏移直接切片
+            joined = ' '.join(full_words)
+            word_count = len(full_words)
+            word_starts = []
+            word_ends = []
+            pos = 0
+            for word in full_words:
+                word_starts.append(pos)
+                pos += len(word)
+                word_ends.append(pos)
+                pos += 1
+            for start in range(0, word_count - 5, 3):
+                last = min(start + _WINDOW_SIZE, word_count) - 1
+                candidates.append((joined[word_starts[start]:word_ends[last]], 0.8))
         return {
             'is_mixed': False,
             'full_text': full_text,
@@ -8,6 +8,11 @@ from typing import Dict, Iterable, Tuple, Any
 
 from ludiglot.core.voice_map import build_voice_map_from_configdb
 
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
+
 
 
 def normalize_en(text: str) -> str:
@@ -567,5 +572,13 @@ def build_text_db(
     return build_text_db_from_maps(en_map, zh_map, en_json.name, plot_audio, voice_map)
 
 
+def load_text_db(path: Path) -> Dict[str, dict]:
+    """读取文本数据库；安装了 orjson 时直接解析字节，避免先解码成大字符串。"""
+    data = Path(path).read_bytes()
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
 def save_text_db(db: Dict[str, dict], output: Path) -> None:
     output.write_text(json.dumps(db, ensure_ascii=False, indent=2), encoding="utf-8")
@@ -8,9 +8,14 @@ from pathlib import Path
 from typing import Dict, Iterable, List, Set, Tuple
 
 try:
-    from rapidfuzz import fuzz  # type: ignore
+    from rapidfuzz import fuzz, process  # type: ignore
 except Exception:  # pragma: no cover
     fuzz = None
+    process = None
+
+# 模块加载时绑定评分函数，避免逐候选的属性查找
+_TOKEN_SET_RATIO = fuzz.token_set_ratio if fuzz is not None else None
+_EXTRACT = process.extract if process is not None else None
 
 
 _CAMEL_SPLIT = re.compile(r"([a-z0-9])([A-Z])")
@@ -178,7 +183,14 @@ class VoiceEventIndex:
             union.update(b)
         return union
 
-    def _score(self, seed_norm: str, seed_comp: str, cand_norm: str, cand_comp: str) -> float:
+    def _score(
+        self,
+        seed_norm: str,
+        seed_comp: str,
+        cand_norm: str,
+        cand_comp: str,
+        ratio: float | None = None,
+    ) -> float:
         if seed_norm == cand_norm:
             return 1.0
         if seed_comp == cand_comp and seed_comp:
@@ -188,12 +200,22 @@ class VoiceEventIndex:
         else:
             base = 0.0
 
-        if fuzz is not None:
-            ratio = float(fuzz.token_set_ratio(seed_norm, cand_norm)) / 100.0
-        else:
-            ratio = SequenceMatcher(None, seed_norm, cand_norm).ratio()
+        if ratio is None:
+            if _TOKEN_SET_RATIO is not None:
+                ratio = float(_TOKEN_SET_RATIO(seed_norm, cand_norm)) / 100.0
+            else:
+                ratio = SequenceMatcher(None, seed_norm, cand_norm).ratio()
         return max(base, ratio)
 
+    def _batch_ratios(self, seed_norm: str, choices: List[str]) -> List[float] | None:
+        """一次性在 rapidfuzz C++ 内核中计算 seed 与全部候选的 token_set_ratio。"""
+        if _EXTRACT is None or _TOKEN_SET_RATIO is None or not choices:
+            return None
+        ratios = [0.0] * len(choices)
+        for _, score, pos in _EXTRACT(seed_norm, choices, scorer=_TOKEN_SET_RATIO, limit=None):
+            ratios[pos] = float(score) / 100.0
+        return ratios
+
     def find_candidates(
         self,
         text_key: str | None,
@@ -221,10 +243,18 @@ class VoiceEventIndex:
             candidate_indices = self._candidate_indices(tokens)
             if not candidate_indices:
                 candidate_indices = set(range(len(self.names)))
-            for idx in candidate_indices:
+            ordered_indices = list(candidate_indices)
+            ratios = self._batch_ratios(seed_norm, [self._normalized[idx] for idx in ordered_indices])
+            for pos, idx in enumerate(ordered_indices):
                 cand_norm = self._normalized[idx]
                 cand_comp = self._compact[idx]
-                score = self._score(seed_norm, seed_comp, cand_norm, cand_comp)
+                score = self._score(
+                    seed_norm,
+                    seed_comp,
+                    cand_norm,
+                    cand_comp,
+                    ratios[pos] if ratios is not None else None,
+                )
                 if score >= min_score:
                     prev = scored.get(idx, 0.0)
                     if score > prev:
@@ -1,23 +1,45 @@
 from __future__ import annotations
 
+import atexit
 import sys
 import threading
 from pathlib import Path
 from typing import TextIO
 
 _STREAM_LOCK = threading.Lock()
+# 日志文件句柄按路径常驻，避免每条消息都 mkdir + open + close
+_LOG_FILE_LOCK = threading.Lock()
+_LOG_FILES: dict[Path, TextIO] = {}
 
 
 def _append_to_log(log_path: Path, data: str) -> None:
     try:
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        with log_path.open("a", encoding="utf-8") as f:
-            f.write(data)
+        with _LOG_FILE_LOCK:
+            handle = _LOG_FILES.get(log_path)
+            if handle is None or handle.closed:
+                log_path.parent.mkdir(parents=True, exist_ok=True)
+                handle = log_path.open("a", encoding="utf-8")
+                _LOG_FILES[log_path] = handle
+            handle.write(data)
+            # 每条消息后刷写，保证日志即时可见
+            handle.flush()
     except Exception:
         # Best-effort file logging; ignore write errors
         pass
 
 
+@atexit.register
+def _close_log_files() -> None:
+    with _LOG_FILE_LOCK:
+        for handle in _LOG_FILES.values():
+            try:
+                handle.close()
+            except Exception:
+                # Best-effort close at interpreter exit
+                pass
+        _LOG_FILES.clear()
+
+
 class _TeeStream:
     def __init__(self, stream: TextIO, log_path: Path) -> None:
         self._stream = stream
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import QApplication, QMenu, QSystemTrayIcon
 
@@ -10,6 +11,9 @@ from ludiglot.ui.overlay_window import OverlayWindow
 
 
 def run_gui(config_path: Path) -> None:
+    # 合并高频鼠标/触控笔移动事件：框选拖动时橡皮筋按事件循环节奏更新，而不是按鼠标回报率
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents, True)
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_CompressTabletEvents, True)
     app = QApplication([])
     app.setFont(QFont("Segoe UI", 10))
     app.setQuitOnLastWindowClosed(False)
@@ -34,6 +38,9 @@ def run_gui(config_path: Path) -> None:
     if style:
         tray.setIcon(style.standardIcon(style.StandardPixmap.SP_ComputerIcon))
 
+    def request_capture() -> None:
+        window.capture_requested.emit(True)
+
     menu = QMenu()
     # 修复：明确 Show/Hide 的职责，不再使用 toggle，解决状态不一致导致的“双击才能显示”问题
     show_action = menu.addAction("Show")
@@ -42,17 +49,22 @@ def run_gui(config_path: Path) -> None:
     hide_action.triggered.connect(window.hide)
     menu.addSeparator()
     capture_action = menu.addAction("Capture")
-    capture_action.triggered.connect(lambda: window.capture_requested.emit(True))
+    capture_action.triggered.connect(request_capture)
     reset_action = menu.addAction("Reset Window Position")
     reset_action.triggered.connect(window.reset_window_position)
     quit_action = menu.addAction("Quit")
     quit_action.triggered.connect(app.quit)
 
+    # 激活原因在绑定时解析为字典键，每次托盘事件只做一次查表
+    tray_activation_actions = {
+        QSystemTrayIcon.ActivationReason.Trigger: window._toggle_visibility,
+        QSystemTrayIcon.ActivationReason.DoubleClick: request_capture,
+    }
+
     def handle_tray_activation(reason: QSystemTrayIcon.ActivationReason) -> None:
-        if reason == QSystemTrayIcon.ActivationReason.Trigger:
-            window._toggle_visibility()
-        elif reason == QSystemTrayIcon.ActivationReason.DoubleClick:
-            window.capture_requested.emit(True)
+        action = tray_activation_actions.get(reason)
+        if action is not None:
+            action()
 
     tray.setContextMenu(menu)
     tray.activated.connect(handle_tray_activation)
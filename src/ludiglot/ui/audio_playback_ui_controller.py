@@ -12,7 +12,6 @@ from ludiglot.ui.audio_controls_presenter import AudioControlsPresenter, AudioCo
 
 class AudioControlsAdapter(Protocol):
     def apply(self, state: AudioControlsViewState) -> None: ...
-    def is_dragging(self) -> bool: ...
 
 
 
@@ -44,6 +43,9 @@ class AudioPlaybackUiController:
         self._current_identity: AudioPlaybackIdentity | None = None
         self._last_seek_time: float | None = None
         self._current_source_name: str | None = None
+        # 拖动状态由 seek_started/seek_finished 信号维护，避免每次刷新都回查控件
+        self._seek_dragging = False
+        self._seek_was_playing: bool | None = None
 
     @property
     def has_current_audio(self) -> bool:
@@ -144,11 +146,17 @@ class AudioPlaybackUiController:
         )
 
     def seek_started(self) -> None:
-        pass
+        self._seek_dragging = True
+        if self._seek_was_playing is None:
+            self._seek_was_playing = bool(self._player.is_playing())
 
     def seek_finished(self, position: float) -> None:
+        self._seek_dragging = False
         self._last_seek_time = self._clock()
-        was_playing = self._player.is_playing()
+        was_playing = self._seek_was_playing
+        self._seek_was_playing = None
+        if was_playing is None:
+            was_playing = self._player.is_playing()
         self._player.seek(position)
         duration = self._player.get_duration()
         if duration > 0:
@@ -182,7 +190,7 @@ class AudioPlaybackUiController:
             state = self._presenter.progress(
                 position,
                 duration,
-                update_progress=not self._controls.is_dragging(),
+                update_progress=not self._seek_dragging,
             )
             self._controls.apply(state)
 
@@ -36,6 +36,9 @@ class CaptureSessionCallbacks:
 ThreadStarter = Callable[[Callable[[], None]], None]
 WorkflowRunner = Callable[[CaptureProcessRequest, CaptureProcessCallbacks], Any]
 
+# 连按/误触热键时复用上一张桌面快照的时间窗口（秒）
+SNAPSHOT_CACHE_TTL = 0.2
+
 
 def start_daemon_thread(target: Callable[[], None]) -> None:
     threading.Thread(target=target, daemon=True).start()
@@ -54,6 +57,7 @@ class OverlayCaptureSession:
         clear_result_audio_state: Callable[[], None],
         thread_starter: ThreadStarter = start_daemon_thread,
         workflow_runner: WorkflowRunner = run_capture_match_workflow,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         self._config_provider = config_provider
         self._ocr_engine_provider = ocr_engine_provider
@@ -64,12 +68,38 @@ class OverlayCaptureSession:
         self._clear_result_audio_state = clear_result_audio_state
         self._thread_starter = thread_starter
         self._workflow_runner = workflow_runner
+        self._clock = clock
         self._running = False
+        # (时间戳, 截图模式/后端, 快照)
+        self._snapshot_cache: tuple[float, tuple[str, str], Any] | None = None
 
     @property
     def is_running(self) -> bool:
         return self._running
 
+    def close(self) -> None:
+        """退出时停止工作流的后台匹配线程（若有）。"""
+        close = getattr(self._workflow_runner, "close", None)
+        if close is not None:
+            close()
+
+    def invalidate_snapshot_cache(self) -> None:
+        self._snapshot_cache = None
+
+    def _desktop_snapshot(self, config: Any) -> Any:
+        cache_key = (
+            str(getattr(config, "capture_mode", "") or "").lower(),
+            str(getattr(config, "capture_backend", "mss") or "mss").lower(),
+        )
+        now = self._clock()
+        cached = self._snapshot_cache
+        if cached is not None and cached[1] == cache_key and now - cached[0] < SNAPSHOT_CACHE_TTL:
+            return cached[2]
+        self._snapshot_cache = None
+        snapshot = self._capture_adapter.capture_desktop_snapshot()
+        self._snapshot_cache = (now, cache_key, snapshot)
+        return snapshot
+
     def trigger(self, force_select: bool = False) -> None:
         if self._running:
             self._callbacks.log("[HOTKEY] 正在处理中，忽略重复触发")
@@ -86,16 +116,20 @@ class OverlayCaptureSession:
             self._callbacks.log("[HOTKEY] 触发捕获")
             config = self._config_provider()
             if force_select or getattr(config, "capture_mode", None) == "select":
-                self._callbacks.status("冻结屏幕…")
-                t_snap_start = time.time()
-                try:
-                    snapshot = self._capture_adapter.capture_desktop_snapshot()
-                except Exception as exc:
-                    snapshot = None
-                    self._callbacks.log(f"[CAPTURE] 预截图失败，回退实时框选: {exc}")
-                t_snap_end = time.time()
-                if snapshot is not None:
-                    self._callbacks.log(f"[PERF] 屏幕快照耗时: {(t_snap_end - t_snap_start):.3f}s")
+                if getattr(self._capture_adapter, "can_native_subcapture", False):
+                    # 原生后端框选后直接截取子区域，跳过整屏快照
+                    self._callbacks.log("[CAPTURE] 原生子区域截图，跳过屏幕快照")
+                else:
+                    self._callbacks.status("冻结屏幕…")
+                    t_snap_start = time.time()
+                    try:
+                        snapshot = self._desktop_snapshot(config)
+                    except Exception as exc:
+                        snapshot = None
+                        self._callbacks.log(f"[CAPTURE] 预截图失败，回退实时框选: {exc}")
+                    t_snap_end = time.time()
+                    if snapshot is not None:
+                        self._callbacks.log(f"[PERF] 屏幕快照耗时: {(t_snap_end - t_snap_start):.3f}s")
                 self._callbacks.status("请选择 OCR 区域…")
                 t_select_start = time.time()
                 selected_region = self._capture_adapter.select_region(snapshot)
@@ -5,6 +5,7 @@ from typing import Any
 from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QApplication
 
+from ludiglot.core.capture_match_workflow import PipelinedCaptureMatchRunner
 from ludiglot.core.overlay_runtime import OverlayRuntimeCallbacks
 from ludiglot.ui.audio_controls_presenter import AudioControlsPresenter
 from ludiglot.ui.audio_playback_ui_controller import AudioPlaybackUiController
@@ -17,6 +18,7 @@ from ludiglot.ui.qt_capture_adapter import QtCaptureAdapter
 from ludiglot.ui.qt_hotkey_adapter import WindowsNativeHotkeyAdapter
 from ludiglot.ui.qt_result_presentation_adapter import QtResultPresentationAdapter
 from ludiglot.ui.result_presentation_controller import ResultPresentationController
+from ludiglot.ui.runtime_init_thread import RuntimeInitThread
 
 
 def create_runtime_callbacks(window: Any) -> OverlayRuntimeCallbacks:
@@ -46,7 +48,7 @@ def install_audio_player(window: Any) -> None:
 
 
 def install_audio_playback_controls(window: Any) -> None:
-    # 音频进度更新定时器
+    # 音频进度更新定时器；仅在播放期间运行，窗口偏好改为移动/缩放后延迟保存
     window.audio_timer = QTimer(window)
     window.audio_timer.timeout.connect(window._update_audio_progress)
     window.audio_timer.setInterval(100)  # 每100ms更新一次
@@ -107,21 +109,22 @@ def install_capture_session(window: Any) -> None:
         ),
         stop_audio=window.stop_audio,
         clear_result_audio_state=window._clear_capture_audio_state,
+        workflow_runner=PipelinedCaptureMatchRunner(),
     )
 
 
 def connect_overlay_composition_signals(window: Any) -> None:
     window.capture_requested.connect(window.capture_session.trigger)
-    window.resources_initialized.connect(window._on_runtime_resources_initialized)
+
+
+def install_runtime_initialization(window: Any) -> None:
+    thread = RuntimeInitThread(window.config, window.engine, create_runtime_callbacks(window), parent=window)
+    thread.init_finished.connect(window._on_runtime_init_finished)
+    window._runtime_init_thread = thread
+    thread.start()
 
 
 def install_app_event_filter(window: Any) -> None:
     app = QApplication.instance()
     if app:
         app.installEventFilter(window)
-
-
-def install_sync_timer(window: Any) -> None:
-    window._sync_config_timer = QTimer(window)
-    window._sync_config_timer.timeout.connect(window._persist_window_position)
-    window._sync_config_timer.start(5000)  # 每 5 秒同步一次
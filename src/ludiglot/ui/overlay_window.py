@@ -1,17 +1,25 @@
 from __future__ import annotations
 
+import math
+import os
 import sys
 import threading
 from pathlib import Path
 from typing import Any, Dict
 
-from PyQt6.QtCore import Qt, pyqtSignal, QObject, QTimer, QPoint, QPointF, QRect, QRectF, QEvent
-from PyQt6.QtGui import QFont, QTextOption, QColor, QAction, QActionGroup, QCursor, QPainter, QGuiApplication
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QObject, QTimer, QPoint, QPointF, QRect, QRectF, QEvent,
+    QVariantAnimation, QEasingCurve
+)
+from PyQt6.QtGui import (
+    QFont, QTextOption, QColor, QAction, QActionGroup, QCursor, QPainter, QGuiApplication,
+    QPen, QPainterPath, QPolygonF, QLinearGradient, QFontDatabase
+)
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QTextEdit, QMenu, QComboBox, QSizePolicy,
     QSlider, QSpinBox, QDoubleSpinBox, QWidgetAction, QStyle,
-    QFrame
+    QStyleOptionSpinBox, QFrame
 )
 
 from ludiglot.core.config import AppConfig
@@ -24,11 +32,16 @@ from ludiglot.core.display_shaper import DisplayPreferences
 from ludiglot.core.preferences import (
     FONT_SIZE_MAX,
     FONT_SIZE_MIN,
+    LETTER_SPACING_MAX,
+    LETTER_SPACING_MIN,
+    LINE_SPACING_MAX,
+    LINE_SPACING_MIN,
     ConfigJsonStore,
     OverlayPreferences,
     WindowBounds,
     WindowPoint,
     WindowSize,
+    clamp_font_size,
     clamp_window_position,
 )
 from ludiglot.infrastructure.terminal_log_tee import install_process_log_tee
@@ -42,7 +55,7 @@ from ludiglot.ui.overlay_composition import (
     install_capture_session,
     install_hotkey_registrar,
     install_result_presentation,
-    install_sync_timer,
+    install_runtime_initialization,
 )
 from ludiglot.ui.waveform_progress_bar import AudioWaveformProgressBar
 
@@ -95,8 +108,6 @@ class GoldSpinBox(QSpinBox):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        from PyQt6.QtWidgets import QStyle, QStyleOptionSpinBox
-        from PyQt6.QtGui import QPolygonF
         opt = QStyleOptionSpinBox()
         self.initStyleOption(opt)
         
@@ -141,8 +152,6 @@ class GoldDoubleSpinBox(QDoubleSpinBox):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        from PyQt6.QtWidgets import QStyle, QStyleOptionSpinBox
-        from PyQt6.QtGui import QPolygonF
         opt = QStyleOptionSpinBox()
         self.initStyleOption(opt)
         
@@ -198,7 +207,6 @@ class PlayPauseButton(QPushButton):
             }
         """)
         
-        from PyQt6.QtCore import QVariantAnimation, QEasingCurve
         
         # 悬浮动画：0.0 -> 1.0
         self._hover_anim = QVariantAnimation(self)
@@ -291,8 +299,6 @@ class PlayPauseButton(QPushButton):
             icon_color = QColor(icon_r, icon_g, icon_b, icon_a)
 
         # 1. 绘制背景/边框外框：暂停态是方形，播放态平滑旋转为菱形
-        from PyQt6.QtGui import QPen
-        import math
 
         cx = rect.width() / 2.0
         cy = rect.height() / 2.0
@@ -328,7 +334,6 @@ class PlayPauseButton(QPushButton):
             painter.setPen(Qt.PenStyle.NoPen)
             painter.setBrush(c_play)
             
-            from PyQt6.QtGui import QPolygonF
             size = 10.0
             half_size = size / 2.0
             offset = 0.5  # 视觉微调中心偏移
@@ -388,8 +393,6 @@ class CloseIconButton(QPushButton):
             }
         """)
         
-        # 导入动画所需类
-        from PyQt6.QtCore import QVariantAnimation, QEasingCurve
         self._anim = QVariantAnimation(self)
         self._anim.setDuration(120)  # 120ms 灵动响应
         self._anim.setEasingCurve(QEasingCurve.Type.OutCubic)
@@ -436,7 +439,6 @@ class CloseIconButton(QPushButton):
         # 每次旋转 90 度画一片利刃，倾斜 45 度开始第一片
         painter.rotate(45)
         
-        from PyQt6.QtGui import QPainterPath
         for _ in range(4):
             painter.save()
             # 沿着当前旋转方向 of X 轴平移，实现完美且极其平滑的向外舒展动画
@@ -456,7 +458,6 @@ class CloseIconButton(QPushButton):
             painter.drawPath(path)
             
             # 绘制中间细微的利刃脊线
-            from PyQt6.QtGui import QPen
             pen = QPen(QColor(0, 0, 0, 45), 0.8)
             painter.setPen(pen)
             painter.drawLine(QPointF(0.0, 0), QPointF(L - 3.0, 0))
@@ -487,8 +488,6 @@ class MenuIconButton(QPushButton):
             }
         """)
         
-        # 导入动画所需类
-        from PyQt6.QtCore import QVariantAnimation, QEasingCurve
         self._anim = QVariantAnimation(self)
         self._anim.setDuration(350)  # 350ms 顺滑旋转与放大
         self._anim.setEasingCurve(QEasingCurve.Type.OutCubic)
@@ -544,8 +543,6 @@ class MenuIconButton(QPushButton):
         painter.scale(0.95, 0.95)  # 基础微调缩放以维持视觉精致度
         
         # 绘制六边形
-        import math
-        from PyQt6.QtGui import QPolygonF
         
         hexagon = QPolygonF()
         R = 9.5  # 六边形外接圆半径
@@ -556,7 +553,6 @@ class MenuIconButton(QPushButton):
             y = R * math.sin(angle_rad)
             hexagon.append(QPointF(x, y))
             
-        from PyQt6.QtGui import QPen
         hex_pen = QPen(icon_color, 1.5)
         painter.setPen(hex_pen)
         painter.setBrush(Qt.BrushStyle.NoBrush)
@@ -609,7 +605,6 @@ class StarDivider(QWidget):
         painter.setBrush(star_color)
         
         # 绘制四角星的路径
-        from PyQt6.QtGui import QPainterPath
         path = QPainterPath()
         R = 8.0  # 外半径
         r = 2.5  # 内半径
@@ -632,7 +627,6 @@ class StarDivider(QWidget):
         painter.restore()
         
         # 绘制两侧的渐变线条
-        from PyQt6.QtGui import QLinearGradient, QPen
         
         # 左侧渐变线
         left_grad = QLinearGradient(0, cy, cx - 12, cy)
@@ -668,7 +662,6 @@ class OverlayWindow(QMainWindow):
     """无边框、置顶覆盖层窗口（MVP）。"""
 
     capture_requested = pyqtSignal(bool)
-    resources_initialized = pyqtSignal(object)
     resources_loaded = pyqtSignal()
 
     def __init__(self, config: AppConfig, config_path: Path) -> None:
@@ -703,6 +696,22 @@ class OverlayWindow(QMainWindow):
         self._resize_edge = None  # 'left', 'right', 'top', 'bottom', 'topleft', 'topright', 'bottomleft', 'bottomright'
         self._resize_start_geometry = None
         self._resize_start_pos = None
+        # 菜单按钮全局坐标缓存：((窗口位置, 按钮几何), 按钮左上角全局坐标)
+        self._menu_btn_origin_cache: tuple[tuple[QPoint, QRect], QPoint] | None = None
+        # 上次写入配置文件的偏好；同步时未变化则跳过整次读改写
+        self._persisted_preferences: OverlayPreferences | None = None
+        # 窗口移动/缩放后 1 秒内无新变化才写盘，写盘在后台线程完成
+        self._geom_dirty = False
+        self._geom_save_timer = QTimer(self)
+        self._geom_save_timer.setSingleShot(True)
+        self._geom_save_timer.setInterval(1000)
+        self._geom_save_timer.timeout.connect(self._flush_geom)
+        self._persist_lock = threading.Lock()
+        # 主菜单及全部子菜单（广度优先），菜单树构建后固定；供全局事件过滤器使用
+        self._menu_tree_cache: tuple[QMenu, ...] = ()
+        # 待写入 log_box 的日志行；同一轮事件内的多条日志合并为一次 append
+        self._log_queue: list[str] = []
+        self._log_flush_pending = False
 
         # UI 状态
         self.current_font_size = 13
@@ -728,9 +737,8 @@ class OverlayWindow(QMainWindow):
         connect_overlay_composition_signals(self)
         install_app_event_filter(self)
 
-        threading.Thread(target=self._initialize_resources, daemon=True).start()
+        install_runtime_initialization(self)
         self._hotkeys.start()
-        install_sync_timer(self)
 
     def _setup_ui(self) -> None:
         self.setWindowFlags(
@@ -1010,7 +1018,7 @@ class OverlayWindow(QMainWindow):
         size_label = QLabel("Size")
         size_label.setStyleSheet("color: white; font-weight: normal;")
         self.size_spin = GoldSpinBox()
-        self.size_spin.setRange(8, 72)
+        self.size_spin.setRange(FONT_SIZE_MIN, FONT_SIZE_MAX)
         self.size_spin.setFixedWidth(65)
         self.size_spin.setButtonSymbols(QSpinBox.ButtonSymbols.UpDownArrows)
         self.size_spin.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -1070,7 +1078,7 @@ class OverlayWindow(QMainWindow):
         spacing_label = QLabel("Spacing")
         spacing_label.setStyleSheet("color: white; font-weight: normal;")
         self.spacing_spin = GoldDoubleSpinBox()
-        self.spacing_spin.setRange(-10, 50)
+        self.spacing_spin.setRange(LETTER_SPACING_MIN, LETTER_SPACING_MAX)
         self.spacing_spin.setSingleStep(0.5)
         self.spacing_spin.setFixedWidth(65)
         self.spacing_spin.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -1111,7 +1119,7 @@ class OverlayWindow(QMainWindow):
         lh_label = QLabel("Line Spacing")
         lh_label.setStyleSheet("color: white; font-weight: normal;")
         self.lh_spin = GoldDoubleSpinBox()
-        self.lh_spin.setRange(0.5, 5.0)
+        self.lh_spin.setRange(LINE_SPACING_MIN, LINE_SPACING_MAX)
         self.lh_spin.setSingleStep(0.1)
         self.lh_spin.setFixedWidth(65)
         self.lh_spin.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -1175,6 +1183,18 @@ class OverlayWindow(QMainWindow):
         
         # 初始化菜单样式（默认左展开）
         self._initialize_menu_style()
+        self._menu_tree_cache = self._collect_menu_tree(self.window_menu)
+
+    def _collect_menu_tree(self, root: QMenu) -> tuple[QMenu, ...]:
+        menus = [root]
+        index = 0
+        while index < len(menus):
+            for action in menus[index].actions():
+                submenu = action.menu()
+                if submenu:
+                    menus.append(submenu)
+            index += 1
+        return tuple(menus)
 
     def _show_window_menu(self):
         """显示窗口菜单，实现右边缘对齐"""
@@ -1183,8 +1203,8 @@ class OverlayWindow(QMainWindow):
         self.window_menu.adjustSize()
         menu_w = self.window_menu.sizeHint().width()
         
-        # 获取按钮右边缘的全局 X 坐标
-        btn_topleft = self.top_menu_btn.mapToGlobal(QPoint(0, 0))
+        # 获取按钮右边缘的全局 X 坐标（窗口未移动时复用上次的映射结果）
+        btn_topleft = self._menu_button_origin()
         btn_right_x = btn_topleft.x() + self.top_menu_btn.width()
         btn_bottom_y = btn_topleft.y() + self.top_menu_btn.height()
         
@@ -1198,6 +1218,15 @@ class OverlayWindow(QMainWindow):
             # 向右展开：左边缘对齐 + 2 (默认行为)
             self.window_menu.exec(QPoint(btn_topleft.x() + 2, btn_bottom_y))
     
+    def _menu_button_origin(self) -> QPoint:
+        key = (self.pos(), self.top_menu_btn.geometry())
+        cache = self._menu_btn_origin_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        origin = self.top_menu_btn.mapToGlobal(QPoint(0, 0))
+        self._menu_btn_origin_cache = (key, origin)
+        return origin
+
     def _initialize_menu_style(self):
         """初始化菜单样式，确保所有用户都能看到正确的样式"""
         direction = getattr(self, "_menu_direction", "right")
@@ -1289,9 +1318,9 @@ class OverlayWindow(QMainWindow):
 
     def _adjust_font_size_direct(self, value: int):
         """直接通过 SpinBox 调节字号"""
-        self.current_font_size = value
+        self.current_font_size = clamp_font_size(value, self.current_font_size)
         self._apply_font_settings()
-        self.signals.log.emit(f"[UI] 字号设置为: {value}pt")
+        self.signals.log.emit(f"[UI] 字号设置为: {self.current_font_size}pt")
         self._persist_window_position()
 
     def _adjust_letter_spacing_direct(self, value: float):
@@ -1320,7 +1349,6 @@ class OverlayWindow(QMainWindow):
 
     def _get_available_fonts(self) -> list[str]:
         """获取系统和data/fonts目录下的可用字体"""
-        from PyQt6.QtGui import QFontDatabase
         
         fonts = []
         
@@ -1340,27 +1368,27 @@ class OverlayWindow(QMainWindow):
         # 扫描 Fonts 目录
         font_dir = self.config.fonts_root
         if font_dir.exists():
-            for font_file in font_dir.glob("*.[tT][tT][fF]"):
-                try:
-                    font_id = QFontDatabase.addApplicationFont(str(font_file))
-                    if font_id != -1:
-                        families = QFontDatabase.applicationFontFamilies(font_id)
-                        for family in families:
-                            fonts.append(family)
-                            self.signals.log.emit(f"[FONT] Loaded: {family} from {font_file.name}")
-                except Exception as e:
-                    self.signals.log.emit(f"[FONT] Failed to load {font_file.name}: {e}")
-            
-            for font_file in font_dir.glob("*.[oO][tT][fF]"):
+            # 单次 scandir 同时收集 ttf/otf，按后缀小写匹配
+            with os.scandir(font_dir) as entries:
+                font_files = sorted(
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.lower().endswith((".ttf", ".otf")) and entry.is_file()
+                )
+            # 日志先收集，扫描结束后一次性发出，避免逐条信号与 log_box 追加
+            log_lines: list[str] = []
+            for font_file in font_files:
                 try:
                     font_id = QFontDatabase.addApplicationFont(str(font_file))
                     if font_id != -1:
                         families = QFontDatabase.applicationFontFamilies(font_id)
                         for family in families:
                             fonts.append(family)
-                            self.signals.log.emit(f"[FONT] Loaded: {family} from {font_file.name}")
+                            log_lines.append(f"[FONT] Loaded: {family} from {font_file.name}")
                 except Exception as e:
-                    self.signals.log.emit(f"[FONT] Failed to load {font_file.name}: {e}")
+                    log_lines.append(f"[FONT] Failed to load {font_file.name}: {e}")
+            if log_lines:
+                self.signals.log.emit("\n".join(log_lines))
         
         return fonts
 
@@ -1444,13 +1472,11 @@ class OverlayWindow(QMainWindow):
         self.signals.result.connect(self._show_result)
         self.signals.log.connect(self._append_log)
 
-    def _initialize_resources(self) -> None:
-        callbacks = create_runtime_callbacks(self)
-        result = initialize_overlay_runtime(self.config, self.engine, callbacks)
+    def _on_runtime_init_finished(self, result) -> None:
         if not result.success or result.resources is None:
             return
 
-        self.resources_initialized.emit(result.resources)
+        self._on_runtime_resources_initialized(result.resources)
 
     def _refresh_runtime_resources(self) -> bool:
         callbacks = create_runtime_callbacks(self)
@@ -1562,10 +1588,25 @@ class OverlayWindow(QMainWindow):
             # Best-effort console output; ignore stdout write/flush errors
             pass
 
-        self.log_box.append(message)
+        self._log_queue.append(message)
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            QTimer.singleShot(30, self._flush_log_box)
+
+    def _flush_log_box(self) -> None:
+        self._log_flush_pending = False
+        if not self._log_queue:
+            return
+        pending = "\n".join(self._log_queue)
+        self._log_queue.clear()
+        self.log_box.append(pending)
 
     def show_and_activate(self) -> None:
         """显示并激活窗口，确保焦点。"""
+        # 连续识别时窗口通常已可见且处于激活状态，无需重复激活和同步泵事件
+        if self.isVisible() and self.isActiveWindow() and not self.isMinimized():
+            return
+        was_hidden = not self.isVisible()
         self.show()
         self.raise_()
         self.activateWindow()
@@ -1573,7 +1614,8 @@ class OverlayWindow(QMainWindow):
         self.setFocus()
         # 强制窗口置顶并获得键盘焦点
         self.setWindowState(self.windowState() & ~Qt.WindowState.WindowMinimized | Qt.WindowState.WindowActive)
-        QApplication.processEvents()  # 立即处理事件
+        if was_hidden:
+            QApplication.processEvents()  # 刚显示时立即处理事件，保证首帧绘制
 
     def stop_audio(self, emit_status: bool = True) -> None:
         self.audio_ui.stop(emit_status=emit_status)
@@ -1589,11 +1631,14 @@ class OverlayWindow(QMainWindow):
     def closeEvent(self, event) -> None:
         """关闭前保存所有状态"""
         try:
+            self._geom_save_timer.stop()
             self._persist_window_position()
         except:
             pass
         if hasattr(self, "_hotkeys"):
             self._hotkeys.stop()
+        if hasattr(self, "capture_session"):
+            self.capture_session.close()
         super().closeEvent(event)
     
     def hideEvent(self, event) -> None:
@@ -1615,22 +1660,16 @@ class OverlayWindow(QMainWindow):
             
         if self.isVisible():
             # 方案1: 检测失焦事件（窗口失去活动状态）
-            if event.type() == QEvent.Type.WindowDeactivate:
-                # 检查是否是菜单或子菜单导致的失焦
-                if hasattr(self, 'window_menu'):
-                    # 递归检查主菜单及其所有子菜单
-                    menus_to_check = [self.window_menu]
-                    while menus_to_check:
-                        current_menu = menus_to_check.pop(0)
-                        if current_menu.isVisible():
-                            return False
-                        for action in current_menu.actions():
-                            if action.menu():
-                                menus_to_check.append(action.menu())
+            event_type = event.type()
+            if event_type == QEvent.Type.WindowDeactivate:
+                # 主菜单或任一子菜单可见时，失焦是由菜单导致的
+                for menu in self._menu_tree_cache:
+                    if menu.isVisible():
+                        return False
                 self.hide()
                 return False
             # 方案2: 鼠标点击时检查是否在窗口外（双重保险）
-            if event.type() == QEvent.Type.MouseButtonPress:
+            if event_type == QEvent.Type.MouseButtonPress:
                 try:
                     if hasattr(event, "globalPosition"):
                         pos = event.globalPosition().toPoint()
@@ -1638,15 +1677,9 @@ class OverlayWindow(QMainWindow):
                         pos = QCursor.pos()
                     
                     # 检查是否点击在菜单或其关联子菜单内
-                    if hasattr(self, 'window_menu'):
-                        menus_to_check = [self.window_menu]
-                        while menus_to_check:
-                            current_menu = menus_to_check.pop(0)
-                            if current_menu.isVisible() and current_menu.frameGeometry().contains(pos):
-                                return False
-                            for action in current_menu.actions():
-                                if action.menu():
-                                    menus_to_check.append(action.menu())
+                    for menu in self._menu_tree_cache:
+                        if menu.isVisible() and menu.frameGeometry().contains(pos):
+                            return False
                     
                     # 只有点击在窗口外且不在菜单内才隐藏
                     if not self.frameGeometry().contains(pos):
@@ -1724,18 +1757,24 @@ class OverlayWindow(QMainWindow):
             if self._dragging:
                 self._dragging = False
                 self._drag_pos = None
-                self._persist_window_position()
             elif self._resizing:
                 self._resizing = False
                 self._resize_edge = None
                 self._resize_start_geometry = None
                 self._resize_start_pos = None
-                self._persist_window_position()
-            self._persist_window_position()
+            # 拖动/缩放产生的 move/resize 事件已触发延迟保存，这里不再同步写盘
         super().mouseReleaseEvent(event)
 
+    def moveEvent(self, event) -> None:
+        """窗口移动事件：使菜单按钮坐标缓存失效，并延迟保存窗口位置"""
+        self._menu_btn_origin_cache = None
+        self._mark_geom_dirty()
+        super().moveEvent(event)
+
     def resizeEvent(self, event) -> None:
-        """窗口大小改变事件：更新按钮位置"""
+        """窗口大小改变事件：更新按钮位置，并延迟保存窗口大小"""
+        self._menu_btn_origin_cache = None
+        self._mark_geom_dirty()
         super().resizeEvent(event)
         self._update_button_positions()
 
@@ -1858,31 +1897,59 @@ class OverlayWindow(QMainWindow):
         else:
             self.setCursor(Qt.CursorShape.ArrowCursor)
 
-    def _persist_window_position(self) -> None:
+    def _mark_geom_dirty(self) -> None:
+        self._geom_dirty = True
+        self._geom_save_timer.start()  # 重新计时：拖动过程中只在停止 1 秒后写一次
+
+    def _flush_geom(self) -> None:
+        if not self._geom_dirty:
+            return
+        self._geom_dirty = False
+        self._persist_window_position(background=True)
+
+    def _persist_window_position(self, background: bool = False) -> None:
+        """在 GUI 线程采集偏好；background 为 True 时读改写配置文件交给后台线程。"""
         try:
             if not self.isVisible():
                 return
 
             pos = self.pos()
             size = self.size()
-            ConfigJsonStore(self._config_path).save_overlay_preferences(
-                OverlayPreferences(
-                    window_pos=WindowPoint(int(pos.x()), int(pos.y())),
-                    window_size=WindowSize(int(size.width()), int(size.height())),
-                    font_size=self.current_font_size,
-                    font_weight=self.current_font_weight,
-                    letter_spacing=self.current_letter_spacing,
-                    line_spacing=self.current_line_spacing,
-                    menu_direction=getattr(self, "_menu_direction", "right"),
-                    font_en=self.current_font_en,
-                    font_cn=self.current_font_cn,
-                    ocr_backend=getattr(self.config, "ocr_backend", "auto"),
-                    ocr_mode=getattr(self.config, "ocr_mode", "auto"),
-                )
+            preferences = OverlayPreferences(
+                window_pos=WindowPoint(int(pos.x()), int(pos.y())),
+                window_size=WindowSize(int(size.width()), int(size.height())),
+                font_size=self.current_font_size,
+                font_weight=self.current_font_weight,
+                letter_spacing=self.current_letter_spacing,
+                line_spacing=self.current_line_spacing,
+                menu_direction=getattr(self, "_menu_direction", "right"),
+                font_en=self.current_font_en,
+                font_cn=self.current_font_cn,
+                ocr_backend=getattr(self.config, "ocr_backend", "auto"),
+                ocr_mode=getattr(self.config, "ocr_mode", "auto"),
             )
+            # _persisted_preferences 也会被后台写线程改写，读写均持有 _persist_lock
+            with self._persist_lock:
+                if preferences == self._persisted_preferences:
+                    return
+                self._persisted_preferences = preferences
+            if background:
+                threading.Thread(target=self._write_preferences, args=(preferences,), daemon=True).start()
+            else:
+                self._write_preferences(preferences)
         except Exception:
             pass
 
+    def _write_preferences(self, preferences: OverlayPreferences) -> None:
+        with self._persist_lock:
+            # 已有更新的偏好待写时跳过旧快照，避免后台写入乱序覆盖
+            if preferences is not self._persisted_preferences:
+                return
+            try:
+                ConfigJsonStore(self._config_path).save_overlay_preferences(preferences)
+            except Exception:
+                self._persisted_preferences = None  # 写入失败，下次同步时重试
+
     def reset_window_position(self) -> None:
         screen = QGuiApplication.primaryScreen()
         if screen is None:
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Callable
 
 from ludiglot.ui.capture_session import ThreadStarter, start_daemon_thread
 from ludiglot.ui.hotkey_registrar import HotkeyBinding
 
+
+@lru_cache(maxsize=32)
 def convert_hotkey_for_pynput(hotkey: str) -> str:
     key = hotkey.lower().replace("ctrl", "<ctrl>").replace("shift", "<shift>")
     key = key.replace("alt", "<alt>").replace("win", "<cmd>")
@@ -20,18 +20,31 @@ class QtAudioControlsAdapter:
         self._time_label = time_label
         self._timer = timer
         self._status = status
+        self._last_time_text: str | None = None
+        # 按钮/滑块/计时器的上次状态：(enabled, playing, timer_running)
+        self._last_controls: tuple[bool, bool, bool] | None = None
 
     def apply(self, state: AudioControlsViewState) -> None:
-        self._play_pause_button.setEnabled(state.enabled)
-        self._play_pause_button.set_playing(state.playing)
-        self._slider.setEnabled(state.enabled)
+        controls = (state.enabled, state.playing, state.timer_running)
+        last = self._last_controls
+        if last is None or last[0] != state.enabled:
+            self._play_pause_button.setEnabled(state.enabled)
+            self._slider.setEnabled(state.enabled)
+        if last is None or last[1] != state.playing:
+            self._play_pause_button.set_playing(state.playing)
+        self._last_controls = controls
         if state.update_progress:
             self._slider.set_progress(state.progress, state.duration_ms)
-        self._time_label.setText(state.time_text)
-        if state.timer_running:
-            self._timer.start()
-        else:
-            self._timer.stop()
+        # 每 100ms 的进度刷新多数时候秒数未变，跳过重复 setText 以免触发文本重排
+        if state.time_text != self._last_time_text:
+            self._time_label.setText(state.time_text)
+            self._last_time_text = state.time_text
+        # 计时器只在运行状态变化时切换；重复 start() 会重置计时周期
+        if last is None or last[2] != state.timer_running:
+            if state.timer_running:
+                self._timer.start()
+            else:
+                self._timer.stop()
         if state.status_message:
             self._status(state.status_message)
 
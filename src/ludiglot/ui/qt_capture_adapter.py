@@ -1,11 +1,24 @@
 from __future__ import annotations
 
+import os
+import sys
 from dataclasses import dataclass
 from typing import Any, Callable
 
-from PyQt6.QtCore import QSize, Qt, QRect
+from PyQt6.QtCore import QPoint, QRect
 from PyQt6.QtGui import QGuiApplication, QImage, QPixmap
 
+try:
+    import mss
+except Exception:
+    mss = None
+
+try:
+    from PIL import Image, ImageGrab
+except Exception:
+    Image = None
+    ImageGrab = None
+
 from ludiglot.core.capture import CaptureRegion
 from ludiglot.core.capture_input import (
     CaptureInputAdapters,
@@ -22,20 +35,61 @@ from ludiglot.core.selection_geometry import (
 )
 from ludiglot.ui.screen_selection import ScreenSelector
 
+# [框选] 坐标映射明细默认不输出，设置 LUDIGLOT_DEBUG_CAPTURE=1 开启；失败与警告始终输出
+_DEBUG_CAPTURE = os.environ.get("LUDIGLOT_DEBUG_CAPTURE") == "1"
+
+# mss 返回 BGRX 字节序；小端机器上与 Format_RGB32 的内存布局一致（忽略 alpha）
+_BGRX_QIMAGE_FORMAT = QImage.Format.Format_RGB32 if sys.byteorder == "little" else None
+
+
+@dataclass(frozen=True)
+class _RawDesktopFrame:
+    """mss 原始 BGRX 整帧；裁剪时只解码选区，不预先把整幅桌面转换成 RGB。"""
+
+    data: bytes
+    width: int
+    height: int
+
+    def crop(self, box: tuple[int, int, int, int]):
+        left, top, right, bottom = box
+        size = (right - left, bottom - top)
+        if size[0] <= 0 or size[1] <= 0:
+            return Image.new("RGB", (max(size[0], 0), max(size[1], 0)))
+        stride = self.width * 4
+        view = memoryview(self.data)[top * stride + left * 4:]
+        return Image.frombytes("RGB", size, view, "raw", "BGRX", stride, 1)
+
 
 @dataclass
 class DesktopSnapshot:
-    image: Any
+    image: Any  # PIL 图像，或 mss 路径下的 _RawDesktopFrame（同样提供 width/height/crop）
     left: int
     top: int
     monitors: list[MonitorGeometry]
-    screen_pixmaps: list[QPixmap]
+    # 整幅桌面背景只保留一份，各屏幕覆盖层按 screen_source_rects 中的源矩形取用
+    screen_background: QPixmap | None
+    screen_source_rects: list[QRect]
 
 
 class QtCaptureAdapter:
     def __init__(self, config: Any, log: Callable[[str], None]) -> None:
         self.config = config
         self.log = log
+        # mss 枚举显示器代价高（系统调用 + 原生资源），缓存到屏幕拓扑变化为止
+        self._mss_monitors: list[MonitorGeometry] | None = None
+        # QScreen -> QGuiApplication.screens() 下标，同样随屏幕拓扑变化失效
+        self._screen_index: dict[Any, int] | None = None
+        # 各屏幕几何/DPR 的纯数据快照，避免每次框选都跨 Qt 边界逐屏查询
+        self._screen_geometry_cache: list[ScreenGeometry] | None = None
+        # capture_force_dpr 的 (原始值, 解析结果)；原始值不变时不再重复 float 解析
+        self._dpr_override_cache: tuple[Any, float | None] = (None, None)
+        self._watch_screen_changes()
+
+    @property
+    def can_native_subcapture(self) -> bool:
+        """winrt 后端可直接截取子区域，未要求冻结屏幕时无需整屏预截图。"""
+        backend = str(getattr(self.config, "capture_backend", "mss")).lower()
+        return backend == "winrt" and not bool(getattr(self.config, "capture_freeze_screen", False))
 
     def capture_image_to_memory(self, selected_region: CaptureRegion | None, snapshot: DesktopSnapshot | None = None) -> Any:
         return capture_input_to_memory(
@@ -51,91 +105,104 @@ class QtCaptureAdapter:
 
     def capture_desktop_snapshot(self) -> DesktopSnapshot:
         backend = str(getattr(self.config, "capture_backend", "mss")).lower()
-        try:
-            import mss
-        except Exception as exc:
-            raise RuntimeError("缺少 mss，无法截图") from exc
-        try:
-            from PIL import Image, ImageGrab
-        except Exception as exc:
-            raise RuntimeError("缺少 Pillow，无法截图") from exc
+        if mss is None:
+            raise RuntimeError("缺少 mss，无法截图")
+        if Image is None:
+            raise RuntimeError("缺少 Pillow，无法截图")
 
+        frame: QImage | None = None
         with mss.mss() as sct:
             raw_monitors = sct.monitors
             if not raw_monitors:
                 raise RuntimeError("未检测到屏幕")
+            self._mss_monitors = [self._monitor_geometry_from_mapping(mon) for mon in raw_monitors]
             all_mon = raw_monitors[0]
             if backend == "winrt":
-                bbox = (
-                    all_mon["left"],
-                    all_mon["top"],
-                    all_mon["left"] + all_mon["width"],
-                    all_mon["top"] + all_mon["height"],
-                )
+                desktop = self._mss_monitors[0]
+                bbox = (desktop.left, desktop.top, desktop.left + desktop.width, desktop.top + desktop.height)
                 img = ImageGrab.grab(bbox=bbox, all_screens=True)
             else:
                 sct_img = sct.grab(all_mon)
-                img = Image.frombytes("RGB", sct_img.size, sct_img.bgra, "raw", "BGRX")
+                # bgra 属性每次访问都会复制整帧，只取一次
+                bgra = sct_img.bgra
+                width, height = sct_img.size
+                if _BGRX_QIMAGE_FORMAT is not None:
+                    img = _RawDesktopFrame(bgra, width, height)
+                    frame = QImage(bgra, width, height, width * 4, _BGRX_QIMAGE_FORMAT)
+                else:
+                    img = Image.frombytes("RGB", (width, height), bgra, "raw", "BGRX")
 
         monitors = normalize_monitors_to_image_size(
-            [self._monitor_geometry_from_mapping(mon) for mon in raw_monitors],
+            self._mss_monitors,
             image_width=img.width,
             image_height=img.height,
         )
         all_monitor = monitors[0]
-        screen_pixmaps = self._build_screen_pixmaps(img, monitors)
+        background, source_rects = self._build_screen_background(img, monitors, frame=frame)
         return DesktopSnapshot(
             image=img,
             left=int(all_monitor.left),
             top=int(all_monitor.top),
             monitors=monitors,
-            screen_pixmaps=screen_pixmaps,
+            screen_background=background,
+            screen_source_rects=source_rects,
         )
 
     def crop_snapshot(self, snapshot: DesktopSnapshot, region: CaptureRegion):
+        image = snapshot.image
         box = crop_box_for_snapshot_region(
             snapshot_left=snapshot.left,
             snapshot_top=snapshot.top,
-            snapshot_width=snapshot.image.width,
-            snapshot_height=snapshot.image.height,
+            snapshot_width=image.width,
+            snapshot_height=image.height,
             region=region,
         )
-        return snapshot.image.crop(box)
+        # 选区覆盖整幅 PIL 快照时直接复用（下游只读），避免整帧复制
+        if box == (0, 0, image.width, image.height) and not isinstance(image, _RawDesktopFrame):
+            return image
+        return image.crop(box)
 
     def select_region(self, snapshot: DesktopSnapshot | None = None) -> CaptureRegion | None:
         """选择屏幕区域并转换为物理像素坐标（适配多屏不同DPI）。"""
-        selector = ScreenSelector(snapshot.screen_pixmaps if snapshot else None)
+        if snapshot is not None:
+            selector = ScreenSelector(snapshot.screen_background, snapshot.screen_source_rects)
+        else:
+            selector = ScreenSelector()
         rect = selector.get_region()
 
         if rect is None or rect.width() <= 0 or rect.height() <= 0:
             return None
 
-        print(f"[框选] 逻辑坐标: {rect}")
+        debug = _DEBUG_CAPTURE
+        if debug:
+            print(f"[框选] 逻辑坐标: {rect}")
         rect_model = self._rect_from_qrect(rect)
         screens = self._screen_geometries()
+        screen_index = self._screen_index_at(
+            QPoint(rect_model.x + rect_model.width // 2, rect_model.y + rect_model.height // 2)
+        )
 
         if snapshot is not None:
             try:
-                mapping = map_selection_to_capture_region(rect_model, screens, monitors=snapshot.monitors)
+                mapping = map_selection_to_capture_region(
+                    rect_model,
+                    screens,
+                    monitors=snapshot.monitors,
+                    screen_index=screen_index,
+                )
                 if mapping.source == "snapshot-monitor":
-                    print(f"[框选] 快照映射: MSS Monitor={mapping.monitor}")
-                    print(f"[框选] 快照缩放: sx={mapping.scale_x:.3f}, sy={mapping.scale_y:.3f}")
-                    print(
-                        f"[框选] 最终物理坐标: ({mapping.region.left}, {mapping.region.top}, "
-                        f"{mapping.region.width}, {mapping.region.height})"
-                    )
+                    if debug:
+                        print(f"[框选] 快照映射: MSS Monitor={mapping.monitor}")
+                        print(f"[框选] 快照缩放: sx={mapping.scale_x:.3f}, sy={mapping.scale_y:.3f}")
+                        print(
+                            f"[框选] 最终物理坐标: ({mapping.region.left}, {mapping.region.top}, "
+                            f"{mapping.region.width}, {mapping.region.height})"
+                        )
                     return mapping.region
             except Exception as e:
                 print(f"[框选] 快照映射失败: {e}，回退到实时坐标映射")
 
-        dpr_override = None
-        override_raw = getattr(self.config, "capture_force_dpr", None)
-        if override_raw is not None:
-            try:
-                dpr_override = float(override_raw)
-            except Exception:
-                pass
-
+        dpr_override = self._dpr_override()
         monitors = self._current_mss_monitors()
         mapping = map_selection_to_capture_region(
             rect_model,
@@ -143,43 +210,42 @@ class QtCaptureAdapter:
             monitors=monitors,
             dpr_override=dpr_override,
             use_monitor_scale=False,
+            screen_index=screen_index,
         )
-        screen = next((item for item in screens if item.index == mapping.screen_index), screens[0] if screens else None)
-        screen_name = screen.name if screen else ""
-        suffix = " (override)" if dpr_override is not None else ""
-        print(f"[框选] 命中屏幕: {screen_name} (Index {mapping.screen_index}), DPR: {mapping.scale_x}{suffix}")
-
-        if mapping.source == "dpr-monitor":
-            print(f"[框选] MSS Monitor: {mapping.monitor}")
-        elif monitors:
+        if mapping.source != "dpr-monitor" and monitors:
             print("[框选] 警告：MSS 屏幕数量不匹配，回退到主屏估算")
-
-        print(
-            f"[框选] 最终物理坐标: ({mapping.region.left}, {mapping.region.top}, "
-            f"{mapping.region.width}, {mapping.region.height})"
-        )
+        if debug:
+            screen = next((item for item in screens if item.index == mapping.screen_index), screens[0] if screens else None)
+            screen_name = screen.name if screen else ""
+            suffix = " (override)" if dpr_override is not None else ""
+            print(f"[框选] 命中屏幕: {screen_name} (Index {mapping.screen_index}), DPR: {mapping.scale_x}{suffix}")
+            if mapping.source == "dpr-monitor":
+                print(f"[框选] MSS Monitor: {mapping.monitor}")
+            print(
+                f"[框选] 最终物理坐标: ({mapping.region.left}, {mapping.region.top}, "
+                f"{mapping.region.width}, {mapping.region.height})"
+            )
         return mapping.region
 
-    def _pil_to_pixmap(self, img, target_size: QSize | None = None) -> QPixmap:
-        try:
-            from PIL import Image
-        except Exception as exc:
-            raise RuntimeError("缺少 Pillow，无法生成截图背景") from exc
+    def _pil_to_pixmap(self, img) -> QPixmap:
+        if Image is None:
+            raise RuntimeError("缺少 Pillow，无法生成截图背景")
         if not isinstance(img, Image.Image):
             raise RuntimeError("无效截图对象，无法生成截图背景")
-        if img.mode != "RGBA":
-            img = img.convert("RGBA")
-        data = img.tobytes("raw", "RGBA")
-        qimage = QImage(data, img.width, img.height, QImage.Format.Format_RGBA8888)
-        qimage = qimage.copy()
-        pixmap = QPixmap.fromImage(qimage)
-        if target_size and (pixmap.width() != target_size.width() or pixmap.height() != target_size.height()):
-            pixmap = pixmap.scaled(
-                target_size,
-                Qt.AspectRatioMode.IgnoreAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-        return pixmap
+        if img.mode == "RGB":
+            # mss 截图为 RGB：直接按 RGB888 包装，省去整帧 RGBA 转换
+            data = img.tobytes("raw", "RGB")
+            image_format = QImage.Format.Format_RGB888
+            bytes_per_line = img.width * 3
+        else:
+            if img.mode != "RGBA":
+                img = img.convert("RGBA")
+            data = img.tobytes("raw", "RGBA")
+            image_format = QImage.Format.Format_RGBA8888
+            bytes_per_line = img.width * 4
+        # QImage 只借用 data 的缓冲区；fromImage 会深拷贝像素，因此无需再 QImage.copy()
+        qimage = QImage(data, img.width, img.height, bytes_per_line, image_format)
+        return QPixmap.fromImage(qimage)
 
     def _monitor_geometry_from_mapping(self, monitor: dict) -> MonitorGeometry:
         return MonitorGeometry(
@@ -205,31 +271,89 @@ class QtCaptureAdapter:
         )
 
     def _screen_geometries(self) -> list[ScreenGeometry]:
-        return [self._screen_geometry_from_qscreen(screen, idx) for idx, screen in enumerate(QGuiApplication.screens())]
+        if self._screen_geometry_cache is None:
+            self._screen_geometry_cache = [
+                self._screen_geometry_from_qscreen(screen, idx) for idx, screen in enumerate(QGuiApplication.screens())
+            ]
+        return self._screen_geometry_cache
 
     def _current_mss_monitors(self) -> list[MonitorGeometry]:
-        try:
-            import mss
-            with mss.mss() as sct:
-                return [self._monitor_geometry_from_mapping(mon) for mon in sct.monitors]
-        except Exception:
-            return []
-
-    def _build_screen_pixmaps(self, desktop_img, monitors: list[MonitorGeometry]) -> list[QPixmap]:
-        screens = QGuiApplication.screens()
+        if self._mss_monitors is None:
+            if mss is None:
+                return []
+            try:
+                with mss.mss() as sct:
+                    self._mss_monitors = [self._monitor_geometry_from_mapping(mon) for mon in sct.monitors]
+            except Exception:
+                return []
+        return self._mss_monitors
+
+    def _dpr_override(self) -> float | None:
+        raw = getattr(self.config, "capture_force_dpr", None)
+        cached_raw, cached_value = self._dpr_override_cache
+        if raw == cached_raw:
+            return cached_value
+        value = None
+        if raw is not None:
+            try:
+                value = float(raw)
+            except Exception:
+                pass
+        self._dpr_override_cache = (raw, value)
+        return value
+
+    def _screen_index_at(self, point: QPoint) -> int | None:
+        """一次原生 screenAt 调用定位选区所在屏幕；未命中时返回 None，由几何映射按中心点查找。"""
+        screen = QGuiApplication.screenAt(point)
+        if screen is None:
+            return None
+        if self._screen_index is None:
+            self._screen_index = {item: idx for idx, item in enumerate(QGuiApplication.screens())}
+        return self._screen_index.get(screen)
+
+    def _watch_screen_changes(self) -> None:
+        app = QGuiApplication.instance()
+        if app is None:
+            return
+        app.screenAdded.connect(self._on_screen_added)
+        app.screenRemoved.connect(self._invalidate_screen_cache)
+        app.primaryScreenChanged.connect(self._invalidate_screen_cache)
+        for screen in app.screens():
+            self._watch_screen(screen)
+
+    def _watch_screen(self, screen) -> None:
+        screen.geometryChanged.connect(self._invalidate_screen_cache)
+        screen.logicalDotsPerInchChanged.connect(self._invalidate_screen_cache)
+
+    def _on_screen_added(self, screen) -> None:
+        self._watch_screen(screen)
+        self._invalidate_screen_cache()
+
+    def _invalidate_screen_cache(self, *_args) -> None:
+        self._mss_monitors = None
+        self._screen_index = None
+        self._screen_geometry_cache = None
+
+    def _build_screen_background(
+        self,
+        desktop_img,
+        monitors: list[MonitorGeometry],
+        frame: QImage | None = None,
+    ) -> tuple[QPixmap | None, list[QRect]]:
+        """整幅桌面只转换一次 QPixmap；返回每个屏幕在其中的源矩形（图像像素），缩放交给绘制时完成。
+
+        frame 为 mss 原始 BGRX 帧时直接转换，跳过 PIL 像素转换。
+        """
         if not monitors:
-            return []
+            return None, []
+        background = QPixmap.fromImage(frame) if frame is not None else self._pil_to_pixmap(desktop_img)
         all_mon = monitors[0]
-        pixmaps: list[QPixmap] = []
-        for idx, screen in enumerate(screens):
+        full_rect = QRect(0, 0, background.width(), background.height())
+        source_rects: list[QRect] = []
+        for idx in range(len(QGuiApplication.screens())):
             if idx + 1 < len(monitors):
                 mon = monitors[idx + 1]
-                crop_left = mon.left - all_mon.left
-                crop_top = mon.top - all_mon.top
-                crop_right = crop_left + mon.width
-                crop_bottom = crop_top + mon.height
-                crop = desktop_img.crop((crop_left, crop_top, crop_right, crop_bottom))
+                source_rects.append(QRect(mon.left - all_mon.left, mon.top - all_mon.top, mon.width, mon.height))
             else:
-                crop = desktop_img
-            pixmaps.append(self._pil_to_pixmap(crop, screen.geometry().size()))
-        return pixmaps
+                source_rects.append(full_rect)
+        return background, source_rects
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Callable
 
 from PyQt6.QtCore import QAbstractNativeEventFilter
@@ -18,7 +19,9 @@ class WinHotkeySpec:
     vk: int
 
 
+@lru_cache(maxsize=32)
 def parse_win_hotkey(hotkey: str) -> WinHotkeySpec | None:
+    """解析结果只依赖热键字符串，重复注册时直接复用。"""
     parts = [p.strip().lower() for p in hotkey.split("+") if p.strip()]
     if not parts:
         return None
@@ -6,7 +6,7 @@ from PyQt6.QtGui import QFont, QTextBlockFormat, QTextCharFormat, QTextCursor
 from PyQt6.QtWidgets import QTextEdit
 
 from ludiglot.core.display_shaper import DisplayPreferences, convert_game_html
-from ludiglot.core.preferences import FONT_SIZE_MAX, FONT_SIZE_MIN
+from ludiglot.core.preferences import clamp_font_size
 from ludiglot.ui.result_presentation_controller import CurrentDisplayState
 
 
@@ -23,6 +23,8 @@ class QtResultPresentationAdapter:
         self._target_editor = target_editor
         self._show_single_result = show_single_result
         self._show_multi_result = show_multi_result
+        # 每个编辑器最近一次写入的 (is_html, 内容)；内容相同则跳过 setHtml 的富文本重排
+        self._rendered: dict[QTextEdit, tuple[bool, str]] = {}
 
     def apply_display_state(self, state: CurrentDisplayState, preferences: DisplayPreferences) -> None:
         self._render_current_state(state, preferences, render_empty=False)
@@ -72,13 +74,21 @@ class QtResultPresentationAdapter:
         render_empty: bool,
     ) -> None:
         if text is None:
-            if render_empty:
-                editor.setPlainText("")
+            if not render_empty:
+                return
+            is_html, content = False, ""
+        elif is_html:
+            content = convert_game_html(text, lang=lang, preferences=preferences)
+        else:
+            content = text
+        rendered = (is_html, content)
+        if self._rendered.get(editor) == rendered:
             return
         if is_html:
-            editor.setHtml(convert_game_html(text, lang=lang, preferences=preferences))
+            editor.setHtml(content)
         else:
-            editor.setPlainText(text)
+            editor.setPlainText(content)
+        self._rendered[editor] = rendered
 
     def _apply_current_styles(self, state: CurrentDisplayState, preferences: DisplayPreferences) -> None:
         en_font, cn_font = self._build_content_fonts(preferences)
@@ -98,11 +108,7 @@ class QtResultPresentationAdapter:
         )
 
     def _build_content_fonts(self, preferences: DisplayPreferences) -> tuple[QFont, QFont]:
-        try:
-            size_val = int(preferences.font_size) if preferences.font_size else 13
-        except (ValueError, TypeError):
-            size_val = 13
-        valid_size = max(FONT_SIZE_MIN, min(FONT_SIZE_MAX, size_val))
+        valid_size = clamp_font_size(preferences.font_size or None)
 
         weight_map = {
             "300": QFont.Weight.Light,
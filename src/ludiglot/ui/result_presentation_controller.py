@@ -5,6 +5,7 @@ import traceback
 from dataclasses import dataclass
 from typing import Any, Callable, Protocol
 
+from ludiglot.core.capture_match_workflow import _PERF_TRACE
 from ludiglot.core.display_shaper import (
     DisplayAudioCandidate,
     DisplayPreferences,
@@ -60,6 +61,7 @@ class ResultPresentationController:
         log: Callable[[str], None],
         error: Callable[[str], None],
         clock: Callable[[], float] = time.time,
+        perf_trace: bool = _PERF_TRACE,
     ) -> None:
         self._config_provider = config_provider
         self._preferences_provider = preferences_provider
@@ -72,6 +74,7 @@ class ResultPresentationController:
         self._log = log
         self._error = error
         self._clock = clock
+        self._perf_trace = perf_trace
         self._current_display_state = CurrentDisplayState()
 
     @property
@@ -79,9 +82,14 @@ class ResultPresentationController:
         return self._current_display_state
 
     def present_result(self, result: dict[str, Any]) -> None:
-        t_show_start = self._clock()
-        self._log("[DEBUG] _show_result called")
-        self._log("[PERF] _show_result 开始")
+        # 本次展示的日志先收集，结束时合并为一次回调（跨线程信号 + log_box 追加只发生一次）
+        log_lines: list[str] = []
+        log = log_lines.append
+        trace = self._perf_trace
+        if trace:
+            t_show_start = self._clock()
+            log("[DEBUG] _show_result called")
+            log("[PERF] _show_result 开始")
 
         try:
             self._audio.stop(emit_status=False)
@@ -97,28 +105,35 @@ class ResultPresentationController:
                 voice_event_index=self._voice_event_index_provider(),
             )
 
-            self._log("[WINDOW] 设置文本内容")
+            log("[WINDOW] 设置文本内容")
             self._current_display_state = CurrentDisplayState.from_model(model)
             self._view.apply_display_state(self._current_display_state, preferences)
 
-            for line in model.log_lines:
-                self._log(line)
+            log_lines.extend(model.log_lines)
 
-            t_audio = self._clock()
+            if trace:
+                t_audio = self._clock()
             has_audio = self._audio.load_result_candidate(model.audio_candidate, is_multi=model.is_multi)
-            self._log(f"[PERF] 音频解析: {(self._clock()-t_audio)*1000:.1f}ms")
+            if trace:
+                log(f"[PERF] 音频解析: {(self._clock()-t_audio)*1000:.1f}ms")
 
             self._view.activate_for_result(is_multi=model.is_multi)
 
             if getattr(self._config_provider(), "play_audio", False) and has_audio and self._audio.has_current_audio:
-                self._log("[DEBUG] Calling play_audio...")
+                if trace:
+                    log("[DEBUG] Calling play_audio...")
                 self._audio.play_current()
-                self._log("[DEBUG] play_audio returned.")
+                if trace:
+                    log("[DEBUG] play_audio returned.")
 
-            self._log(f"[PERF] _show_result 总耗时: {(self._clock()-t_show_start)*1000:.1f}ms")
+            if trace:
+                log(f"[PERF] _show_result 总耗时: {(self._clock()-t_show_start)*1000:.1f}ms")
         except Exception as exc:
             self._error(f"显示结果失败: {exc}")
-            self._log(f"[ERROR] {traceback.format_exc()}")
+            log(f"[ERROR] {traceback.format_exc()}")
+        finally:
+            if log_lines:
+                self._log("\n".join(log_lines))
 
     def refresh_font_settings(self) -> None:
         self._view.refresh_font_settings(self._current_display_state, self._preferences_provider())
@@ -0,0 +1,40 @@
+"""运行时资源初始化线程 adapter。"""
+from __future__ import annotations
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from ludiglot.core.config import AppConfig
+from ludiglot.core.ocr import OCREngine
+from ludiglot.core.overlay_runtime import (
+    OverlayRuntimeCallbacks,
+    OverlayRuntimeInitResult,
+    initialize_overlay_runtime,
+)
+
+
+class RuntimeInitThread(QThread):
+    """后台线程：构建/加载数据库、语音索引与音频缓存，避免阻塞 GUI。"""
+
+    init_finished = pyqtSignal(object)  # OverlayRuntimeInitResult；不覆盖 QThread 自带的 finished
+
+    def __init__(
+        self,
+        config: AppConfig,
+        engine: OCREngine,
+        callbacks: OverlayRuntimeCallbacks,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.config = config
+        self.engine = engine
+        self.callbacks = callbacks
+
+    def run(self):
+        try:
+            result = initialize_overlay_runtime(self.config, self.engine, self.callbacks)
+        except Exception as e:
+            message = f"运行时资源初始化失败: {e}"
+            if self.callbacks.error:
+                self.callbacks.error(message)
+            result = OverlayRuntimeInitResult(False, error_message=message)
+        self.init_finished.emit(result)
@@ -1,19 +1,39 @@
 from __future__ import annotations
 
-from PyQt6.QtCore import QObject, QEventLoop, QPoint, QRect, Qt, pyqtSignal
+import traceback
+
+from PyQt6.QtCore import QObject, QEventLoop, QRect, Qt, pyqtSignal
 from PyQt6.QtGui import QColor, QPainter, QPixmap, QGuiApplication
 from PyQt6.QtWidgets import QRubberBand, QWidget
 
 
+def _normalized_span(origin: int, pos: int) -> tuple[int, int]:
+    """与 QRect(origin, pos).normalized() 在单轴上的结果一致：(起点, 长度)。"""
+    if pos < origin - 1:
+        return pos + 1, origin - pos - 1
+    return origin, pos - origin + 1
+
+
 class ScreenOverlay(QWidget):
     """单屏幕覆盖窗口"""
-    region_selected = pyqtSignal(QRect)
-
-    def __init__(self, screen, background: QPixmap | None = None, parent=None):
+    # 全局逻辑坐标 (x, y, width, height)；取消时发出全 0
+    region_selected = pyqtSignal(int, int, int, int)
+    _MASK_COLOR = QColor(0, 0, 0, 80)  # 半透明遮罩
+
+    def __init__(
+        self,
+        screen,
+        background: QPixmap | None = None,
+        source_rect: QRect | None = None,
+        parent=None,
+    ):
         super().__init__(parent)
         self._screen = screen
+        # background 为所有覆盖层共享的整幅桌面；source_rect 为本屏幕在其中的区域，None 表示整幅
         self._background = background
+        self._source_rect = source_rect
         self.setGeometry(screen.geometry()) # 逻辑坐标
+        self._paint_rect = self.rect()
 
         self.setWindowFlags(
             Qt.WindowType.FramelessWindowHint
@@ -26,41 +46,56 @@ class ScreenOverlay(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
 
         self.rubber_band: QRubberBand | None = None
-        self.origin: QPoint | None = None
+        # 按下位置的整数坐标；拖动时直接按整数设置橡皮筋几何，不再逐事件构造 QRect
+        self._origin: tuple[int, int] | None = None
+
+    def resizeEvent(self, event) -> None:
+        self._paint_rect = self.rect()
+        super().resizeEvent(event)
 
     def paintEvent(self, event) -> None:
         painter = QPainter(self)
         if not painter.isActive(): return
+        rect = self._paint_rect
         if self._background is not None:
-            painter.drawPixmap(self.rect(), self._background)
-        painter.fillRect(self.rect(), QColor(0, 0, 0, 80)) # 半透明遮罩
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+            if self._source_rect is not None:
+                painter.drawPixmap(rect, self._background, self._source_rect)
+            else:
+                painter.drawPixmap(rect, self._background)
+        painter.fillRect(rect, self._MASK_COLOR)
         painter.end()
 
     def mousePressEvent(self, event) -> None:
-        self.origin = event.pos()
+        pos = event.pos()
+        self._origin = (pos.x(), pos.y())
         if self.rubber_band is None:
             self.rubber_band = QRubberBand(QRubberBand.Shape.Rectangle, self)
-        if self.origin:
-            self.rubber_band.setGeometry(QRect(self.origin, event.pos()).normalized())
+        self.rubber_band.setGeometry(self._origin[0], self._origin[1], 1, 1)
         self.rubber_band.show()
 
     def mouseMoveEvent(self, event) -> None:
-        if self.rubber_band and self.origin:
-            self.rubber_band.setGeometry(QRect(self.origin, event.pos()).normalized())
+        origin = self._origin
+        if self.rubber_band and origin:
+            pos = event.pos()
+            left, width = _normalized_span(origin[0], pos.x())
+            top, height = _normalized_span(origin[1], pos.y())
+            self.rubber_band.setGeometry(left, top, width, height)
 
     def mouseReleaseEvent(self, event) -> None:
-        if self.rubber_band and self.origin:
+        if self.rubber_band and self._origin:
             rect = self.rubber_band.geometry().normalized()
+            # 隐藏而非销毁：同一覆盖层再次按下时直接复用
+            self.rubber_band.hide()
             # 转换为全局逻辑坐标
             global_top_left = self.mapToGlobal(rect.topLeft())
-            global_rect = QRect(global_top_left, rect.size())
-            self.region_selected.emit(global_rect)
+            self.region_selected.emit(global_top_left.x(), global_top_left.y(), rect.width(), rect.height())
         else:
-            self.region_selected.emit(QRect())
+            self.region_selected.emit(0, 0, 0, 0)
 
     def keyPressEvent(self, event) -> None:
         if event.key() == Qt.Key.Key_Escape:
-            self.region_selected.emit(QRect())
+            self.region_selected.emit(0, 0, 0, 0)
         else:
             super().keyPressEvent(event)
 
@@ -69,24 +104,34 @@ class ScreenSelector(QObject):
     """全屏选区控制器，管理多屏覆盖窗口。"""
     region_selected_signal = pyqtSignal(QRect)
 
-    def __init__(self, backgrounds: list[QPixmap] | None = None) -> None:
+    def __init__(self, background: QPixmap | None = None, source_rects: list[QRect] | None = None) -> None:
         super().__init__()
+        self._background = background
+        self._source_rects = source_rects or []
         self._overlays: list[ScreenOverlay] = []
         self._selected_rect: QRect | None = None
         self._loop: QEventLoop | None = None
 
-        # 为每个屏幕创建一个覆盖窗口
-        screens = QGuiApplication.screens()
-        for idx, screen in enumerate(screens):
-            bg = backgrounds[idx] if backgrounds and idx < len(backgrounds) else None
-            overlay = ScreenOverlay(screen, bg)
+    def _create_overlays(self) -> None:
+        # 为每个屏幕创建一个覆盖窗口；仅在真正框选时创建，结束后立即释放
+        source_rects = self._source_rects
+        for idx, screen in enumerate(QGuiApplication.screens()):
+            source_rect = source_rects[idx] if idx < len(source_rects) else None
+            overlay = ScreenOverlay(screen, self._background, source_rect)
             overlay.region_selected.connect(self._on_region_selected)
             self._overlays.append(overlay)
-
         print(f"[ScreenSelector] 已初始化 {len(self._overlays)} 个屏幕覆盖层")
 
+    def _release_overlays(self) -> None:
+        for overlay in self._overlays:
+            overlay.region_selected.disconnect(self._on_region_selected)
+            overlay.close()
+            overlay.deleteLater()
+        self._overlays.clear()
+
     def get_region(self) -> QRect | None:
         try:
+            self._create_overlays()
             self._loop = QEventLoop()
 
             for overlay in self._overlays:
@@ -94,20 +139,21 @@ class ScreenSelector(QObject):
                 overlay.raise_()
                 overlay.activateWindow()
 
-            self._loop.exec()
+            # 退出码 1 表示已记录有效选区，0 表示取消
+            if self._loop.exec() != 1:
+                return None
             return self._selected_rect
         except Exception as e:
             print(f"[ScreenSelector ERROR] {e}")
-            import traceback
             traceback.print_exc()
             return None
         finally:
-            for overlay in self._overlays:
-                overlay.close()
+            self._release_overlays()
 
-    def _on_region_selected(self, rect: QRect) -> None:
-        # 当任意一个屏幕完成了选区，保存结果并退出循环
-        if not rect.isNull():
-            self._selected_rect = rect
+    def _on_region_selected(self, x: int, y: int, width: int, height: int) -> None:
+        # 当任意一个屏幕完成了选区，保存结果并退出循环；空选区（含取消）不记录
+        selected = width > 0 and height > 0
+        if selected:
+            self._selected_rect = QRect(x, y, width, height)
         if self._loop and self._loop.isRunning():
-            self._loop.quit()
+            self._loop.exit(1 if selected else 0)
@@ -68,14 +68,10 @@ class FakePlayer:
 class FakeControls:
     def __init__(self):
         self.states = []
-        self.dragging = False
 
     def apply(self, state):
         self.states.append(state)
 
-    def is_dragging(self):
-        return self.dragging
-
 
 class FakeClock:
     def __init__(self, value=100.0):
@@ -275,6 +271,23 @@ def test_seek_finished_while_playing_keeps_playing_controls():
     assert controls.states[-1].timer_running is True
 
 
+def test_seek_uses_playing_state_captured_when_drag_started():
+    controller, _, player, controls, _, _ = make_controller()
+    player.playing = True
+    player.duration = 80_000
+
+    controller.seek_started()
+    player.playing = False
+    controller.seek_finished(0.5)
+
+    assert controls.states[-1].playing is True
+
+    controller.seek_started()
+    controller.seek_finished(0.25)
+
+    assert controls.states[-1].playing is False
+
+
 def test_update_progress_within_seek_debounce_does_not_overwrite_progress():
     controller, _, player, controls, clock, _ = make_controller()
     player.duration = 80_000
@@ -307,9 +320,48 @@ def test_update_progress_while_dragging_does_not_overwrite_slider_progress():
     player.playing = True
     player.position = 0.25
     player.duration = 100_000
-    controls.dragging = True
+    controller.seek_started()
 
     controller.update_progress()
 
     assert controls.states[-1].time_text == "00:25 / 01:40"
     assert controls.states[-1].update_progress is False
+
+
+def test_update_progress_after_seek_released_resumes_slider_updates():
+    controller, _, player, controls, clock, _ = make_controller()
+    player.playing = True
+    player.duration = 100_000
+    clock.value = 10.0
+    controller.seek_started()
+    controller.seek_finished(0.5)
+    player.position = 0.6
+    clock.value = 11.0
+
+    controller.update_progress()
+
+    assert controls.states[-1].update_progress is True
+
+
+def test_progress_timer_runs_only_while_audio_is_playing(tmp_path):
+    runtime = FakeRuntime()
+    runtime.identity = identity("cache")
+    runtime.decision = AudioPlaybackDecision(enabled=True, path=tmp_path / "voice.wav", identity=identity("cache"))
+    controller, _, player, controls, clock, _ = make_controller(runtime=runtime)
+    player.duration = 10_000
+
+    controller.load_result_candidate(DisplayAudioCandidate(text_key="Text_Key", origin="single"), is_multi=False)
+    assert controls.states[-1].timer_running is False
+    controller.play_current()
+    assert controls.states[-1].timer_running is True
+    controller.toggle()
+    assert controls.states[-1].timer_running is False
+    controller.seek_started()
+    controller.seek_finished(0.5)
+    assert controls.states[-1].timer_running is False
+    controller.toggle()
+    assert controls.states[-1].timer_running is True
+    player.ended = True
+    clock.value += 1.0
+    controller.update_progress()
+    assert controls.states[-1].timer_running is False
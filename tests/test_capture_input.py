@@ -238,3 +238,13 @@ def test_select_mode_cancel_raises():
 def test_unknown_mode_raises():
     with pytest.raises(RuntimeError, match="未知 capture_mode: unknown"):
         capture_input_to_memory(CaptureInputOptions(capture_mode="unknown"))
+
+
+def test_pil_image_to_bgra_raw_matches_tobytes_for_large_rgb_image():
+    image = Image.new("RGB", (640, 480), (10, 20, 30))
+    image.putpixel((639, 479), (1, 2, 3))
+
+    raw, width, height = capture_input.pil_image_to_bgra_raw(image)
+
+    assert (width, height) == (640, 480)
+    assert raw == image.convert("RGBA").tobytes("raw", "BGRA")
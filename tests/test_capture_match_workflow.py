@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 
+from ludiglot.core import capture_match_workflow
 from ludiglot.core.capture_match_workflow import (
     CaptureProcessCallbacks,
     CaptureProcessRequest,
+    PipelinedCaptureMatchRunner,
     run_capture_match_workflow,
 )
 
@@ -112,7 +114,7 @@ def test_workflow_reports_missing_matcher():
     assert events["error"] == ["匹配服务未就绪"]
 
 
-def test_workflow_deepcopies_successful_result():
+def test_workflow_clones_successful_result():
     events, cb = callbacks()
     result = {"matches": [{"text_key": "A"}]}
     outcome = run_capture_match_workflow(
@@ -128,4 +130,148 @@ def test_workflow_deepcopies_successful_result():
     assert events["result"] == [result]
     assert events["result"][0] is not result
     assert events["result"][0]["matches"] is not result["matches"]
+    assert events["result"][0]["matches"][0] is not result["matches"][0]
     assert events["status"][-1] == "就绪"
+
+
+def test_workflow_result_debug_trace_is_opt_in(monkeypatch):
+    def run():
+        events, cb = callbacks()
+        run_capture_match_workflow(
+            CaptureProcessRequest(
+                capture_image=lambda: FakeImage(100, 50),
+                ocr_engine=FakeEngine([OcrResult([], [("Readable", 0.9)], "windows")]),
+                matcher=FakeMatcher({"matches": []}),
+            ),
+            cb,
+        )
+        return events["log"]
+
+    monkeypatch.setattr(capture_match_workflow, "_PERF_TRACE", False)
+    quiet = run()
+    monkeypatch.setattr(capture_match_workflow, "_PERF_TRACE", True)
+    traced = run()
+
+    assert not any(line.startswith("[DEBUG]") for line in quiet)
+    assert any(line.startswith("[PERF] ===== 总耗时") for line in quiet)
+    assert any(line.startswith("[PERF] 结果传递耗时") for line in traced)
+    assert sum(line.startswith("[DEBUG]") for line in traced) == 4
+
+
+def test_pipelined_runner_hands_matching_to_worker_in_order():
+    events, cb = callbacks()
+    runner = PipelinedCaptureMatchRunner()
+    outcomes = []
+    for text in ("First", "Second"):
+        outcomes.append(
+            runner(
+                CaptureProcessRequest(
+                    capture_image=lambda: FakeImage(100, 50),
+                    ocr_engine=FakeEngine([OcrResult([{"box": 1}], [(text, 0.9)], "paddle")]),
+                    matcher=FakeMatcher({"matches": [{"text_key": text}]}),
+                ),
+                cb,
+            )
+        )
+    runner.wait_idle()
+
+    assert [outcome.status for outcome in outcomes] == ["queued", "queued"]
+    assert [result["matches"][0]["text_key"] for result in events["result"]] == ["First", "Second"]
+
+
+def test_pipelined_runner_returns_ocr_stage_failures_directly():
+    events, cb = callbacks()
+    outcome = PipelinedCaptureMatchRunner()(
+        CaptureProcessRequest(
+            capture_image=lambda: FakeImage(100, 50),
+            ocr_engine=FakeEngine([OcrResult([], [], "paddle")]),
+            matcher=FakeMatcher(None),
+        ),
+        cb,
+    )
+
+    assert outcome.status == "no_text"
+    assert events["result"] == []
+
+
+def test_overlapping_captures_share_one_matcher_safely():
+    import threading
+
+    from ludiglot.core.matcher import TextMatcher
+    from ludiglot.core.text_builder import build_text_db_from_maps
+
+    db = build_text_db_from_maps(
+        {"MAIN_FIRST_001": "Stand still and listen.", "MAIN_SECOND_001": "The tide is turning now."},
+        {"MAIN_FIRST_001": "站住，听我说。", "MAIN_SECOND_001": "潮水正在转向。"},
+        "test.json",
+    )
+    matcher = TextMatcher(db)
+    match_logs = []
+    matcher.set_logger(match_logs.append)
+    entered = threading.Event()
+    release = threading.Event()
+    lookup_best = matcher._lookup_best
+
+    def blocking_lookup(lines):
+        entered.set()
+        release.wait(5)
+        return lookup_best(lines)
+
+    matcher._lookup_best = blocking_lookup
+    events, cb = callbacks()
+    runner = PipelinedCaptureMatchRunner()
+
+    def capture(text):
+        return runner(
+            CaptureProcessRequest(
+                capture_image=lambda: FakeImage(100, 50),
+                ocr_engine=FakeEngine([OcrResult([{"box": 1}], [(text, 0.95)], "paddle")]),
+                matcher=matcher,
+            ),
+            cb,
+        )
+
+    assert capture("Stand still and listen.").status == "queued"
+    assert entered.wait(5)
+    # 第一次匹配仍在进行时：第二次截图完成 OCR 并入队，GUI 线程查询被锁挡住
+    assert capture("The tide is turning now.").status == "queued"
+    gui_done = threading.Event()
+    gui_thread = threading.Thread(
+        target=lambda: (matcher.resolve_title_cn("Stand still"), matcher.search_key("the tide"), gui_done.set())
+    )
+    gui_thread.start()
+    assert not gui_done.wait(0.2)
+
+    release.set()
+    runner.wait_idle()
+    gui_thread.join(5)
+    runner.close()
+
+    assert gui_done.is_set()
+    assert [result["matches"][0]["text_key"] for result in events["result"]] == ["MAIN_FIRST_001", "MAIN_SECOND_001"]
+    assert events["error"] == []
+    assert runner._worker is not None and not runner._worker.is_alive()
+
+
+def test_pipelined_runner_close_stops_worker_and_matches_inline_afterwards():
+    events, cb = callbacks()
+    runner = PipelinedCaptureMatchRunner()
+
+    def capture(text):
+        return runner(
+            CaptureProcessRequest(
+                capture_image=lambda: FakeImage(100, 50),
+                ocr_engine=FakeEngine([OcrResult([{"box": 1}], [(text, 0.9)], "paddle")]),
+                matcher=FakeMatcher({"matches": [{"text_key": text}]}),
+            ),
+            cb,
+        )
+
+    assert capture("First").status == "queued"
+    runner.close()
+    worker = runner._worker
+
+    assert not worker.is_alive()
+    assert capture("Second").status == "success"
+    assert runner._worker is worker
+    assert [result["matches"][0]["text_key"] for result in events["result"]] == ["First", "Second"]
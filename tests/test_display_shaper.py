@@ -1,5 +1,6 @@
 from ludiglot.core.display_shaper import (
     DisplayPreferences,
+    contains_game_markup,
     convert_game_html,
     extract_numeric_values_from_context,
     resolve_display_placeholders,
@@ -110,6 +111,25 @@ def test_convert_game_html_escapes_unknown_markup_literals():
     assert "<unknown>" not in html
 
 
+def test_convert_game_html_converts_nested_and_bracket_only_markup():
+    nested = convert_game_html("<color=Highlight><size=18>【Lv 2】</size></color>", lang="en", preferences=prefs())
+    bracket_only = convert_game_html("【Echo】 &lt;te", lang="en", preferences=prefs())
+
+    assert (
+        '<span style="color: #fbbf24"><span style="font-size: 18pt">'
+        '<span style="color: #fbbf24; font-weight: bold;">【Lv 2】</span></span></span>'
+    ) in nested
+    assert '<span style="color: #fbbf24; font-weight: bold;">【Echo】</span> &amp;lt;te' in bracket_only
+
+
+def test_contains_game_markup_requires_a_tag_or_bracket():
+    assert contains_game_markup("<color=red>Hot</color>")
+    assert contains_game_markup("【Key】 term")
+    assert not contains_game_markup("")
+    assert not contains_game_markup("HP > 50% and ATK < 10")
+    assert not contains_game_markup("plain text")
+
+
 def test_shape_single_result_builds_display_model_and_audio_candidate():
     result = {
         "_query_key": "hello",
@@ -185,3 +205,12 @@ def test_shape_multi_result_uses_missing_chinese_fallback():
 
     assert model.target.display_text == "（未找到中文匹配）"
     assert model.audio_candidate is None
+
+
+def test_convert_game_html_reuses_render_for_same_text_and_preferences():
+    first = convert_game_html("<color=red>Hot</color>", lang="en", preferences=prefs())
+    again = convert_game_html("<color=red>Hot</color>", lang="en", preferences=prefs())
+    resized = convert_game_html("<color=red>Hot</color>", lang="en", preferences=prefs(font_size=20))
+
+    assert again is first
+    assert "font-size: 20pt" in resized
@@ -212,3 +212,7 @@ def test_pynput_registration_stop_stops_listener():
     registration.stop()
 
     assert keyboard.listeners[0].stop_calls == 1
+
+
+def test_parse_win_hotkey_reuses_cached_spec():
+    assert parse_win_hotkey("ctrl+shift+o") is parse_win_hotkey("ctrl+shift+o")
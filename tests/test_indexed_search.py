@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import pytest
+
+from ludiglot.core.indexed_search import IndexedSearchEngine, LengthBucketIndex, SubstringIndex
+
+
+KEYS = [
+    "standstill",
+    "standstillandlisten",
+    "listen",
+    "resonancefield",
+    "resonancefieldexpands",
+    "fieldexpands",
+    "echosetbonus",
+]
+
+
+def test_length_bucket_candidates_match_linear_bucket_scan() -> None:
+    index = LengthBucketIndex(KEYS)
+
+    candidates = index.get_candidates_by_length(14, tolerance=0.3)
+
+    assert sorted(candidates) == sorted(k for k in KEYS if 9 // 5 <= len(k) // 5 <= 18 // 5)
+
+
+def test_substring_index_length_slices_match_full_scan() -> None:
+    index = SubstringIndex(KEYS)
+    query = "resonancefieldexpandsnow"
+
+    assert sorted(index.find_contained_keys(query, KEYS)) == sorted(
+        k for k in KEYS if 10 <= len(k) <= len(query) and k in query
+    )
+    assert sorted(index.find_containing_keys("resonancefield", KEYS)) == [
+        "resonancefield",
+        "resonancefieldexpands",
+    ]
+    assert index.keys_in_length_range(12, 12) == ["fieldexpands", "echosetbonus"]
+
+
+def test_substring_index_automaton_matches_length_scan() -> None:
+    pytest.importorskip("ahocorasick")
+    keys = KEYS + ["standstillagain", "listentothetide", "echosetbonusx"]
+    index = SubstringIndex(keys)
+    fallback = SubstringIndex(keys)
+    fallback._automaton = None
+
+    assert index._automaton is not None
+    for query in ("resonancefieldexpandsnow", "standstillandlistentothetide", "echosetbonusxecho", "nothinghere"):
+        assert index.find_contained_keys(query, keys) == fallback.find_contained_keys(query, keys)
+
+
+def test_substring_index_returns_hits_in_database_order() -> None:
+    keys = ["fieldexpandsnowhere", "resonancefieldexpands", "resonancefield", "fieldexpands", "nonresonancefieldexpands"]
+    index = SubstringIndex(keys)
+    contained_query = "resonancefieldexpandsnowhere"
+    containing_query = "resonancefield"
+
+    assert index.find_contained_keys(contained_query, keys) == [
+        k for k in keys if 10 <= len(k) <= len(contained_query) and k in contained_query
+    ]
+    assert index.find_containing_keys(containing_query, keys) == [k for k in keys if containing_query in k]
+
+
+def test_mask_prefilter_drops_only_keys_that_cannot_reach_threshold() -> None:
+    engine = IndexedSearchEngine(KEYS)
+
+    kept = engine._mask_prefilter("standstilandlisten", KEYS, 0.85)
+
+    assert "standstillandlisten" in kept
+    assert "resonancefieldexpands" not in kept
+    assert engine.fuzzy_search("standstilandlisten", top_k=1, score_threshold=0.85)[0][0] == "standstillandlisten"
+
+
+def test_prefix_search_returns_shortest_hits_in_original_order() -> None:
+    keys = ["abcdz", "abcdy", "abcd", "abdxx", "ab"]
+    engine = IndexedSearchEngine(keys)
+
+    assert engine.prefix_search("abcd") == ["abcd", "abcdz", "abcdy"]
+    assert engine.prefix_search("abcd", max_results=1) == ["abcd"]
+    assert engine.prefix_search("ab") == []
+    assert engine.prefix_search("zzz") == []
+
+
+def test_fuzzy_search_many_matches_individual_searches() -> None:
+    queries = ["standstilandlisten", "echosetbonux", "resonancefieldexpand", "zzzzzzzz"]
+    single = IndexedSearchEngine(KEYS)
+    batched = IndexedSearchEngine(KEYS)
+
+    for top_k, threshold in ((1, 0.85), (3, 0.4)):
+        expected = [single.fuzzy_search(q, top_k=top_k, score_threshold=threshold) for q in queries]
+        assert batched.fuzzy_search_many(queries, top_k=top_k, score_threshold=threshold) == expected
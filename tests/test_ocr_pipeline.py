@@ -43,3 +43,17 @@ def test_recognize_with_confidence_uses_pipeline_lines() -> None:
         ("Hello Rover", 0.8500000000000001),
         ("Next line", 0.7),
     ]
+
+
+def test_windows_preprocess_returns_autocontrasted_bgra_raw() -> None:
+    from PIL import Image
+
+    engine = OCREngine(lang="en")
+    img = Image.new("RGB", (2, 1))
+    img.putpixel((0, 0), (100, 100, 100))
+    img.putpixel((1, 0), (150, 150, 150))
+
+    raw, width, height = engine._preprocess_windows_input(img)
+
+    assert (width, height) == (2, 1)
+    assert raw == bytes([0, 0, 0, 255, 255, 255, 255, 255])
@@ -61,7 +61,7 @@ def make_config(**overrides):
     return SimpleNamespace(**data)
 
 
-def make_session(config=None, adapter=None, thread_starter=None, workflow_runner=None):
+def make_session(config=None, adapter=None, thread_starter=None, workflow_runner=None, clock=None):
     events = []
     config_obj = config or make_config()
     adapter = adapter or FakeCaptureAdapter()
@@ -86,6 +86,7 @@ def make_session(config=None, adapter=None, thread_starter=None, workflow_runner
         clear_result_audio_state=lambda: events.append(("clear", None)),
         thread_starter=thread_starter,
         workflow_runner=workflow_runner or default_workflow,
+        **({"clock": clock} if clock is not None else {}),
     )
     return session, adapter, thread_starter, events
 
@@ -138,6 +139,51 @@ def test_force_select_overrides_config_mode():
     assert adapter.capture_calls == [(adapter.selected_region, adapter.snapshot)]
 
 
+def test_rapid_retrigger_reuses_recent_snapshot():
+    now = [10.0]
+    config = make_config(capture_mode="select", capture_backend="mss")
+    session, adapter, _, _ = make_session(config=config, clock=lambda: now[0])
+
+    session.trigger()
+    now[0] = 10.1
+    session.trigger()
+
+    assert adapter.snapshot_calls == 1
+    assert adapter.select_calls == [adapter.snapshot, adapter.snapshot]
+
+    now[0] = 10.5
+    session.trigger()
+
+    assert adapter.snapshot_calls == 2
+
+
+def test_snapshot_cache_is_dropped_on_backend_change_or_invalidate():
+    now = [10.0]
+    config = make_config(capture_mode="select", capture_backend="mss")
+    session, adapter, _, _ = make_session(config=config, clock=lambda: now[0])
+
+    session.trigger()
+    config.capture_backend = "winrt"
+    session.trigger()
+    session.invalidate_snapshot_cache()
+    session.trigger()
+
+    assert adapter.snapshot_calls == 3
+
+
+def test_native_subcapture_adapter_skips_desktop_snapshot():
+    adapter = FakeCaptureAdapter()
+    adapter.can_native_subcapture = True
+    session, adapter, _, events = make_session(config=make_config(capture_mode="select"), adapter=adapter)
+
+    session.trigger()
+
+    assert adapter.snapshot_calls == 0
+    assert adapter.select_calls == [None]
+    assert adapter.capture_calls == [(adapter.selected_region, None)]
+    assert ("status", "冻结屏幕…") not in events
+
+
 def test_snapshot_failure_falls_back_to_realtime_selection():
     adapter = FakeCaptureAdapter()
     adapter.snapshot_error = RuntimeError("boom")
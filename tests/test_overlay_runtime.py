@@ -126,6 +126,13 @@ def callbacks():
     )
 
 
+def must_not_call(message):
+    def fail(*args, **kwargs):
+        raise AssertionError(message)
+
+    return fail
+
+
 def patch_lightweight_runtime(monkeypatch):
     FakeSkillParamResolver.instances = []
     FakeVoiceEventIndex.instances = []
@@ -162,7 +169,8 @@ def test_rebuilds_db_from_data_root(monkeypatch, tmp_path):
     data_root.mkdir()
     saved = []
     monkeypatch.setattr(overlay_runtime, "build_text_db_from_root_all", lambda root: {"Built": {"cn": "构建"}})
-    monkeypatch.setattr(overlay_runtime, "save_text_db", lambda db, path: (saved.append((db, path)), path.write_text(json.dumps(db), encoding="utf-8")))
+    monkeypatch.setattr(overlay_runtime, "save_text_db", lambda db, path: saved.append((db, path)))
+    monkeypatch.setattr(overlay_runtime, "load_text_db", must_not_call("no reparse"))
     events, cb = callbacks()
 
     result = initialize_overlay_runtime(config(tmp_path, data_root=data_root, auto_rebuild_db=True), FakeEngine(), cb)
@@ -173,6 +181,34 @@ def test_rebuilds_db_from_data_root(monkeypatch, tmp_path):
     assert "构建文本数据库…" in events["status"]
 
 
+def test_empty_db_file_is_rebuilt_from_source(monkeypatch, tmp_path):
+    patch_lightweight_runtime(monkeypatch)
+    data_root = tmp_path / "data"
+    data_root.mkdir()
+    (tmp_path / "db.json").write_bytes(b"")
+    saved = []
+    monkeypatch.setattr(overlay_runtime, "build_text_db_from_root_all", lambda root: {"Built": {"cn": "构建"}})
+    monkeypatch.setattr(overlay_runtime, "save_text_db", lambda db, path: saved.append(path))
+    monkeypatch.setattr(overlay_runtime, "load_text_db", must_not_call("empty db must not be parsed"))
+    events, cb = callbacks()
+
+    result = initialize_overlay_runtime(config(tmp_path, data_root=data_root), FakeEngine(), cb)
+
+    assert result.success is True
+    assert result.resources.db == {"Built": {"cn": "构建"}}
+    assert saved == [tmp_path / "db.json"]
+    assert "构建文本数据库…" in events["status"]
+
+
+def test_db_file_usable_requires_non_empty_file(tmp_path):
+    db_path = tmp_path / "db.json"
+    assert overlay_runtime._db_file_usable(db_path) is False
+    db_path.write_bytes(b"")
+    assert overlay_runtime._db_file_usable(db_path) is False
+    db_path.write_text("{}", encoding="utf-8")
+    assert overlay_runtime._db_file_usable(db_path) is True
+
+
 def test_missing_db_and_source_reports_failure(tmp_path):
     events, cb = callbacks()
 
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+import types
+
+import pytest
+from PyQt6.QtCore import QPoint, Qt
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QApplication
+
+from ludiglot.core.config import AppConfig
+from ludiglot.ui import overlay_window
+from ludiglot.ui.audio_controls_presenter import AudioControlsPresenter
+
+
+class FakeHotkeys:
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def window(qapp, tmp_path, monkeypatch):
+    monkeypatch.setattr(overlay_window, "install_process_log_tee", lambda path: None)
+    monkeypatch.setattr(
+        overlay_window,
+        "create_overlay_ocr_engine",
+        lambda config, callbacks: types.SimpleNamespace(set_mode=lambda mode: None),
+    )
+    monkeypatch.setattr(overlay_window, "install_hotkey_registrar", lambda w: setattr(w, "_hotkeys", FakeHotkeys()))
+    monkeypatch.setattr(overlay_window, "install_runtime_initialization", lambda w: None)
+    (tmp_path / "fonts").mkdir()
+    config_path = tmp_path / "settings.json"
+    config_path.write_text("{}", encoding="utf-8")
+    config = AppConfig(
+        data_root=None,
+        en_json=tmp_path / "en.json",
+        zh_json=tmp_path / "zh.json",
+        db_path=tmp_path / "db.json",
+        image_path=tmp_path / "image.png",
+        fonts_root=tmp_path / "fonts",
+    )
+    win = overlay_window.OverlayWindow(config, config_path)
+    yield win
+    # 恢复配置时排了 150ms 的菜单方向单次定时器，先让其执行，再销毁窗口
+    QTest.qWait(200)
+    win.close()
+    win.deleteLater()
+
+
+def record_persists(monkeypatch, win):
+    calls = []
+    monkeypatch.setattr(win, "_persist_window_position", lambda background=False: calls.append(background))
+    return calls
+
+
+def test_audio_timer_only_runs_while_playing(window):
+    presenter = AudioControlsPresenter()
+
+    assert not window.audio_timer.isActive()
+    window.audio_controls_adapter.apply(presenter.playing("voice.wav", duration_ms=1000))
+    assert window.audio_timer.isActive()
+    window.audio_controls_adapter.apply(presenter.ended(1000))
+    assert not window.audio_timer.isActive()
+
+
+def test_move_persists_after_debounce(window, monkeypatch):
+    window.show()
+    window._geom_save_timer.setInterval(10)
+    calls = record_persists(monkeypatch, window)
+
+    window.move(window.x() + 15, window.y() + 10)
+    window.move(window.x() + 15, window.y() + 10)
+    assert calls == []
+    QTest.qWait(100)
+
+    assert calls == [True]
+
+
+def test_drag_release_leaves_saving_to_debounce(window, monkeypatch):
+    window.show()
+    window._geom_save_timer.setInterval(10)
+    calls = record_persists(monkeypatch, window)
+
+    window._dragging = True
+    window._drag_pos = QPoint(0, 0)
+    window.move(window.x() + 20, window.y() + 20)
+    QTest.mouseRelease(window, Qt.MouseButton.LeftButton, pos=QPoint(5, 5))
+    assert not window._dragging
+    assert calls == []
+    QTest.qWait(100)
+
+    assert calls == [True]
+
+
+def test_failed_write_is_retried(window, monkeypatch):
+    attempts = []
+
+    def flaky_save(store, preferences):
+        attempts.append(preferences)
+        if len(attempts) == 1:
+            raise OSError("disk full")
+
+    monkeypatch.setattr(overlay_window.ConfigJsonStore, "save_overlay_preferences", flaky_save)
+    window.show()
+
+    window._persist_window_position()
+    assert window._persisted_preferences is None
+    window._persist_window_position()
+
+    assert len(attempts) == 2
+    assert window._persisted_preferences is attempts[1]
+
+
+def test_ocr_menu_changes_persist_immediately(window, monkeypatch):
+    calls = record_persists(monkeypatch, window)
+
+    window.ocr_backend_group.actions()[1].trigger()
+    window.ocr_mode_group.actions()[2].trigger()
+
+    assert window.config.ocr_backend == "windows"
+    assert window.config.ocr_mode == "cpu"
+    assert calls == [False, False]
+
+
+def test_close_writes_preferences(window, tmp_path):
+    window.show()
+    window.move(120, 80)
+
+    window.close()
+
+    saved = json.loads((tmp_path / "settings.json").read_text(encoding="utf-8"))
+    assert saved["window_pos"] == {"x": 120, "y": 80}
+    assert not window._geom_save_timer.isActive()
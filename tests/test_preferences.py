@@ -1,11 +1,13 @@
 import json
 
+from ludiglot.core import preferences as preferences_module
 from ludiglot.core.preferences import (
     ConfigJsonStore,
     OverlayPreferences,
     WindowBounds,
     WindowPoint,
     WindowSize,
+    clamp_font_size,
     clamp_window_position,
     normalize_overlay_preferences,
 )
@@ -52,6 +54,21 @@ def test_save_overlay_preferences_preserves_unknown_fields(tmp_path):
     assert raw["font_cn"] == "CN"
 
 
+def test_save_overlay_preferences_matches_stdlib_json_output(tmp_path, monkeypatch):
+    preferences = OverlayPreferences(window_pos=WindowPoint(1, 2), font_cn="思源黑体")
+    fast_path = tmp_path / "fast.json"
+    plain_path = tmp_path / "plain.json"
+    for path in (fast_path, plain_path):
+        path.write_text(json.dumps({"data_root": "数据", "empty": {}}, ensure_ascii=False), encoding="utf-8")
+
+    ConfigJsonStore(fast_path).save_overlay_preferences(preferences)
+    monkeypatch.setattr(preferences_module, "_orjson", None)
+    ConfigJsonStore(plain_path).save_overlay_preferences(preferences)
+
+    assert fast_path.read_bytes() == plain_path.read_bytes()
+    assert ConfigJsonStore(fast_path).load_raw()["data_root"] == "数据"
+
+
 def test_save_overlay_preferences_normalizes_values(tmp_path):
     config_path = tmp_path / "settings.json"
     store = ConfigJsonStore(config_path)
@@ -170,3 +187,11 @@ def test_clamp_window_position_clamps_to_first_screen_when_offscreen():
 
 def test_clamp_window_position_keeps_original_without_screens():
     assert clamp_window_position(WindowPoint(50, 60), WindowSize(400, 300), []) == WindowPoint(50, 60)
+
+
+def test_clamp_font_size_bounds_and_falls_back_to_default():
+    assert clamp_font_size(3) == 8
+    assert clamp_font_size(200) == 72
+    assert clamp_font_size("18") == 18
+    assert clamp_font_size("bad") == 13
+    assert clamp_font_size(None, 20) == 20
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from ludiglot.ui.audio_controls_presenter import AudioControlsPresenter
+from ludiglot.ui.qt_audio_controls_adapter import QtAudioControlsAdapter
+
+
+class FakeButton:
+    def __init__(self):
+        self.calls = []
+
+    def setEnabled(self, enabled):
+        self.calls.append(("enabled", enabled))
+
+    def set_playing(self, playing):
+        self.calls.append(("playing", playing))
+
+
+class FakeSlider:
+    def __init__(self):
+        self.progress_calls = []
+
+    def setEnabled(self, enabled):
+        self.enabled = enabled
+
+    def set_progress(self, progress, duration_ms):
+        self.progress_calls.append((progress, duration_ms))
+
+    def is_dragging(self):
+        return False
+
+
+class FakeLabel:
+    def __init__(self):
+        self.texts = []
+
+    def setText(self, text):
+        self.texts.append(text)
+
+
+class FakeTimer:
+    def __init__(self):
+        self.calls = []
+
+    def start(self):
+        self.calls.append("start")
+
+    def stop(self):
+        self.calls.append("stop")
+
+
+def test_apply_skips_unchanged_time_text():
+    label = FakeLabel()
+    slider = FakeSlider()
+    adapter = QtAudioControlsAdapter(
+        play_pause_button=FakeButton(),
+        slider=slider,
+        time_label=label,
+        timer=FakeTimer(),
+        status=lambda message: None,
+    )
+    presenter = AudioControlsPresenter()
+
+    adapter.apply(presenter.progress(0.100, 10_000))
+    adapter.apply(presenter.progress(0.105, 10_000))
+    adapter.apply(presenter.progress(0.200, 10_000))
+
+    assert label.texts == ["00:01 / 00:10", "00:02 / 00:10"]
+    assert len(slider.progress_calls) == 3
+
+
+def test_apply_skips_unchanged_control_state():
+    button = FakeButton()
+    timer = FakeTimer()
+    adapter = QtAudioControlsAdapter(
+        play_pause_button=button,
+        slider=FakeSlider(),
+        time_label=FakeLabel(),
+        timer=timer,
+        status=lambda message: None,
+    )
+    presenter = AudioControlsPresenter()
+
+    adapter.apply(presenter.disabled())
+    adapter.apply(presenter.disabled())
+    adapter.apply(presenter.progress(0.1, 10_000))
+    adapter.apply(presenter.progress(0.2, 10_000))
+    adapter.apply(presenter.paused(0.2, 10_000))
+
+    assert button.calls == [
+        ("enabled", False),
+        ("playing", False),
+        ("enabled", True),
+        ("playing", True),
+        ("playing", False),
+    ]
+    assert timer.calls == ["stop", "start", "stop"]
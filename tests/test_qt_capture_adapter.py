@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import types
+
+from PIL import Image
+from PyQt6.QtCore import QRect
+
+from ludiglot.core.capture import CaptureRegion
+from ludiglot.core.selection_geometry import MonitorGeometry
+from ludiglot.ui.qt_capture_adapter import DesktopSnapshot, QtCaptureAdapter, _RawDesktopFrame
+
+
+class FakePixmap:
+    def width(self):
+        return 200
+
+    def height(self):
+        return 50
+
+
+def make_snapshot(image):
+    return DesktopSnapshot(image=image, left=-100, top=50, monitors=[], screen_background=None, screen_source_rects=[])
+
+
+def test_crop_snapshot_crops_selected_region():
+    image = Image.new("RGB", (40, 30), (1, 2, 3))
+    image.putpixel((15, 5), (9, 9, 9))
+    adapter = QtCaptureAdapter(config=None, log=lambda message: None)
+
+    crop = adapter.crop_snapshot(make_snapshot(image), CaptureRegion(left=-90, top=50, width=10, height=8))
+
+    assert crop.size == (10, 8)
+    assert crop.getpixel((5, 5)) == (9, 9, 9)
+    assert crop is not image
+
+
+def test_crop_snapshot_reuses_image_for_full_selection():
+    image = Image.new("RGB", (40, 30))
+    adapter = QtCaptureAdapter(config=None, log=lambda message: None)
+
+    crop = adapter.crop_snapshot(make_snapshot(image), CaptureRegion(left=-120, top=40, width=80, height=60))
+
+    assert crop is image
+
+
+def test_crop_snapshot_decodes_only_region_of_raw_frame():
+    width, height = 6, 4
+    data = bytes(range(width * height * 4))
+    frame = _RawDesktopFrame(data, width, height)
+    adapter = QtCaptureAdapter(config=None, log=lambda message: None)
+    expected = Image.frombytes("RGB", (width, height), data, "raw", "BGRX")
+
+    crop = adapter.crop_snapshot(make_snapshot(frame), CaptureRegion(left=-98, top=51, width=3, height=2))
+    full = adapter.crop_snapshot(make_snapshot(frame), CaptureRegion(left=-100, top=50, width=6, height=4))
+
+    assert crop.tobytes() == expected.crop((2, 1, 5, 3)).tobytes()
+    assert full.tobytes() == expected.tobytes()
+
+
+def test_build_screen_background_shares_one_pixmap_with_source_rects(monkeypatch):
+    from ludiglot.ui import qt_capture_adapter
+
+    monkeypatch.setattr(qt_capture_adapter.QGuiApplication, "screens", staticmethod(lambda: [object()] * 4))
+    adapter = QtCaptureAdapter(config=None, log=lambda message: None)
+    calls = []
+    background = FakePixmap()
+    monkeypatch.setattr(adapter, "_pil_to_pixmap", lambda img: calls.append(img.size) or background)
+    monitors = [
+        MonitorGeometry(-100, 0, 200, 50),
+        MonitorGeometry(-100, 0, 100, 50),
+        MonitorGeometry(-100, 0, 100, 50),
+        MonitorGeometry(0, 0, 100, 50),
+    ]
+
+    pixmap, source_rects = adapter._build_screen_background(Image.new("RGB", (200, 50)), monitors)
+
+    assert pixmap is background
+    assert calls == [(200, 50)]
+    assert source_rects == [QRect(0, 0, 100, 50), QRect(0, 0, 100, 50), QRect(100, 0, 100, 50), QRect(0, 0, 200, 50)]
+
+
+def test_mss_monitors_are_cached_until_screens_change(monkeypatch):
+    opened = []
+
+    class FakeMss:
+        monitors = [{"left": 0, "top": 0, "width": 100, "height": 50}]
+
+        def __enter__(self):
+            opened.append(True)
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    from ludiglot.ui import qt_capture_adapter
+
+    monkeypatch.setattr(qt_capture_adapter, "mss", types.SimpleNamespace(mss=FakeMss))
+    adapter = QtCaptureAdapter(config=None, log=lambda message: None)
+
+    first = adapter._current_mss_monitors()
+    second = adapter._current_mss_monitors()
+    adapter._invalidate_screen_cache()
+    third = adapter._current_mss_monitors()
+
+    assert first == second == third == [MonitorGeometry(0, 0, 100, 50)]
+    assert len(opened) == 2
+
+
+def test_dpr_override_is_parsed_once_per_config_value():
+    config = types.SimpleNamespace(capture_force_dpr="1.5")
+    adapter = QtCaptureAdapter(config=config, log=lambda message: None)
+
+    assert adapter._dpr_override() == 1.5
+    assert adapter._dpr_override() == 1.5
+    config.capture_force_dpr = "bad"
+    assert adapter._dpr_override() is None
+    config.capture_force_dpr = None
+    assert adapter._dpr_override() is None
+    config.capture_force_dpr = 2
+    assert adapter._dpr_override() == 2.0
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from ludiglot.core.display_shaper import DisplayPreferences
+from ludiglot.ui.qt_result_presentation_adapter import QtResultPresentationAdapter
+from ludiglot.ui.result_presentation_controller import CurrentDisplayState
+
+
+class FakeEditor:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str]] = []
+
+    def setHtml(self, html: str) -> None:
+        self.calls.append(("html", html))
+
+    def setPlainText(self, text: str) -> None:
+        self.calls.append(("plain", text))
+
+
+def make_adapter():
+    source, target = FakeEditor(), FakeEditor()
+    adapter = QtResultPresentationAdapter(
+        source_editor=source,
+        target_editor=target,
+        show_single_result=lambda: None,
+        show_multi_result=lambda: None,
+    )
+    return adapter, source, target
+
+
+def test_render_skips_editors_whose_content_is_unchanged():
+    adapter, source, target = make_adapter()
+    state = CurrentDisplayState(source_text="<color=red>Hi</color>", target_text="你好", source_is_html=True)
+    preferences = DisplayPreferences()
+
+    adapter._render_current_state(state, preferences, render_empty=False)
+    adapter._render_current_state(state, preferences, render_empty=False)
+
+    assert [kind for kind, _ in source.calls] == ["html"]
+    assert target.calls == [("plain", "你好")]
+
+    adapter._render_current_state(state, DisplayPreferences(font_size=20), render_empty=False)
+    adapter._render_current_state(CurrentDisplayState(source_text="Bye"), preferences, render_empty=True)
+
+    assert len(source.calls) == 3
+    assert source.calls[-1] == ("plain", "Bye")
+    assert target.calls[-1] == ("plain", "")
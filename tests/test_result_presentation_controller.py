@@ -97,7 +97,7 @@ def make_multi_result():
     }
 
 
-def make_controller(*, config=None, audio=None, view=None, preferences=None):
+def make_controller(*, config=None, audio=None, view=None, preferences=None, perf_trace=False):
     logs = []
     errors = []
     config = config or SimpleNamespace(play_audio=True)
@@ -116,6 +116,7 @@ def make_controller(*, config=None, audio=None, view=None, preferences=None):
         log=logs.append,
         error=errors.append,
         clock=FakeClock(),
+        perf_trace=perf_trace,
     )
     return controller, audio, view, logs, errors
 
@@ -139,7 +140,8 @@ def test_present_single_result_renders_loads_audio_and_autoplays():
     assert state.target_text == "你好"
     assert state.source_is_html is True
     assert view.events[1] == ("activate", False)
-    assert any(line.startswith("[EN]") for line in logs)
+    assert len(logs) == 1
+    assert any(line.startswith("[EN]") for line in logs[0].splitlines())
     assert controller.current_display_state == state
 
 
@@ -204,3 +206,16 @@ def test_present_result_reports_errors_from_view():
     assert errors == ["显示结果失败: view failed"]
     assert any("RuntimeError: view failed" in line for line in logs)
     assert ("play",) not in audio.events
+
+
+def test_perf_probes_are_logged_only_when_tracing():
+    controller, _, _, logs, _ = make_controller()
+    controller.present_result(make_single_result())
+    assert not any(line.startswith(("[PERF]", "[DEBUG]")) for line in logs[0].splitlines())
+
+    controller, _, _, logs, _ = make_controller(perf_trace=True)
+    controller.present_result(make_single_result())
+    lines = logs[0].splitlines()
+    assert lines[0] == "[DEBUG] _show_result called"
+    assert "[PERF] _show_result 开始" in lines
+    assert lines[-1].startswith("[PERF] _show_result 总耗时")
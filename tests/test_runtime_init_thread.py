@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from ludiglot.core.overlay_runtime import OverlayRuntimeCallbacks, OverlayRuntimeInitResult
+from ludiglot.ui import runtime_init_thread
+from ludiglot.ui.runtime_init_thread import RuntimeInitThread
+
+
+def test_run_emits_runtime_init_result(monkeypatch):
+    expected = OverlayRuntimeInitResult(True)
+    calls = []
+    monkeypatch.setattr(
+        runtime_init_thread,
+        "initialize_overlay_runtime",
+        lambda config, engine, callbacks: (calls.append((config, engine, callbacks)), expected)[1],
+    )
+    callbacks = OverlayRuntimeCallbacks()
+    thread = RuntimeInitThread("config", "engine", callbacks)
+    results = []
+    thread.init_finished.connect(results.append)
+
+    thread.run()
+
+    assert calls == [("config", "engine", callbacks)]
+    assert results == [expected]
+
+
+def test_run_reports_unexpected_failure(monkeypatch):
+    def fail(config, engine, callbacks):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(runtime_init_thread, "initialize_overlay_runtime", fail)
+    errors = []
+    thread = RuntimeInitThread("config", "engine", OverlayRuntimeCallbacks(error=errors.append))
+    results = []
+    thread.init_finished.connect(results.append)
+
+    thread.run()
+
+    assert errors == ["运行时资源初始化失败: boom"]
+    assert results[0].success is False
+    assert results[0].error_message == "运行时资源初始化失败: boom"
+
+
+def test_started_thread_still_emits_qthread_finished(monkeypatch):
+    from PyQt6.QtCore import Qt
+
+    expected = OverlayRuntimeInitResult(True)
+    monkeypatch.setattr(runtime_init_thread, "initialize_overlay_runtime", lambda config, engine, callbacks: expected)
+    thread = RuntimeInitThread("config", "engine", OverlayRuntimeCallbacks())
+    results = []
+    ended = []
+    thread.init_finished.connect(results.append, Qt.ConnectionType.DirectConnection)
+    thread.finished.connect(lambda: ended.append(True), Qt.ConnectionType.DirectConnection)
+
+    thread.start()
+    assert thread.wait(5000)
+
+    assert results == [expected]
+    assert ended == [True]
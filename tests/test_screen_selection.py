@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from PyQt6.QtCore import QPoint, QRect
+
+from ludiglot.ui.screen_selection import _normalized_span
+
+
+def test_normalized_span_matches_qrect_normalized():
+    for ox, oy, x, y in [(10, 10, 10, 10), (10, 10, 40, 25), (33, 10, 22, 46), (5, 5, 4, 4), (0, 0, -3, 7)]:
+        expected = QRect(QPoint(ox, oy), QPoint(x, y)).normalized()
+        left, width = _normalized_span(ox, x)
+        top, height = _normalized_span(oy, y)
+
+        assert (left, top, width, height) == (expected.x(), expected.y(), expected.width(), expected.height())
+
+
+def test_selector_records_only_non_empty_regions():
+    from ludiglot.ui.screen_selection import ScreenSelector
+
+    selector = ScreenSelector(None)
+
+    selector._on_region_selected(0, 0, 0, 0)
+    assert selector._selected_rect is None
+    selector._on_region_selected(10, -20, 30, 40)
+    assert selector._selected_rect == QRect(10, -20, 30, 40)
@@ -5,6 +5,7 @@ from ludiglot.core.selection_geometry import (
     ScreenGeometry,
     crop_box_for_snapshot_region,
     expand_region_within_monitor,
+    find_screen_index_for_rect_center,
     map_selection_to_capture_region,
     normalize_monitors_to_image_size,
 )
@@ -90,6 +91,29 @@ def test_snapshot_monitor_mapping_matches_monitor_by_geometry_not_index():
     assert mapping.source == "snapshot-monitor"
 
 
+def test_caller_supplied_screen_index_skips_center_lookup():
+    screens = [
+        ScreenGeometry(index=0, x=0, y=0, width=1920, height=1080, dpr=1.0),
+        ScreenGeometry(index=1, x=1920, y=0, width=1920, height=1080, dpr=2.0),
+    ]
+
+    mapping = map_selection_to_capture_region(Rect(10, 10, 100, 50), screens, screen_index=1, use_monitor_scale=False)
+
+    assert mapping.screen_index == 1
+    assert mapping.scale_x == 2.0
+
+
+def test_center_lookup_uses_half_open_screen_bounds():
+    screens = [
+        ScreenGeometry(index=0, x=0, y=0, width=1920, height=1080),
+        ScreenGeometry(index=1, x=1920, y=0, width=1920, height=1080),
+    ]
+
+    assert find_screen_index_for_rect_center(Rect(1910, 10, 20, 20), screens) == 1
+    assert find_screen_index_for_rect_center(Rect(1900, 10, 20, 20), screens) == 0
+    assert find_screen_index_for_rect_center(Rect(10, 1100, 20, 20), screens, default_index=1) == 1
+
+
 def test_crop_box_for_snapshot_region_clamps_to_image_bounds():
     box = crop_box_for_snapshot_region(
         snapshot_left=-100,
@@ -131,3 +155,9 @@ def test_expand_region_within_monitor_clamps_to_bounds_and_min_size():
     )
 
     assert expanded == CaptureRegion(left=40, top=15, width=200, height=100)
+
+
+def test_expand_region_without_monitor_returns_region_unchanged():
+    region = CaptureRegion(left=100, top=50, width=80, height=30)
+
+    assert expand_region_within_monitor(region, None) is region
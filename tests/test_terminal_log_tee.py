@@ -39,3 +39,17 @@ def test_install_process_log_tee_is_idempotent(monkeypatch, tmp_path):
     assert stdout.getvalue() == "out\n"
     assert stderr.getvalue() == "err\n"
     assert log_path.read_text(encoding="utf-8") == "out\nerr\n"
+
+
+def test_tee_stream_keeps_one_log_handle_open(tmp_path):
+    from ludiglot.infrastructure import terminal_log_tee
+
+    log_path = tmp_path / "logs" / "gui.log"
+    stream = _TeeStream(io.StringIO(), log_path)
+
+    stream.write("first\n")
+    handle = terminal_log_tee._LOG_FILES[log_path]
+    stream.write("second\n")
+
+    assert terminal_log_tee._LOG_FILES[log_path] is handle
+    assert log_path.read_text(encoding="utf-8") == "first\nsecond\n"
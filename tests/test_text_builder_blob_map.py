@@ -142,3 +142,14 @@ def test_prefixed_item_name_can_match_exact_ngram() -> None:
 
     assert result is not None
     assert (result.get("matches") or [{}])[0].get("text_key") == "ITEM_TEST"
+
+
+def test_load_text_db_round_trips_saved_db(tmp_path: Path, monkeypatch) -> None:
+    db = {"stop right there": {"key": "stop right there", "matches": [{"official_cn": "站住！"}]}}
+    db_path = tmp_path / "game_text_db.json"
+    text_builder.save_text_db(db, db_path)
+
+    assert text_builder.load_text_db(db_path) == db
+
+    monkeypatch.setattr(text_builder, "_orjson", None)
+    assert text_builder.load_text_db(db_path) == db
@@ -1,6 +1,16 @@
 from __future__ import annotations
 
-from ludiglot.core.matcher import TextMatcher
+import pytest
+
+from ludiglot.core.matcher import (
+    TextMatcher,
+    _classify_chars,
+    _digit_count,
+    _is_time_format,
+    _join_multi_fields,
+    _length_weighted_score,
+)
+from ludiglot.core.smart_match import build_smart_candidates
 from ludiglot.core.text_builder import build_text_db_from_maps, normalize_en
 
 
@@ -141,3 +151,228 @@ def test_text_matcher_prioritizes_preferred_rover_gender() -> None:
 
     assert result is not None
     assert (result.get("matches") or [{}])[0].get("text_key") == "MAIN_ROVER_F"
+
+
+def test_clean_ocr_line_strips_noise_and_line_breaks() -> None:
+    matcher = TextMatcher({})
+
+    assert matcher._clean_ocr_line("Crit_DMG&lt;br&gt;+12%  ◆ Bonus<br/>") == "Crit DMG 12 Bonus"
+    assert matcher._clean_ocr_line("暴击伤害·提升") == "暴击伤害 提升"
+
+
+def test_resolve_title_cn_memoizes_raw_titles() -> None:
+    db = build_text_db_from_maps(
+        {"RoleInfo_Lynae_Name": "Lynae"},
+        {"RoleInfo_Lynae_Name": "琳奈"},
+        "test.json",
+    )
+    matcher = TextMatcher(db)
+    calls = []
+    search_key = matcher.search_key
+    matcher.search_key = lambda key: (calls.append(key), search_key(key))[1]
+
+    assert matcher.resolve_title_cn("Lynae") == "琳奈"
+    assert matcher.resolve_title_cn("Lynae") == "琳奈"
+    assert matcher.resolve_title_cn("LYNAE:") == "琳奈"
+    assert calls == ["lynae"]
+
+
+def test_smart_candidates_dedupe_by_text_keeping_highest_confidence() -> None:
+    result = build_smart_candidates([("HP", 0.90), ("ATK", 0.94), ("hp", 0.99)])
+
+    assert result["strategy"] == "list"
+    assert result["candidates"] == [("hp", 0.99), ("ATK", 0.94)]
+
+
+def test_smart_candidates_add_windows_only_for_long_text() -> None:
+    short = build_smart_candidates([("Echo Set", 0.9), ("Bonus Effect", 0.9)])
+    long_lines = [("one two three four five six", 0.9), ("seven eight nine ten eleven twelve", 0.9)]
+    long = build_smart_candidates(long_lines)
+
+    assert [c for c in short["candidates"] if c[1] == 0.8] == []
+    assert ("one two three four five six seven eight nine ten", 0.8) in long["candidates"]
+
+
+def test_smart_candidates_split_short_sentences() -> None:
+    result = build_smart_candidates([("Hi. Go home", 0.9)])
+
+    assert ("Go home", 0.9 * 0.98) in result["candidates"]
+
+
+def test_digit_count_matches_isdigit_for_ascii_and_unicode():
+    for text in ("", "abc", "Lv 90", "12:30", "ＬＶ９０", "x²"):
+        assert _digit_count(text) == sum(ch.isdigit() for ch in text)
+
+
+def test_is_time_format_accepts_only_digit_unit_groups():
+    for text in ("2d", "2D 5h", " 10h  30m ", "1d 2h 3m 4s", "2d "):
+        assert _is_time_format(text) is True
+    for text in ("", "d", "2", "2d5h", "2 d", "2d h", "2x", "Day 2"):
+        assert _is_time_format(text) is False
+
+
+def test_classify_chars_counts_length_digits_and_specials():
+    assert _classify_chars("Lv.90 up-to") == (11, 2, 1)
+    assert _classify_chars("等级：９０") == (5, 2, 1)
+
+
+def test_lookup_best_searches_each_key_once_per_call(monkeypatch) -> None:
+    db = build_text_db_from_maps(
+        {"SET_BONUS": "Echo Set Bonus", "REGEN": "Energy Regen"},
+        {"SET_BONUS": "声骸套装效果", "REGEN": "共鸣效率"},
+        "test.json",
+    )
+    matcher = TextMatcher(db)
+    searched: list[str] = []
+    original = matcher.search_key
+
+    def counting_search(key):
+        searched.append(key)
+        return original(key)
+
+    monkeypatch.setattr(matcher, "search_key", counting_search)
+
+    matcher.match([("Echo Set", 0.9), ("Bonus xx", 0.9)])
+
+    assert "echoset" in searched
+    assert len(searched) == len(set(searched))
+
+
+def test_search_key_skips_fuzzy_for_very_short_keys(monkeypatch) -> None:
+    db = build_text_db_from_maps({"ITEM_ATK": "ATK", "ITEM_ATKS": "ATKs"}, {"ITEM_ATK": "攻击", "ITEM_ATKS": "攻击们"}, "test.json")
+    matcher = TextMatcher(db)
+
+    def fail_fuzzy(*args, **kwargs):
+        raise AssertionError("fuzzy search should be skipped")
+
+    monkeypatch.setattr(matcher.indexed_searcher, "fuzzy_search", fail_fuzzy)
+
+    assert matcher.search_key("atk")[1] == 1.0
+    assert matcher.search_key("atq") == ({}, 0.0)
+
+
+def test_search_keys_matches_individual_search_key() -> None:
+    db = build_text_db_from_maps(
+        {"SET_BONUS": "Echo Set Bonus", "REGEN": "Energy Regen", "FIELD": "Resonance field expands outward"},
+        {"SET_BONUS": "声骸套装效果", "REGEN": "共鸣效率", "FIELD": "共鸣场向外扩张"},
+        "test.json",
+    )
+    keys = ["echosetbonus", "energyregn", "resonancefieldexpandsoutwards", "atq", "nothingalike", "echosetbonus"]
+
+    expected = [TextMatcher(db).search_key(k) for k in keys]
+
+    assert TextMatcher(db).search_keys(keys) == expected
+
+
+def test_length_weighted_score_applies_one_length_penalty() -> None:
+    base, flagged = _length_weighted_score(0.9, 40, 8, 0)
+    assert base == pytest.approx(0.9 * (0.6 + 0.2 * 0.4 + 0.2))
+    assert flagged is False
+
+    assert _length_weighted_score(0.9, 40, 8, 10) == (pytest.approx(base * 0.4), True)
+    assert _length_weighted_score(0.9, 40, 8, 22)[0] == pytest.approx(base * 0.6)
+    assert _length_weighted_score(0.9, 40, 8, 38)[0] == pytest.approx(base)
+
+
+def test_join_multi_fields_skips_empty_parts() -> None:
+    items = [
+        {"ocr": "Echo Set", "query_key": "echoset", "official_en": "Echo Set Bonus", "official_cn": "声骸套装"},
+        {"ocr": "Regen", "query_key": "regen", "official_en": "", "official_cn": None},
+        {"ocr": "", "query_key": "", "official_en": None, "official_cn": "共鸣"},
+    ]
+
+    assert _join_multi_fields(items) == {
+        "_official_en": "Echo Set Bonus / Regen",
+        "_official_cn": "声骸套装 / 共鸣",
+        "_query_key": "echoset / regen",
+        "_ocr_text": "Echo Set / Regen",
+    }
+
+
+def test_match_emits_buffered_log_once() -> None:
+    db = build_text_db_from_maps(
+        {"SET_BONUS": "Echo Set Bonus", "REGEN": "Energy Regen"},
+        {"SET_BONUS": "声骸套装效果", "REGEN": "共鸣效率"},
+        "test.json",
+    )
+    matcher = TextMatcher(db)
+    emitted: list[str] = []
+    matcher.set_logger(emitted.append)
+
+    matcher.match([("Echo Set", 0.9), ("Bonus xx", 0.9)])
+
+    assert len(emitted) == 1
+    assert emitted[0].count("\n") >= 1
+    matcher.log("[TEST] direct")
+    assert emitted[-1] == "[TEST] direct"
+
+
+def test_search_key_reuses_cached_hit_across_calls(monkeypatch) -> None:
+    db = build_text_db_from_maps(
+        {"SET_BONUS": "Echo Set Bonus", "REGEN": "Energy Regen"},
+        {"SET_BONUS": "声骸套装效果", "REGEN": "共鸣效率"},
+        "test.json",
+    )
+    matcher = TextMatcher(db)
+    first = matcher.search_key("echosetbonux")
+    missing = matcher.search_key("zzzzzzzzzzzz")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cached keys should not hit the index")
+
+    monkeypatch.setattr(matcher.indexed_searcher, "exact_match", fail)
+
+    again = matcher.search_key("echosetbonux")
+    assert again == first
+    assert again is not first
+    assert matcher.search_key("zzzzzzzzzzzz") == missing
+    assert matcher.search_keys(["echosetbonux"]) == [first]
+
+
+def test_smart_candidates_after_early_exit_are_not_searched(monkeypatch) -> None:
+    from ludiglot.core import matcher as matcher_module
+
+    confident = "The wind carries every promise we ever made across the quiet sea."
+    db = {
+        normalize_en(confident): _db_entry("MAIN_WIND_001", confident, audio_hash=1),
+        normalize_en("Tomorrow the harbor lights will guide the lost ships safely home."): _db_entry(
+            "MAIN_HARBOR_001", "Tomorrow the harbor lights will guide the lost ships safely home."
+        ),
+    }
+    skipped = "Tomorrow the harbor lights will guide the lost ships"
+    monkeypatch.setattr(
+        matcher_module,
+        "build_smart_candidates",
+        lambda lines: {"candidates": [(confident, 0.9), (skipped, 0.8)], "strategy": "long"},
+    )
+    matcher = TextMatcher(db)
+    logs = []
+    matcher.set_logger(logs.append)
+    searched = []
+    search_without_fuzzy = matcher._search_without_fuzzy
+    monkeypatch.setattr(matcher, "_search_without_fuzzy", lambda key: (searched.append(key), search_without_fuzzy(key))[1])
+
+    result = matcher.match([("Wind carries promise qq", 0.9)])
+
+    assert result is not None
+    assert result["matches"][0]["text_key"] == "MAIN_WIND_001"
+    assert any("早期退出" in block for block in logs)
+    assert normalize_en(skipped) not in searched
+    assert normalize_en(skipped) not in matcher._search_cache
+
+
+def test_smart_candidate_dedup_keeps_highest_confidence_pair(monkeypatch) -> None:
+    from ludiglot.core import smart_match
+
+    monkeypatch.setattr(
+        smart_match,
+        "_build_smart_candidates_raw",
+        lambda lines, clean_func, normalize_func: {
+            "strategy": "list",
+            "candidates": [("Stand Still", 0.6), ("...", 0.5), ("stand still", 0.9), ("Listen", 0.7)],
+        },
+    )
+
+    candidates = build_smart_candidates([("ignored", 1.0)])["candidates"]
+
+    assert candidates == [("stand still", 0.9), ("Listen", 0.7), ("...", 0.5)]
@@ -84,3 +84,18 @@ def test_load_or_build_ignores_corrupt_cache(tmp_path: Path) -> None:
     index.load_or_build()
 
     assert index.names == ["play_vo_corrupt_cache_rebuild"]
+
+
+def test_batched_ratios_match_per_candidate_scoring(tmp_path: Path, monkeypatch) -> None:
+    from ludiglot.core import voice_event_index as module
+
+    names = ["play_vo_main_alpha", "play_vo_main_beta", "vo_side_alpha_loop", "ui_click"]
+    index = VoiceEventIndex(bnk_root=None, txtp_root=None, cache_path=tmp_path / "idx.json", extra_names=names)
+    index.load_or_build()
+
+    batched = index.find_candidates("Main_Alpha", "vo_alpha", limit=4, min_score=0.3)
+    monkeypatch.setattr(module, "_EXTRACT", None)
+    per_candidate = index.find_candidates("Main_Alpha", "vo_alpha", limit=4, min_score=0.3)
+
+    assert batched == per_candidate
+    assert batched[0] == "play_vo_main_alpha"